@@ -0,0 +1,159 @@
+# app/admission.py
+"""Admission control for the booking and management routes.
+
+During a ticket drop every worker would otherwise pile onto
+/events/register, exhaust the connection pool and time out unrelated
+routes (browsing included). Routes opt in with
+
+    @router.post("/register/{event_id}", dependencies=[Depends(admission("register", per_event=True))])
+
+and then, before the handler or its database session does anything, the
+request must pass, in order:
+
+1. a per-user token bucket (RATE_LIMIT_PER_SECOND / RATE_LIMIT_BURST,
+   keyed by the token subject, or the client address without a valid
+   token) -> 429 with Retry-After;
+2. the route's concurrency limit (ADMISSION_ROUTE_CONCURRENCY[name]) -> 503;
+3. for per_event routes, the per-event concurrency limit
+   (ADMISSION_EVENT_CONCURRENCY) -> 503.
+
+Rejections cost a dict lookup and never touch the database. Limits are per
+process; keep the sum of the route limits below DB_POOL_SIZE +
+DB_MAX_OVERFLOW so read traffic always finds a connection.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+from fastapi import HTTPException, Request, status
+
+from app import metrics
+from app.auth.deps import token_subject
+from app.config import LazyInstance, settings
+
+RETRY_AFTER_SECONDS = 1
+
+rejections = metrics.registry.counter(
+    "admission_rejections_total", "Requests turned away by admission control.", ("route", "reason"))
+
+
+class ConcurrencyLimiter:
+    """Non-blocking counting semaphores, one per key, created on demand."""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: Hashable, limit: int) -> bool:
+        with self._lock:
+            n = self._in_flight.get(key, 0)
+            if n >= limit:
+                return False
+            self._in_flight[key] = n + 1
+            return True
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            n = self._in_flight.get(key, 0) - 1
+            if n > 0:
+                self._in_flight[key] = n
+            else:
+                self._in_flight.pop(key, None)  # idle keys (events) don't accumulate
+
+    def in_flight(self, key: Hashable) -> int:
+        return self._in_flight.get(key, 0)
+
+
+class TokenBuckets:
+    """One token bucket per client: `rate` tokens per second, up to `burst`.
+    Least recently seen clients are forgotten beyond `maxsize` (a forgotten
+    client simply starts again with a full bucket)."""
+
+    def __init__(self, rate: float, burst: int, maxsize: int = 100000):
+        self.rate = rate
+        self.burst = burst
+        self.maxsize = maxsize
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str) -> float:
+        """0.0 if a token was taken, else the seconds until one is available."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+                while len(self._buckets) > self.maxsize:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return (1.0 - bucket[0]) / self.rate
+
+
+limiter = ConcurrencyLimiter()
+buckets = LazyInstance(lambda: TokenBuckets(settings.RATE_LIMIT_PER_SECOND, settings.RATE_LIMIT_BURST))
+
+
+def client_key(request: Request) -> str:
+    """The token subject, or the client address when there is no valid token
+    (the auth dependency rejects those requests right after)."""
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            return token_subject(token)
+        except HTTPException:
+            pass
+    return "addr:" + (request.client.host if request.client else "unknown")
+
+
+def _reject(name: str, reason: str, status_code: int, detail: str, retry_after: float) -> HTTPException:
+    rejections.inc(1, name, reason)
+    return HTTPException(
+        status_code=status_code,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def admission(name: str, per_event: bool = False):
+    """Route dependency enforcing the limits above for the route group `name`."""
+
+    async def admit(request: Request):
+        if not settings.ADMISSION_ENABLED:
+            yield
+            return
+        if buckets.rate > 0:
+            wait = buckets.take(client_key(request))
+            if wait:
+                raise _reject(name, "rate_limited", status.HTTP_429_TOO_MANY_REQUESTS,
+                              "Too many requests, please slow down", wait)
+
+        acquired = []
+        try:
+            route_limit = settings.ADMISSION_ROUTE_CONCURRENCY.get(name, 0)
+            if route_limit > 0:
+                if not limiter.try_acquire(("route", name), route_limit):
+                    raise _reject(name, "route_busy", status.HTTP_503_SERVICE_UNAVAILABLE,
+                                  "Server is busy, please retry", RETRY_AFTER_SECONDS)
+                acquired.append(("route", name))
+            event_id = request.path_params.get("event_id")
+            if per_event and event_id is not None and settings.ADMISSION_EVENT_CONCURRENCY > 0:
+                if not limiter.try_acquire(("event", event_id), settings.ADMISSION_EVENT_CONCURRENCY):
+                    raise _reject(name, "event_busy", status.HTTP_503_SERVICE_UNAVAILABLE,
+                                  "This event is in high demand, please retry", RETRY_AFTER_SECONDS)
+                acquired.append(("event", event_id))
+            yield
+        finally:
+            for key in acquired:
+                limiter.release(key)
+
+    admit.__name__ = f"admission_{name}"
+    return admit
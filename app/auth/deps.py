@@ -1,14 +1,18 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
 from app.models.user import User
 from app.config import settings
+from app.auth.principal_cache import Principal, principal_cache
+from app.auth.security import normalize_email
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+def token_subject(token: str) -> str:
+    """Normalized email from a valid access token; 401 otherwise."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
@@ -21,33 +25,63 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+    return normalize_email(email)
+
 
-    # ✅ case-insensitive and trimmed email check
-    user = db.query(User).filter(User.email.ilike(email.strip())).first()
+def _cache_principal(key: str, user) -> Principal:
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.put(key, principal)
+    return principal
 
 
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    key = token_subject(token)
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
 
-def require_organizer(current_user: User = Depends(get_current_user)):
-    role_value = current_user.role.value if hasattr(current_user.role, "value") else current_user.role
-    if role_value != "organizer":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Organizer privileges required",
-        )
-    return current_user
+    # ✅ emails are stored normalized, so this is an equality match on the unique index
+    user = db.query(User).filter(User.email == key).first()
+    return _cache_principal(key, user)
+
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db=Depends(get_async_db)):
+    key = token_subject(token)
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
 
+    user = (await db.execute(select(User).where(User.email == key))).scalars().first()
+    return _cache_principal(key, user)
 
-def require_participant(current_user: User = Depends(get_current_user)):
+
+
+def _require_role(current_user: Principal, role: str, detail: str) -> Principal:
     role_value = current_user.role.value if hasattr(current_user.role, "value") else current_user.role
-    if role_value != "participant":
+    if role_value != role:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Participant privileges required",
+            detail=detail,
         )
     return current_user
+
+
+def require_organizer(current_user: Principal = Depends(get_current_user)):
+    return _require_role(current_user, "organizer", "Organizer privileges required")
+
+
+def require_participant(current_user: Principal = Depends(get_current_user)):
+    return _require_role(current_user, "participant", "Participant privileges required")
+
+
+async def require_organizer_async(current_user: Principal = Depends(get_current_user_async)):
+    return _require_role(current_user, "organizer", "Organizer privileges required")
+
+
+async def require_participant_async(current_user: Principal = Depends(get_current_user_async)):
+    return _require_role(current_user, "participant", "Participant privileges required")
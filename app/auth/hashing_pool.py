@@ -0,0 +1,84 @@
+# app/auth/hashing_pool.py
+"""Bounded process pool for password hashing and verification.
+
+pbkdf2 is CPU-bound and holds the GIL, so running it inline in signup/login
+stalls every other request on the worker during a login storm. Here it runs
+in PASSWORD_HASH_WORKERS separate processes. At most
+PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_LIMIT calls may be in flight;
+beyond that callers get an immediate 503 instead of queueing without bound.
+"""
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.config import LazyInstance, settings
+
+RETRY_AFTER_SECONDS = 1
+
+
+class PasswordHasherPool:
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + max(queue_limit, 0))
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn, not fork: the parent has DB pools and worker threads
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many logins in progress, please retry",
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+
+    def submit(self, fn, *args) -> Future:
+        self._acquire()
+        try:
+            future = self.executor.submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args):
+        """Blocking call for sync handlers (the threadpool thread waits without holding the GIL)."""
+        if self.workers <= 0:
+            self._acquire()
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn, *args):
+        if self.workers <= 0:
+            # inline hashing still must not block the event loop
+            return await asyncio.to_thread(self.run, fn, *args)
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_pool = LazyInstance(lambda: PasswordHasherPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_LIMIT))
@@ -0,0 +1,101 @@
+# app/auth/principal_cache.py
+"""In-process cache of authenticated principals, keyed by the token subject.
+
+get_current_user runs on every authenticated request; with this cache the
+common path is a JWT decode plus a dict lookup, no database round trip.
+Entries expire after PRINCIPAL_CACHE_TTL_SECONDS and are dropped as soon as
+the user row is updated or deleted through the ORM.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.auth.security import normalize_email
+from app.config import LazyInstance, settings
+from app.models.user import Role, User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Detached snapshot of the fields handlers read from the current user."""
+    id: int
+    name: str
+    email: str
+    role: Role
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, name=user.name, email=user.email, role=Role(user.role))
+
+
+class PrincipalCache:
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Principal]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            principal, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return principal
+
+    def put(self, key: str, principal: Principal) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (principal, time.monotonic() + self.ttl_seconds)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+principal_cache = LazyInstance(lambda: PrincipalCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS))
+
+
+def _changed_keys(user: User) -> set:
+    keys = {normalize_email(user.email)} if user.email else set()
+    # an email change must also drop the entry cached under the old address
+    keys.update(normalize_email(e) for e in inspect(user).attrs.email.history.deleted if e)
+    return keys
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    keys = _changed_keys(target)
+    for key in keys:
+        principal_cache.invalidate(key)
+    # drop again once committed, in case a concurrent request re-cached the old row meanwhile
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault("principal_invalidations", set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for key in session.info.pop("principal_invalidations", ()):
+        principal_cache.invalidate(key)
@@ -3,7 +3,8 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.user import User
 from fastapi.security import OAuth2PasswordRequestForm
-from app.auth.security import hash_password, verify_password, create_access_token
+from app.auth.security import hash_password, verify_and_update, create_access_token, normalize_email
+from app.auth.hashing_pool import password_pool
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -17,14 +18,15 @@ class SignupPayload(BaseModel):
 
 @router.post("/signup", status_code=201)
 def signup(payload: SignupPayload, db: Session = Depends(get_db)):
-    existing_user = db.query(User).filter(User.email == payload.email).first()
+    email = normalize_email(payload.email)
+    existing_user = db.query(User).filter(User.email == email).first()
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_pw = hash_password(payload.password)
+    hashed_pw = password_pool.run(hash_password, payload.password)
     user = User(
         name=payload.name,
-        email=payload.email,
+        email=email,
         password_hash=hashed_pw,
         role=payload.role
     )
@@ -38,10 +40,17 @@ def signup(payload: SignupPayload, db: Session = Depends(get_db)):
 # ---------- LOGIN ----------
 @router.post("/token")
 def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = db.query(User).filter(User.email == normalize_email(form_data.username)).first()
 
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    valid, new_hash = password_pool.run(verify_and_update, form_data.password, user.password_hash)
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    if new_hash:
+        # stored hash uses outdated parameters; upgrade it now that we know the password
+        user.password_hash = new_hash
+        db.commit()
     token = create_access_token(data={"sub": user.email, "role": user.role.value})
 
     return {
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from app.db.session import get_async_db
+from app.models.user import User
+from app.auth.routes import SignupPayload
+from app.auth.security import hash_password, verify_and_update, create_access_token, normalize_email
+from app.auth.hashing_pool import password_pool
+
+# Async versions of app.auth.routes (DB_MODE=async)
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+@router.post("/signup", status_code=201)
+async def signup(payload: SignupPayload, db=Depends(get_async_db)):
+    email = normalize_email(payload.email)
+    existing_user = (await db.execute(select(User.id).where(User.email == email))).first()
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    # hashing is CPU-bound; keep it off the event loop
+    hashed_pw = await password_pool.run_async(hash_password, payload.password)
+    user = User(
+        name=payload.name,
+        email=email,
+        password_hash=hashed_pw,
+        role=payload.role
+    )
+    db.add(user)
+    await db.commit()
+    return {"message": "User created successfully"}
+
+
+
+# ---------- LOGIN ----------
+@router.post("/token")
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db=Depends(get_async_db)):
+    user = (await db.execute(
+        select(User).where(User.email == normalize_email(form_data.username))
+    )).scalars().first()
+
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    valid, new_hash = await password_pool.run_async(verify_and_update, form_data.password, user.password_hash)
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    token = create_access_token(data={"sub": user.email, "role": user.role.value})
+    role = user.role.value
+    if new_hash:
+        # read everything above first: the commit expires `user`
+        user.password_hash = new_hash
+        await db.commit()
+
+    return {
+        "access_token": token,
+        "token_type": "bearer",
+        "role": role
+    }
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from jose import jwt, JWTError
 from passlib.context import CryptContext
@@ -8,8 +8,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-# password hashing
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# password hashing; hashes below the minimum rounds are re-hashed on the next login
+PBKDF2_ROUNDS = int(os.getenv("PBKDF2_ROUNDS", "29000"))
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=PBKDF2_ROUNDS,
+    pbkdf2_sha256__min_rounds=PBKDF2_ROUNDS,
+)
 
 
 # token config from .env
@@ -17,6 +23,10 @@ SECRET_KEY = os.getenv("SECRET_KEY", "dev_secret_key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "120"))
 
+def normalize_email(email: str) -> str:
+    """Canonical form used for storage and lookups, so an indexed equality match works."""
+    return email.strip().lower()
+
 def hash_password(password: str) -> str:
     if len(password) > 72:
         password = password[:72]
@@ -27,6 +37,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         plain_password = plain_password[:72]
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify, and return a fresh hash when the stored one uses outdated settings."""
+    if len(plain_password) > 72:
+        plain_password = plain_password[:72]
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
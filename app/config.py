@@ -1,13 +1,152 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
-    SECRET_KEY: str
-    ALGORITHM: str
-    DATABASE_URL: str
-    ACCESS_TOKEN_EXPIRE_MINUTES: int  # ✅ added this line
-    SENDGRID_API_KEY: str
-    FROM_EMAIL: str
+    # Required to serve requests, but optional here so that importing the app
+    # (tests, migrations, tooling) works without a full environment; the
+    # lifespan hook refuses to start while any of them is missing().
+    SECRET_KEY: Optional[str] = None
+    ALGORITHM: str = "HS256"
+    DATABASE_URL: Optional[str] = None
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 120  # ✅ added this line
+    SENDGRID_API_KEY: Optional[str] = None
+    FROM_EMAIL: Optional[str] = None
+
+    # create missing tables at startup instead of running `alembic upgrade head` (development only)
+    DB_AUTO_CREATE: bool = False
+
+    # "sync" (threadpool + sync engine) or "async" (AsyncSession + async handlers)
+    DB_MODE: str = "sync"
+
+    # connection pool, per engine and per process
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # below MySQL's wait_timeout
+    DB_POOL_PRE_PING: bool = True  # a round trip per checkout; recycle alone is often enough
+    # comma-separated read replica URLs for list/get/my-registrations (empty = primary only)
+    DB_REPLICA_URLS: str = ""
+
+    # email delivery: "sendgrid", "file" (EMAIL_FILE_PATH) or "memory"
+    EMAIL_TRANSPORT: str = "sendgrid"
+    EMAIL_FILE_PATH: str = "outbox_emails.jsonl"
+    OUTBOX_WORKERS: int = 2  # 0 disables the in-process workers
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_SECONDS: float = 5.0
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_BACKOFF_SECONDS: float = 10.0
+
+    # authenticated principals cached in-process by token subject
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0
+
+    # password hashing runs in a process pool; 0 workers hashes inline
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32  # extra calls waiting for a worker before answering 503
+
+    # 24h reminder job; 0 disables the in-process scheduler
+    REMINDER_INTERVAL_SECONDS: float = 60.0
+
+    # archival of completed events into events_archive / registrations_archive
+    # (app.services.archive); interval 0 disables the in-process scheduler
+    ARCHIVE_INTERVAL_SECONDS: float = 3600.0
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_CHUNK_SIZE: int = 500
+
+    # /events/{id}/seats/stream: messages per second per event, and DB re-read interval (0 = off)
+    SEAT_UPDATES_MAX_PER_SECOND: float = 2.0
+    SEAT_UPDATES_RESYNC_SECONDS: float = 5.0
+
+    # admission control (app.admission), per process: concurrent requests per route group
+    # (0 or missing = unlimited) and per event on the booking routes, and a per-user
+    # token bucket across all guarded routes (RATE_LIMIT_PER_SECOND 0 = off)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_ROUTE_CONCURRENCY: Dict[str, int] = {
+        "register": 12, "register_bulk": 2, "cancel": 4, "waitlist": 4, "manage": 2, "export": 2, "import": 1,
+    }
+    ADMISSION_EVENT_CONCURRENCY: int = 4
+    RATE_LIMIT_PER_SECOND: float = 2.0
+    RATE_LIMIT_BURST: int = 10
+
+    # Idempotency-Key outcomes: "memory" (per-process LRU) or "db" (idempotency_keys table + LRU)
+    IDEMPOTENCY_STORE: str = "memory"
+    IDEMPOTENCY_CACHE_SIZE: int = 10000
+    IDEMPOTENCY_TTL_SECONDS: float = 86400.0
+
+    # rendered /events/list pages kept per process, keyed by ETag (0 disables)
+    LIST_PAGE_CACHE_SIZE: int = 128
+
+    # /events/search: "auto" (MySQL FULLTEXT on MySQL, in-process index elsewhere), "fulltext" or "index"
+    SEARCH_BACKEND: str = "auto"
+    SEARCH_INDEX_REFRESH_SECONDS: float = 300.0  # full rebuild of the in-process index (0 = never)
+
+    # level of the root logger set up at startup; ignored when logging is already configured
+    # (e.g. uvicorn --log-config)
+    LOG_LEVEL: str = "INFO"
+
+    # dev mode: warn when a request runs more SQL statements than this (0 = off)
+    QUERY_COUNT_WARN_THRESHOLD: int = 0
+
     class Config:
         env_file = ".env"
 
-settings = Settings()
+    def missing(self) -> List[str]:
+        """Names of the required settings that are not set."""
+        required = ["SECRET_KEY", "DATABASE_URL"]
+        if self.EMAIL_TRANSPORT == "sendgrid":
+            required += ["SENDGRID_API_KEY", "FROM_EMAIL"]
+        return [name for name in required if not getattr(self, name)]
+
+
+class LazySettings:
+    """Reads the environment / .env on first attribute access, not at import."""
+
+    def __init__(self):
+        self._settings: Optional[Settings] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Settings:
+        if self._settings is None:
+            with self._lock:
+                if self._settings is None:
+                    self._settings = Settings()
+        return self._settings
+
+    def reload(self) -> None:
+        """Forget the loaded values; the next access reads the environment again."""
+        self._settings = None
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+
+settings = LazySettings()
+
+
+class LazyInstance:
+    """Module-level singleton built by `factory` on first attribute access, so
+    whatever it reads from settings is read on first use, not at import."""
+
+    def __init__(self, factory: Callable[[], object]):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def reload(self) -> None:
+        """Drop the instance; the next access builds a new one from the current settings."""
+        self._instance = None
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
@@ -0,0 +1,90 @@
+# app/db/query_counter.py
+"""Count SQL statements per request (or per block of code) to catch N+1 patterns.
+
+    with count_queries() as counter:
+        client.get("/events/my/registrations", headers=auth)
+    assert counter.count <= 3
+
+or, in a test, ``with assert_max_queries(3): ...``.
+
+Counters nest: a statement counts towards every open counter, so the
+per-request counter of app.metrics does not hide queries from an outer
+test counter. This is the only cursor listener that counts or times queries.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    def __init__(self, record: bool = False, parent: Optional["QueryCounter"] = None):
+        self.count = 0
+        self.seconds = 0.0  # time spent executing the counted statements
+        self.record = record
+        self.statements: List[str] = []
+        self.parent = parent
+
+
+_current: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+def current_counter() -> Optional[QueryCounter]:
+    """The innermost open counter of this context, if any."""
+    return _current.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _query_started(conn, cursor, statement, parameters, context, executemany):
+    counter = _current.get()
+    if counter is None:
+        return
+    conn.info.setdefault("query_counter_start", []).append(time.perf_counter())
+    while counter is not None:
+        counter.count += 1
+        if counter.record:
+            counter.statements.append(statement)
+        counter = counter.parent
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _query_finished(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_counter_start")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    counter = _current.get()
+    while counter is not None:
+        counter.seconds += elapsed
+        counter = counter.parent
+
+
+@event.listens_for(Engine, "handle_error")
+def _query_failed(context):
+    # after_cursor_execute does not fire for failed statements
+    conn = context.connection
+    if conn is not None and conn.info.get("query_counter_start"):
+        conn.info["query_counter_start"].pop()
+
+
+@contextmanager
+def count_queries(record: bool = False):
+    counter = QueryCounter(record=record, parent=_current.get())
+    token = _current.set(counter)
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Test helper: fail if the block runs more than `limit` statements."""
+    with count_queries(record=True) as counter:
+        yield counter
+    if counter.count > limit:
+        listing = "\n".join(counter.statements)
+        raise AssertionError(f"Expected at most {limit} queries, got {counter.count}:\n{listing}")
@@ -1,15 +1,99 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+import itertools
 import os
+import threading
 from dotenv import load_dotenv
+from app.config import settings
+from app.metrics import InstrumentedQueuePool, watch_pool
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+def database_url() -> str:
+    url = settings.DATABASE_URL or os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL is not set")
+    return url
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def replica_urls() -> list:
+    """Optional read replicas, comma separated; empty means every read goes to the primary."""
+    return [u.strip() for u in settings.DB_REPLICA_URLS.split(",") if u.strip()]
+
+
+def pool_options() -> dict:
+    """create_engine() pool arguments from settings (shared by every engine)."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def enforce_foreign_keys(engine):
+    """SQLite ignores foreign keys, ON DELETE CASCADE included, unless every
+    connection turns them on. Deletes rely on the cascade (passive_deletes)."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if sync_engine.dialect.name == "sqlite":
+        @event.listens_for(sync_engine, "connect")
+        def _foreign_keys_on(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    return engine
+
+
+class RoutingSession(Session):
+    """Session that sends its statements to the replica stored in
+    info["replica"] (see get_read_db), and everything else to its bind.
+    Flushes always go to the bind, i.e. the primary."""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica")
+        if replica is not None and not self._flushing:
+            return replica
+        if self.bind is None:
+            return get_engine()
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+# Engines are created on first use, not at import: importing the app must not
+# need a database URL, a driver import or any connection.
+_engine = None
+_replica_engines = []
+_next_replica = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    global _engine, _replica_engines, _next_replica
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                replicas = [enforce_foreign_keys(create_engine(url, poolclass=InstrumentedQueuePool, **pool_options()))
+                            for url in replica_urls()]
+                for i, e in enumerate(replicas):
+                    watch_pool(f"replica{i}", e.pool)
+                _replica_engines = replicas
+                _next_replica = itertools.cycle(replicas) if replicas else None
+                primary = enforce_foreign_keys(create_engine(database_url(), poolclass=InstrumentedQueuePool, **pool_options()))
+                watch_pool("primary", primary.pool)
+                _engine = primary
+    return _engine
+
+def __getattr__(name):
+    # `from app.db.session import engine` keeps working, lazily
+    if name == "engine":
+        return get_engine()
+    if name == "replica_engines":
+        get_engine()
+        return _replica_engines
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# unbound: RoutingSession.get_bind() falls back to get_engine()
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=RoutingSession)
 
 Base = declarative_base()
 def get_db():
@@ -17,4 +101,92 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db():
+    """Session for read-only endpoints: one replica per request (round robin),
+    or the primary when no replicas are configured. Replicas may lag, so
+    never use it for anything that must see the caller's own latest write."""
+    get_engine()
+    info = {"replica": next(_next_replica)} if _next_replica else {}
+    db = SessionLocal(info=info)
+    try:
+        yield db
+    finally:
+        db.close()
+
+def pool_status() -> dict:
+    """Human-readable pool state per engine, for startup logs and diagnostics."""
+    engines = {"primary": get_engine(), **{f"replica{i}": e for i, e in enumerate(_replica_engines)}}
+    if _async_engine is not None:
+        engines["async"] = _async_engine.sync_engine
+    for i, e in enumerate(_async_replica_engines or ()):
+        engines[f"async_replica{i}"] = e.sync_engine
+    return {name: e.pool.status() for name, e in engines.items()}
+
+
+# -----------------------
+# ASYNC (DB_MODE=async)
+# -----------------------
+# async drivers for the sync URLs we support
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql+mysqlconnector": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+def async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+_async_engine = None
+
+_async_replica_engines = None
+_next_async_replica = None
+
+def get_async_engine():
+    """Created on first use so the sync mode never needs an async driver installed."""
+    global _async_engine, _async_replica_engines, _next_async_replica
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        url = os.getenv("ASYNC_DATABASE_URL") or async_database_url(database_url())
+        _async_engine = enforce_foreign_keys(create_async_engine(url, **pool_options()))
+        watch_pool("async", _async_engine.sync_engine.pool)
+        _async_replica_engines = [enforce_foreign_keys(create_async_engine(async_database_url(u), **pool_options()))
+                                  for u in replica_urls()]
+        for i, e in enumerate(_async_replica_engines):
+            watch_pool(f"async_replica{i}", e.sync_engine.pool)
+        if _async_replica_engines:
+            _next_async_replica = itertools.cycle(_async_replica_engines)
+    return _async_engine
+
+async def dispose_async_engines():
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    for e in _async_replica_engines or ():
+        await e.dispose()
+
+AsyncSessionLocal = None
+
+def _async_sessionmaker():
+    global AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        AsyncSessionLocal = async_sessionmaker(bind=get_async_engine(), autoflush=False, sync_session_class=RoutingSession)
+    return AsyncSessionLocal
+
+async def get_async_db():
+    async with _async_sessionmaker()() as db:
+        yield db
+
+async def get_async_read_db():
+    """Async counterpart of get_read_db."""
+    factory = _async_sessionmaker()
+    info = {"replica": next(_next_async_replica).sync_engine} if _next_async_replica else {}
+    async with factory(info=info) as db:
+        yield db
\ No newline at end of file
@@ -1,24 +1,172 @@
 # app/email_utils.py
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+import abc
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
 from app.config import settings
+from app.metrics import record_email_batch
+
+logger = logging.getLogger(__name__)
+
+# Placeholder replaced per recipient; lets one message body serve a whole batch.
+NAME_TAG = "-name-"
+
+
+@dataclass
+class Recipient:
+    email: str
+    name: Optional[str] = None
+
+
+class PartialDeliveryError(Exception):
+    """send_batch delivered the first `delivered` recipients, then failed on the rest."""
+
+    def __init__(self, delivered: int, error: Exception):
+        super().__init__(f"{error} (after {delivered} recipients were delivered)")
+        self.delivered = delivered
+        self.error = error
+
+
+class EmailTransport(abc.ABC):
+    """Sends one message (shared subject/body) to many recipients."""
+
+    @abc.abstractmethod
+    def send_batch(self, recipients: List[Recipient], subject: str, body: str, send_at: Optional[int] = None) -> None:
+        """Send to every recipient or raise. A transport that sends in several
+        requests raises PartialDeliveryError once some of them went out."""
+
+    def close(self) -> None:
+        pass
+
+
+class SendGridTransport(EmailTransport):
+    # SendGrid accepts at most 1000 personalizations per request
+    MAX_PERSONALIZATIONS = 1000
+
+    def __init__(self, api_key: str, from_email: str):
+        self.api_key = api_key
+        self.from_email = from_email
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        # one client for the life of the process instead of one per email
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from sendgrid import SendGridAPIClient
+                    self._client = SendGridAPIClient(self.api_key)
+        return self._client
+
+    def send_batch(self, recipients, subject, body, send_at=None):
+        from sendgrid.helpers.mail import Mail, Personalization, Substitution, To
+
+        for start in range(0, len(recipients), self.MAX_PERSONALIZATIONS):
+            message = Mail(from_email=self.from_email, subject=subject, html_content=body)
+            for r in recipients[start:start + self.MAX_PERSONALIZATIONS]:
+                p = Personalization()
+                p.add_to(To(r.email))
+                p.add_substitution(Substitution(NAME_TAG, r.name or ""))
+                message.add_personalization(p)
+            if send_at:
+                message.send_at = send_at
+            try:
+                response = self.client.send(message)
+                if response.status_code >= 400:
+                    raise RuntimeError(f"SendGrid returned {response.status_code}")
+            except Exception as e:
+                # earlier chunks were delivered; only the rest may be retried
+                if start:
+                    raise PartialDeliveryError(start, e) from e
+                raise
 
-def send_email(email: str, subject: str, body: str, send_at: int = None):
-    
-    message = Mail(
-        from_email=settings.FROM_EMAIL,
-        to_emails=email,
-        subject=subject,
-        html_content=body
-    )
-
-    
-    if send_at:
-        message.send_at = send_at
 
+class InMemoryTransport(EmailTransport):
+    """Keeps sent batches in a list; for tests and benchmarks."""
+
+    def __init__(self):
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def send_batch(self, recipients, subject, body, send_at=None):
+        with self._lock:
+            self.batches.append({
+                "recipients": list(recipients),
+                "subject": subject,
+                "body": body,
+                "send_at": send_at,
+            })
+
+    @property
+    def sent_count(self) -> int:
+        with self._lock:
+            return sum(len(b["recipients"]) for b in self.batches)
+
+
+class FileTransport(EmailTransport):
+    """Appends each batch as a JSON line to a local file; for local development."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send_batch(self, recipients, subject, body, send_at=None):
+        line = json.dumps({
+            "at": datetime.utcnow().isoformat(),
+            "to": [{"email": r.email, "name": r.name} for r in recipients],
+            "subject": subject,
+            "body": body,
+            "send_at": send_at,
+        })
+        with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+
+_transport: Optional[EmailTransport] = None
+_transport_lock = threading.Lock()
+
+
+def build_transport(kind: str) -> EmailTransport:
+    if kind == "sendgrid":
+        return SendGridTransport(settings.SENDGRID_API_KEY, settings.FROM_EMAIL)
+    if kind == "file":
+        return FileTransport(settings.EMAIL_FILE_PATH)
+    if kind == "memory":
+        return InMemoryTransport()
+    raise ValueError(f"Unknown EMAIL_TRANSPORT: {kind}")
+
+
+def get_transport() -> EmailTransport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = build_transport(settings.EMAIL_TRANSPORT)
+    return _transport
+
+
+def set_transport(transport: Optional[EmailTransport]) -> None:
+    """Swap the process-wide transport (e.g. an InMemoryTransport in tests)."""
+    global _transport
+    with _transport_lock:
+        _transport = transport
+
+
+def send_email(email: str, subject: str, body: str, send_at: int = None):
+    """Send a single email right away. Request handlers should enqueue through
+    app.services.outbox instead."""
+    transport = get_transport()
+    start = time.perf_counter()
     try:
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        response = sg.send(message)
-        print(f"[SendGrid] Email sent → {email}, Status: {response.status_code}")
-    except Exception as e:
-        print("[SendGrid] Error:", e)
+        transport.send_batch([Recipient(email)], subject, body, send_at)
+        record_email_batch(transport, 1, 0, time.perf_counter() - start)
+        logger.info("email sent to %s", email)
+    except Exception:
+        record_email_batch(transport, 0, 1, time.perf_counter() - start)
+        logger.exception("email to %s failed", email)
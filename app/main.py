@@ -1,14 +1,61 @@
-from fastapi import FastAPI
+import time
+_IMPORT_STARTED = time.perf_counter()
+
+import logging
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, FastAPI, Request
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal, engine, Base
-from app.models import user, event, registration
+from app.db.session import SessionLocal, Base
+from app.db import session as session_module
+from app.models import user, event, registration, outbox, stats, waitlist, idempotency, archive
 from app.auth.routes import router as auth_router
 from fastapi.openapi.utils import get_openapi
 from fastapi.security import OAuth2PasswordBearer
 from app.auth import routes as auth   
-from app.routers import events
+from app.routers import events, events_async
+from app.auth import routes_async as auth_async
+from app.config import settings
+from app.db.query_counter import current_counter
+from app.services import outbox as email_outbox
+from app.services import reminders
+from app.services import archive as event_archive
+from app.auth.hashing_pool import password_pool
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # everything with side effects happens here, not at import
+    started = time.perf_counter()
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    missing = settings.missing()
+    if missing:
+        raise RuntimeError(f"Missing required settings: {', '.join(missing)}")
+    include_routers(app)
+    if settings.DB_AUTO_CREATE:
+        # development shortcut; deployments run `alembic upgrade head`
+        Base.metadata.create_all(bind=session_module.get_engine())
+    for name, status in session_module.pool_status().items():
+        logger.info("%s pool: %s", name, status)
+    email_outbox.start_workers(SessionLocal)
+    reminders.start_scheduler(SessionLocal)
+    event_archive.start_scheduler(SessionLocal)
+    metrics.startup_seconds["import"] = IMPORT_SECONDS
+    metrics.startup_seconds["lifespan"] = time.perf_counter() - started
+    logger.info("startup: import %.0f ms, lifespan %.0f ms",
+                IMPORT_SECONDS * 1000, metrics.startup_seconds["lifespan"] * 1000)
+    yield
+    event_archive.stop_scheduler()
+    reminders.stop_scheduler()
+    email_outbox.stop_workers()
+    if password_pool.loaded():
+        password_pool.shutdown()
+    await session_module.dispose_async_engines()
+
+
+app = FastAPI(lifespan=lifespan)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
 def custom_openapi():
@@ -34,10 +81,53 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
-# include your routers
-app.include_router(auth.router)
-app.include_router(events.router)
-Base.metadata.create_all(bind=engine)
+
+@app.middleware("http")
+async def query_count_guard(request: Request, call_next):
+    # dev aid: flag requests that look like N+1 query patterns
+    # reads the request's counter opened by metrics.metrics_middleware (outermost)
+    counter = current_counter()
+    if settings.QUERY_COUNT_WARN_THRESHOLD <= 0 or counter is None:
+        return await call_next(request)
+    response = await call_next(request)
+    response.headers["X-Query-Count"] = str(counter.count)
+    if counter.count > settings.QUERY_COUNT_WARN_THRESHOLD:
+        logger.warning("%s %s ran %d queries (threshold %d)", request.method, request.url.path,
+                       counter.count, settings.QUERY_COUNT_WARN_THRESHOLD)
+    return response
+
+app.middleware("http")(metrics.metrics_middleware)
+
+def prefer_routes(preferred: APIRouter, fallback: APIRouter) -> APIRouter:
+    """`fallback`'s routes in their original order, with every route that
+    `preferred` also defines (same path and method) swapped for that version.
+    Keeping the sync order matters: /events/{event_id} must stay after the
+    fixed /events/... paths."""
+    overrides = {(r.path, m): r for r in preferred.routes for m in r.methods}
+    merged = APIRouter()
+    for route in fallback.routes:
+        replacement = next((overrides[(route.path, m)] for m in route.methods if (route.path, m) in overrides), None)
+        chosen = replacement or route
+        if chosen not in merged.routes:
+            merged.routes.append(chosen)
+    merged.routes.extend(r for r in preferred.routes if r not in merged.routes)
+    return merged
+
+def include_routers(app: FastAPI) -> None:
+    """Add the auth and event routes for settings.DB_MODE. Called by the
+    lifespan, so the mode is read at startup; later calls do nothing."""
+    if getattr(app.state, "routers_included", False):
+        return
+    if settings.DB_MODE == "async":
+        app.include_router(prefer_routes(auth_async.router, auth.router))
+        app.include_router(prefer_routes(events_async.router, events.router))
+    else:
+        app.include_router(auth.router)
+        app.include_router(events.router)
+    app.openapi_schema = None
+    app.state.routers_included = True
+
+app.include_router(metrics.router)
 from fastapi.middleware.cors import CORSMiddleware
 
 app.add_middleware(
@@ -46,4 +136,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # pagination cursor for /events/list, conditional GETs, Idempotency-Key replays
+    expose_headers=["X-Next-Cursor", "ETag", "Idempotent-Replayed"],
 )
+
+IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
@@ -0,0 +1,292 @@
+# app/metrics.py
+"""Minimal Prometheus-style metrics registry and the /metrics endpoint.
+
+Everything lives in process memory, so with several uvicorn workers each
+process exposes its own numbers (scrape each worker, or run one per pod).
+
+    http_requests_total / http_request_duration_seconds   - per route template
+    db_queries_total / db_query_duration_seconds_total    - per route template
+    db_pool_*                                             - per registered pool
+    email_*                                               - outbox / send_email
+"""
+import abc
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.pool import QueuePool
+
+from app.db.query_counter import count_queries
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(abc.ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abc.abstractmethod
+    def samples(self) -> List[str]:
+        """Exposition lines for the current values, without the HELP/TYPE header."""
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(Metric):
+    """Value computed at scrape time by `callback`, returning {labels: value}."""
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), callback: Callable[[], Dict[tuple, float]] = None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def samples(self):
+        values = self.callback() if self.callback else {}
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in sorted(values.items())]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[index] += 1
+            self._sums[labels] += value
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(labels, ()))
+
+    def samples(self):
+        with self._lock:
+            items = sorted((k, list(v), self._sums[k]) for k, v in self._counts.items())
+        lines = []
+        names = self.labelnames + ("le",)
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (_format_value(bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=(), callback=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# -----------------------
+# HTTP
+# -----------------------
+http_requests = registry.counter(
+    "http_requests_total", "HTTP responses by route template and status code.", ("method", "route", "status"))
+http_latency = registry.histogram(
+    "http_request_duration_seconds", "Time until the response headers were ready.", ("method", "route"))
+http_in_flight = 0
+
+# -----------------------
+# DATABASE
+# -----------------------
+db_queries = registry.counter("db_queries_total", "SQL statements executed, by route template.", ("route",))
+db_query_seconds = registry.counter(
+    "db_query_duration_seconds_total", "Time spent executing SQL statements, by route template.", ("route",))
+db_pool_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.", ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0))
+db_pool_timeouts = registry.counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after pool_timeout.", ("pool",))
+
+# -----------------------
+# EMAIL
+# -----------------------
+emails_sent = registry.counter("email_sent_total", "Recipients handed to the transport successfully.", ("transport",))
+email_failures = registry.counter("email_send_failures_total", "Recipients whose send attempt failed.", ("transport",))
+email_batch_seconds = registry.histogram(
+    "email_batch_duration_seconds", "Duration of one transport send_batch call.", ("transport",))
+
+
+def record_email_batch(transport, sent: int, failed: int, seconds: float) -> None:
+    kind = type(transport).__name__
+    email_batch_seconds.observe(seconds, kind)
+    if sent:
+        emails_sent.inc(sent, kind)
+    if failed:
+        email_failures.inc(failed, kind)
+
+
+def route_template(request: Request) -> str:
+    """'/events/{event_id}' rather than '/events/42', so label cardinality stays bounded."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+async def metrics_middleware(request: Request, call_next):
+    global http_in_flight
+    http_in_flight += 1
+    start = time.perf_counter()
+    status = 500
+    # the request's statements, counted by the listener in app.db.query_counter
+    with count_queries() as queries:
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - start
+            http_in_flight -= 1
+            route = route_template(request)
+            http_requests.inc(1, request.method, route, str(status))
+            http_latency.observe(elapsed, request.method, route)
+            if queries.count:
+                db_queries.inc(queries.count, route)
+                db_query_seconds.inc(queries.seconds, route)
+
+
+registry.gauge("http_requests_in_flight", "Requests currently being handled.", callback=lambda: {(): http_in_flight})
+
+# filled in by the lifespan hook in app.main
+startup_seconds: Dict[str, float] = {}
+registry.gauge("app_startup_seconds", "Cold start duration by phase (import, lifespan).", ("phase",),
+               lambda: {(phase,): seconds for phase, seconds in startup_seconds.items()})
+
+# -----------------------
+# CONNECTION POOLS
+# -----------------------
+_pools: Dict[str, object] = {}
+
+
+def watch_pool(name: str, pool) -> None:
+    """Expose size/checked-out/overflow gauges for `pool` under pool="<name>"."""
+    _pools[name] = pool
+    if isinstance(pool, InstrumentedQueuePool):
+        pool.metrics_name = name
+
+
+def _pool_values(attribute: str) -> Dict[tuple, float]:
+    values = {}
+    for name, pool in _pools.items():
+        fn = getattr(pool, attribute, None)
+        if callable(fn):
+            values[(name,)] = fn()
+    return values
+
+
+registry.gauge("db_pool_size", "Configured pool size.", ("pool",), lambda: _pool_values("size"))
+registry.gauge("db_pool_checked_out", "Connections currently in use.", ("pool",), lambda: _pool_values("checkedout"))
+registry.gauge("db_pool_checked_in", "Idle connections in the pool.", ("pool",), lambda: _pool_values("checkedin"))
+registry.gauge("db_pool_overflow", "Connections opened beyond pool_size (negative while below it).",
+               ("pool",), lambda: _pool_values("overflow"))
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+    metrics_name = "primary"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception as e:
+            if type(e).__name__ == "TimeoutError":
+                db_pool_timeouts.inc(1, self.metrics_name)
+            raise
+        finally:
+            db_pool_wait.observe(time.perf_counter() - start, self.metrics_name)
+
+
+# -----------------------
+# ENDPOINT
+# -----------------------
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
+from app.db.session import Base
+
+class ArchivedEvent(Base):
+    """A completed event moved out of `events` by app.services.archive.
+    Same columns (and ids); read only."""
+    __tablename__ = "events_archive"
+    __table_args__ = (
+        # organizer history, newest first
+        Index("ix_events_archive_organizer_date_id", "organizer_id", "event_date", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    title = Column(String(200), nullable=False)
+    description = Column(String(2000))
+    venue = Column(String(200), nullable=False)
+    speaker = Column(String(120), nullable=False)
+    event_date = Column(DateTime, nullable=False)
+    total_seats = Column(Integer, nullable=False)
+    seats_available = Column(Integer, nullable=False)
+    organizer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    archived_at = Column(DateTime, nullable=False)
+
+
+class ArchivedRegistration(Base):
+    """A registration of an archived event, moved with it."""
+    __tablename__ = "registrations_archive"
+    __table_args__ = (
+        # participant history
+        Index("ix_registrations_archive_user_event", "user_id", "event_id"),
+        # participants of one archived event
+        Index("ix_registrations_archive_event", "event_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    event_id = Column(Integer, ForeignKey("events_archive.id", ondelete="CASCADE"), nullable=False)
+    seats_booked = Column(Integer, nullable=False)
+    created_at = Column(DateTime)
+    registered_at = Column(DateTime)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, CheckConstraint, Index, text
 from sqlalchemy.orm import relationship
 from app.db.session import Base
 
@@ -6,6 +6,12 @@ class Event(Base):
     __tablename__ = "events"
     __table_args__ = (
         CheckConstraint("seats_available >= 0", name="ck_event_seats_nonneg"),
+        # keyset pagination on (event_date, id), optionally narrowed by organizer or venue
+        Index("ix_events_date_id", "event_date", "id"),
+        Index("ix_events_organizer_date_id", "organizer_id", "event_date", "id"),
+        Index("ix_events_venue_date_id", "venue", "event_date", "id"),
+        # /events/search on MySQL; other databases use the in-process index in app.services.search
+        Index("ft_events_search", "title", "description", "speaker", "venue", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -16,13 +22,17 @@ class Event(Base):
     event_date = Column(DateTime, nullable=False) 
     total_seats = Column(Integer, nullable=False)
     seats_available = Column(Integer, nullable=False)
+    # bumped in SQL by every write (including seat changes); feeds the ETags
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
 
     organizer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
 
 
     organizer = relationship("User", back_populates="events")
+    # deleting an event never loads its registrations: ON DELETE CASCADE removes them
     registrations = relationship(
     "Registration",
     back_populates="event",
-    cascade="all, delete-orphan"
+    cascade="all, delete-orphan",
+    passive_deletes=True,
 )
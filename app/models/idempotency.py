@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from datetime import datetime
+from app.db.session import Base
+
+class IdempotencyRecord(Base):
+    """Stored outcome of a request sent with an Idempotency-Key, shared by
+    every process (IDEMPOTENCY_STORE=db). status_code is NULL while the
+    first request is still running."""
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        Index("ix_idempotency_keys_created", "created_at"),
+    )
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer)
+    body = Column(Text)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from datetime import datetime
+from app.db.session import Base
+
+class EmailOutbox(Base):
+    """Emails waiting to be sent. Written in the request transaction, drained by
+    the outbox workers (app.services.outbox)."""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next", "status", "next_attempt_at"),
+        Index("ix_email_outbox_claim", "claim_token"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    to_name = Column(String(120))
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    send_at = Column(Integer)  # unix timestamp for SendGrid scheduled delivery
+    status = Column(String(16), nullable=False, default="pending")  # pending | sending | sent | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    claim_token = Column(String(32))
+    claimed_at = Column(DateTime)
+    last_error = Column(String(500))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
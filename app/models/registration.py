@@ -1,11 +1,17 @@
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Boolean, UniqueConstraint, Index, false
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.session import Base
 
 class Registration(Base):
     __tablename__ = "registrations"
+    __table_args__ = (
+        # one registration per user per event; enforced by the DB instead of a pre-check query
+        UniqueConstraint("user_id", "event_id", name="uq_registration_user_event"),
+        # reminder scheduler: pending reminders of one event
+        Index("ix_registrations_event_reminder", "event_id", "reminder_sent"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -13,6 +19,6 @@ class Registration(Base):
     seats_booked = Column(Integer, nullable=False, default=1)
     created_at = Column(DateTime, default=datetime.utcnow)
     registered_at = Column(DateTime, default=datetime.utcnow)
-    reminder_sent = Column(Boolean, default=False) 
+    reminder_sent = Column(Boolean, nullable=False, default=False, server_default=false())
     user = relationship("User", back_populates="registrations")
     event = relationship("Event", back_populates="registrations")
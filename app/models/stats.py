@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, Date, Index, text
+from app.db.session import Base
+
+class EventStats(Base):
+    """Running per-event counters for the organizer dashboard, updated by
+    app.services.stats in the same transaction as each booking/cancellation.
+    No foreign key: the row outlives the move of its event to events_archive
+    (same id) and is only removed when the event is deleted."""
+    __tablename__ = "event_stats"
+    __table_args__ = (
+        Index("ix_event_stats_organizer", "organizer_id"),
+    )
+
+    event_id = Column(Integer, primary_key=True, autoincrement=False)  # events.id or events_archive.id
+    organizer_id = Column(Integer, nullable=False)
+    registrations = Column(Integer, nullable=False, default=0, server_default=text("0"))  # active registrations
+    seats_sold = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    cancellations = Column(Integer, nullable=False, default=0, server_default=text("0"))
+
+
+class OrganizerDailyStats(Base):
+    """Bookings and cancellations per organizer per (UTC) day. Kept after an
+    event is deleted; its remaining registrations count as cancellations."""
+    __tablename__ = "organizer_daily_stats"
+
+    organizer_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    registrations = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    seats_booked = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    cancellations = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    seats_released = Column(Integer, nullable=False, default=0, server_default=text("0"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, DateTime, func
+from sqlalchemy import Column, Integer, String, Enum, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.db.session import Base
 import enum
@@ -19,3 +19,8 @@ class User(Base):
 
     events = relationship("Event", back_populates="organizer", cascade="all, delete-orphan")
     registrations = relationship("Registration", back_populates="user", cascade="all, delete-orphan")
+
+
+# emails are stored normalized (app.auth.security.normalize_email); this also
+# rejects case variants written by anything that skips the normalization
+Index("uq_users_email_lower", func.lower(User.email), unique=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, Index
+from datetime import datetime
+from app.db.session import Base
+
+class WaitlistEntry(Base):
+    """A participant waiting for seats of a sold-out event. Served in id
+    (arrival) order by app.services.waitlist.promote()."""
+    __tablename__ = "waitlist_entries"
+    __table_args__ = (
+        UniqueConstraint("user_id", "event_id", name="uq_waitlist_user_event"),
+        # FIFO scan and positions within one event
+        Index("ix_waitlist_event_id", "event_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    seats = Column(Integer, nullable=False, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
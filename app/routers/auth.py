@@ -27,17 +27,3 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     user_id: Optional[int] = None
     role: Optional[str] = None
-class EventCreate(BaseModel):
-    title: str
-    description: Optional[str] = None
-    venue: str
-    speaker: str
-    event_date: datetime
-    total_seats: int
-class EventUpdate(BaseModel):
-    title: Optional[str] = None
-    description: Optional[str] = None
-    venue: Optional[str] = None
-    speaker: Optional[str] = None
-    event_date: Optional[datetime] = None
-    total_seats: Optional[int] = None
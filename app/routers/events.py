@@ -1,357 +1,303 @@
 # app/routers/events.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
 from typing import List, Optional
 
-from app.db.session import get_db
-from app.models.event import Event
-from app.models.registration import Registration
-from app.auth.deps import require_organizer, require_participant
-from app.routers.auth import EventCreate, EventUpdate
-from app.email_utils import send_email
+from app.db.session import SessionLocal, get_db, get_read_db
+from app.auth.deps import get_current_user, require_organizer, require_participant
+from app.schemas import (
+    ArchivedEventOut,
+    BulkRegistrationRequest,
+    EventCreate,
+    EventListItem,
+    EventOut,
+    EventSearchItem,
+    EventUpdate,
+    MyRegistrationOut,
+    MyRegistrationsOut,
+    OrganizerStatsOut,
+    ParticipantOut,
+    WaitlistPositionOut,
+)
+from app.admission import admission
+from app.services import events as service
+from app.services import export, seat_updates
+from app.services.idempotency import IdempotentRequest, idempotency_key, idempotent
+from app.services.etags import conditional_response, not_modified
+from app.services.listing import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, EventListParams, EventStatus
+from app.services.stats import DEFAULT_STATS_DAYS
 
 router = APIRouter(prefix="/events", tags=["events"])
 
-def now_utc() -> datetime:
-    return datetime.utcnow()
-
-def event_status(event: Event) -> str:
-    """Return 'completed', 'soon' (<=24h), or 'upcoming'"""
-    now = now_utc()
-    if event.event_date <= now:
-        return "completed"
-    hours_left = (event.event_date - now).total_seconds() / 3600.0
-    if hours_left <= 24:
-        return "soon"
-    return "upcoming"
-
 
 # -----------------------
 # LIST / GET
 # -----------------------
-@router.get("/list")
-def list_events(db: Session = Depends(get_db)):
-    events: List[Event] = db.query(Event).all()
-    result = []
-    for ev in events:
-        result.append({
-            "id": ev.id,
-            "title": ev.title,
-            "description": getattr(ev, "description", None),
-            "venue": ev.venue,
-            "speaker": ev.speaker,
-            "event_date": ev.event_date,
-            "total_seats": ev.total_seats,
-            "seats_available": ev.seats_available,
-            "organizer_id": ev.organizer_id,
-            "status": event_status(ev)
-        })
-    return result
-
-@router.get("/{event_id}")
-def get_event(event_id: int, db: Session = Depends(get_db)):
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+@router.get("/list", response_model=List[EventListItem], response_model_exclude_unset=True)
+def list_events(
+    params: EventListParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db),
+):
+    """Keyset-paginated listing ordered by (event_date, id).
+
+    The cursor for the next page is returned in the X-Next-Cursor header;
+    it is absent on the last page. Answers If-None-Match with 304.
+    """
+    etag, body, next_cursor = service.list_events_conditional(db, params, if_none_match)
+    return conditional_response(etag, body, next_cursor)
+
+@router.get("/search", response_model=List[EventSearchItem], response_model_exclude_unset=True)
+def search_events(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+):
+    """Events matching `q` in title, description, speaker or venue, best match
+    first. Paginated like /events/list (X-Next-Cursor header)."""
+    items, next_cursor = service.search_events(db, q, cursor, limit, fields)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+@router.get("/{event_id}", response_model=EventOut)
+def get_event(event_id: int, response: Response, if_none_match: Optional[str] = Header(None), db: Session = Depends(get_read_db)):
+    etag, event = service.get_event_conditional(db, event_id, if_none_match)
+    if event is None:
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return event
+
+@router.get("/{event_id}/seats/stream")
+async def stream_seats(event_id: int):
+    """Server-Sent Events feed of seats_available, instead of polling /events/{event_id}."""
+    seats = await run_in_threadpool(seat_updates.broadcaster.read, event_id)
+    if seats is None:
         raise HTTPException(status_code=404, detail="Event not found")
-    return {
-        "id": event.id,
-        "title": event.title,
-        "description": getattr(event, "description", None),
-        "venue": event.venue,
-        "speaker": event.speaker,
-        "event_date": event.event_date,
-        "total_seats": event.total_seats,
-        "seats_available": event.seats_available,
-        "organizer_id": event.organizer_id,
-        "status": event_status(event)
-    }
+    return StreamingResponse(
+        seat_updates.sse_stream(event_id, seats),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # -----------------------
 # CREATE (organizer)
 # -----------------------
-@router.post("/create", status_code=201)
-def create_event(payload: EventCreate, db: Session = Depends(get_db), user = Depends(require_organizer)):
-    # Enforce future date
-    if payload.event_date <= now_utc():
-        raise HTTPException(status_code=400, detail="event_date must be in the future")
-
-    event = Event(
-        title=payload.title,
-        description=getattr(payload, "description", None),
-        venue=payload.venue,
-        speaker=payload.speaker,
-        event_date=payload.event_date,
-        total_seats=payload.total_seats,
-        seats_available=payload.total_seats,
-        organizer_id=user.id
-    )
-    db.add(event)
-    db.commit()
-    db.refresh(event)
-    return {"msg": "Event created successfully", "event_id": event.id}
+@router.post("/create", status_code=201, dependencies=[Depends(admission("manage"))])
+def create_event(
+    payload: EventCreate,
+    idem: Optional[IdempotentRequest] = Depends(idempotency_key),
+    db: Session = Depends(get_db),
+    user = Depends(require_organizer),
+):
+    """Send an Idempotency-Key header to make double submits create one event."""
+    return idempotent(idem, user, 201, lambda: service.create_event(db, payload, user))
+
+@router.post("/import", dependencies=[Depends(admission("import"))])
+def import_events(
+    file: UploadFile = File(...),
+    format_: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson|jsonl)$"),
+    db: Session = Depends(get_db),
+    user = Depends(require_organizer),
+):
+    """Create many events from a CSV (header row with the EventCreate fields) or
+    NDJSON upload. The format defaults to the file extension. Valid rows are
+    created; the others are reported as {row, detail} in `errors`."""
+    return service.import_events(db, file.file, format_, file.filename, user)
 
 
 # -----------------------
 # UPDATE (organizer) — BLOCK updates to completed events
 # -----------------------
-@router.put("/update/{event_id}")
+@router.put("/update/{event_id}", dependencies=[Depends(admission("manage", per_event=True))])
 def update_event(
     event_id: int,
     payload: EventUpdate,
     db: Session = Depends(get_db),
     user = Depends(require_organizer)
 ):
-    event = db.query(Event).filter(Event.id == event_id, Event.organizer_id == user.id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found or unauthorized")
-
-    # Block updating completed events (Option A)
-    if event.event_date <= now_utc():
-        raise HTTPException(status_code=403, detail="Cannot update an event that is already completed")
-
-    # Keep old values for email notifications
-    old_date = event.event_date
-    old_venue = event.venue
-
-    # Apply updates (only fields provided)
-    update_data = payload.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(event, key, value)
-
-    db.commit()
-    db.refresh(event)
-
-    # Notify participants only if the event is still upcoming (should be, because we blocked completed)
-    registrations = db.query(Registration).filter(Registration.event_id == event_id).all()
-    for reg in registrations:
-        p = reg.user
-        subject = f"Event Updated: {event.title}"
-        body = f"""
-            <p>Hello {p.name},</p>
-            <p>We would like to inform you that the event you registered for has been updated.</p>
-            <p>The event <strong>{event.title}</strong> has been updated.</p>
-            <p><strong>Old Date:</strong> {old_date} | <strong>Old Speaker:</strong> {old_venue} | <strong> Old Venue:</strong> {old_venue}<br>
-            <strong>New Date:</strong> {event.event_date} | <strong>New Speaker:</strong> {event.speaker} | <strong>New Venue:</strong> {event.venue}</p>
-            <p><strong>New Venue:</strong> {event.venue}</p>
-            <p>By EventHub Team</p>
-        """
-        # Send immediately for updates
-        send_email(p.email, subject, body)
-
-    return {"msg": "Event updated successfully!"}
+    return service.update_event(db, event_id, payload, user)
 
 
 # -----------------------
 # DELETE (organizer)
 # -----------------------
-@router.delete("/delete/{event_id}")
+@router.delete("/delete/{event_id}", dependencies=[Depends(admission("manage", per_event=True))])
 def delete_event(
     event_id: int,
     db: Session = Depends(get_db),
     user = Depends(require_organizer),
 ):
-    event = db.query(Event).filter(Event.id == event_id, Event.organizer_id == user.id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found or unauthorized")
-
-    registrations = db.query(Registration).filter(Registration.event_id == event_id).all()
-
-    # Only send cancellation emails if the event is upcoming
-    now = now_utc()
-    should_notify = event.event_date > now
-
-    if should_notify:
-        for reg in registrations:
-            participant = reg.user
-            subject = f"Event Cancelled: {event.title}"
-            body = f"""
-                <p>Hello {participant.name},</p>
-                <p>We regret to inform you that the event you registered for has been cancelled.</p>
-                <p>The event <strong>{event.title}</strong> scheduled on 
-                <strong>{event.event_date}</strong> has been cancelled by the organizer.</p>
-                <p>We apologize for the inconvenience </p>
-                <p>By EventHub Team</p>
-            """
-            # Send immediately for cancellations
-            send_email(participant.email, subject, body)
-    else:
-        # Event already completed — do not notify participants
-        print("Event already completed — no cancellation emails sent.")
-
-    db.delete(event)
-    db.commit()
-
-    return {
-        "msg": f"Event '{event.title}' deleted",
-        "notified": should_notify
-    }
+    return service.delete_event(db, event_id, user)
 
 
 # -----------------------
 # MY REGISTRATIONS (participant)
 # -----------------------
-@router.get("/my/registrations")
+@router.get("/my/registrations", response_model=MyRegistrationsOut)
 def get_my_registrations(
-    db: Session = Depends(get_db),
+    status_: Optional[EventStatus] = Query(None, alias="status"),
+    db: Session = Depends(get_read_db),
     user = Depends(require_participant)
 ):
-    registrations = db.query(Registration).filter(Registration.user_id == user.id).all()
-    events = [
-        {
-            "event_id": r.event.id,
-            "title": r.event.title,
-            "venue": r.event.venue,
-            "date": r.event.event_date,
-            "speaker": r.event.speaker,
-            "seats_booked": r.seats_booked,
-            "registered_at": r.registered_at,
-            "status": event_status(r.event)
-        }
-        for r in registrations
-    ]
-    return {"user": user.name, "registered_events": events}
+    return service.my_registrations(db, user, status_)
+
+@router.get("/my/history", response_model=List[MyRegistrationOut])
+def get_my_history(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
+    user = Depends(require_participant),
+):
+    """Registrations of archived events, newest first (X-Next-Cursor header)."""
+    items, next_cursor = service.registration_history(db, user, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
 
 
 # -----------------------
-# REGISTER (participant)
+# DASHBOARD (organizer)
 # -----------------------
-@router.post("/register/{event_id}")
-def register_for_event(
-    event_id: int,
-    seats: int = 1,
-    db: Session = Depends(get_db),
-    user = Depends(require_participant)
+@router.get("/my/stats", response_model=OrganizerStatsOut)
+def get_my_stats(
+    days: int = Query(DEFAULT_STATS_DAYS, ge=1, le=366),
+    db: Session = Depends(get_read_db),
+    user = Depends(require_organizer),
 ):
-    # Lock the event row (prevents race conditions)
-    event = db.query(Event)\
-        .filter(Event.id == event_id)\
-        .with_for_update()\
-        .first()
-
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    now = now_utc()
-
-    # No late registrations
-    if now >= event.event_date:
-        raise HTTPException(status_code=400, detail="This event is already completed. Registration is closed.")
+    """Fill rate, seats sold and registrations per event, plus bookings and
+    cancellations per day over the last `days` days."""
+    return service.organizer_stats(db, user, days)
 
-    # Check seats AFTER locking
-    if event.seats_available < seats:
-        raise HTTPException(status_code=400, detail="Not enough seats available")
 
-    # Duplicate check
-    existing = db.query(Registration).filter(
-        Registration.event_id == event_id,
-        Registration.user_id == user.id
-    ).first()
-
-    if existing:
-        raise HTTPException(status_code=400, detail="Already registered for this event")
+# -----------------------
+# ARCHIVE (organizer, read only)
+# -----------------------
+@router.get("/archive/list", response_model=List[ArchivedEventOut])
+def list_archived_events(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
+    user = Depends(require_organizer),
+):
+    """Own events moved to the archive, newest first (X-Next-Cursor header)."""
+    items, next_cursor = service.archived_events(db, user, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+@router.get("/archive/{event_id}/registrations", response_model=List[ParticipantOut])
+def view_archived_registrations(
+    event_id: int,
+    db: Session = Depends(get_read_db),
+    user = Depends(require_organizer),
+):
+    return service.archived_participants(db, event_id, user)
 
-    # Create registration safely
-    registration = Registration(
-        user_id=user.id,
-        event_id=event_id,
-        seats_booked=seats
-    )
 
-    db.add(registration)
-    event.seats_available -= seats  # safe update
-    db.commit()                      # lock is released here
-    db.refresh(event)
-
-    # reminder logic...
-    reminder_time = event.event_date - timedelta(hours=24)
-    subject = f"Reminder: {event.title} is happening soon!"
-    body = f"""
-        <h3>Hello {user.name},</h3>
-        <p>We would like to remind you that the event you registered for is happening soon.</p>
-        <p>You have registered for <strong>{event.title}</strong>.</p>
-        <p>Date & Time: {event.event_date}</p>
-        <p>Venue: {event.venue}</p>
-        <p>Speaker: {event.speaker}</p>
-        <p>Don't forget it's less than 24 hours away!</p>
-        <p>By EventHub Team</p>
-    """
+# -----------------------
+# BULK REGISTER (participant for self, organizer for a group)
+# -----------------------
+@router.post("/register/bulk", dependencies=[Depends(admission("register_bulk"))])
+def register_bulk(
+    payload: BulkRegistrationRequest,
+    db: Session = Depends(get_db),
+    user = Depends(get_current_user)
+):
+    return service.register_bulk(db, payload, user)
 
-    if now >= reminder_time:
-        send_email(user.email, subject, body)
-    else:
-        send_email(user.email, subject, body, int(reminder_time.timestamp()))
 
-    return {
-        "msg": f"Registered successfully for {event.title}",
-        "event_id": event.id,
-        "status": event_status(event)
-    }
+# -----------------------
+# REGISTER (participant)
+# -----------------------
+@router.post("/register/{event_id}", dependencies=[Depends(admission("register", per_event=True))])
+def register_for_event(
+    event_id: int,
+    seats: int = 1,
+    idem: Optional[IdempotentRequest] = Depends(idempotency_key),
+    db: Session = Depends(get_db),
+    user = Depends(require_participant)
+):
+    """Retries carrying the same Idempotency-Key get the first response back
+    without booking again."""
+    return idempotent(idem, user, 200, lambda: service.register(db, event_id, seats, user))
 
 # -----------------------
 # VIEW REGISTRATIONS (organizer)
 # -----------------------
-@router.get("/registrations/{event_id}")
+@router.get("/registrations/{event_id}", response_model=List[ParticipantOut])
 def view_event_registrations(
     event_id: int,
     db: Session = Depends(get_db),
     user = Depends(require_organizer),
 ):
-    event = db.query(Event).filter(Event.id == event_id, Event.organizer_id == user.id).first()
-    if not event:
-        raise HTTPException(status_code=403, detail="Not your event")
-
-    registrations = db.query(Registration).filter(Registration.event_id == event_id).all()
-    return [
-        {
-            "participant": reg.user.name,
-            "email": reg.user.email,
-            "seats_booked": reg.seats_booked,
-            "registered_at": reg.registered_at
-        }
-        for reg in registrations
-    ]
+    return service.event_registrations(db, event_id, user)
+
+@router.get("/registrations/{event_id}/export", dependencies=[Depends(admission("export"))])
+def export_event_registrations(
+    event_id: int,
+    fmt: str = Query("csv", alias="format"),
+    db: Session = Depends(get_db),
+    user = Depends(require_organizer),
+):
+    """Stream the participant list as CSV or NDJSON (?format=), for events of any size."""
+    export.check_export(db, event_id, fmt, user)
+    return StreamingResponse(
+        export.stream_registrations(SessionLocal, event_id, fmt),
+        media_type=export.MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="event-{event_id}-registrations.{fmt}"'},
+    )
 
 
 # -----------------------
-# CANCEL REGISTRATION (participant)
+# WAITLIST (participant)
 # -----------------------
-@router.delete("/cancel/{event_id}")
-def cancel_registration(
+@router.post("/{event_id}/waitlist", response_model=WaitlistPositionOut, dependencies=[Depends(admission("waitlist", per_event=True))])
+def join_waitlist(
     event_id: int,
+    seats: int = 1,
     db: Session = Depends(get_db),
     user = Depends(require_participant)
 ):
-    # check registration exists
-    registration = db.query(Registration).filter(
-        Registration.event_id == event_id,
-        Registration.user_id == user.id
-    ).first()
-
-    if not registration:
-        raise HTTPException(
-            status_code=404,
-            detail="You are not registered for this event"
-        )
-
-    # fetch the event
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
+    """Queue for a sold-out event instead of retrying /events/register.
+    Seats freed by cancellations or added by the organizer go to the queue
+    in order, and promoted participants are registered and emailed."""
+    return service.join_waitlist(db, event_id, seats, user)
 
-    # Prevent cancellation for completed events
-    if event.event_date <= now_utc():
-        raise HTTPException(status_code=400, detail="Cannot cancel registration for completed events")
+@router.get("/{event_id}/waitlist/position", response_model=WaitlistPositionOut)
+def get_waitlist_position(
+    event_id: int,
+    db: Session = Depends(get_db),
+    user = Depends(require_participant)
+):
+    return service.waitlist_position(db, event_id, user)
 
-    # increase the available seats
-    event.seats_available += registration.seats_booked
+@router.delete("/{event_id}/waitlist", dependencies=[Depends(admission("waitlist", per_event=True))])
+def leave_waitlist(
+    event_id: int,
+    db: Session = Depends(get_db),
+    user = Depends(require_participant)
+):
+    return service.leave_waitlist(db, event_id, user)
 
-    # delete the registration
-    db.delete(registration)
-    db.commit()
 
-    return {
-        "msg": f"Your registration for '{event.title}' has been cancelled",
-        "seats_available": event.seats_available
-    }
+# -----------------------
+# CANCEL REGISTRATION (participant)
+# -----------------------
+@router.delete("/cancel/{event_id}", dependencies=[Depends(admission("cancel", per_event=True))])
+def cancel_registration(
+    event_id: int,
+    idem: Optional[IdempotentRequest] = Depends(idempotency_key),
+    db: Session = Depends(get_db),
+    user = Depends(require_participant)
+):
+    return idempotent(idem, user, 200, lambda: service.cancel(db, event_id, user))
@@ -0,0 +1,218 @@
+# app/routers/events_async.py
+"""Async versions of the event and registration routes (DB_MODE=async).
+
+Same paths and behaviour as app.routers.events; the handlers await an
+AsyncSession and run the shared service functions through run_sync.
+"""
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.db.session import get_async_db, get_async_read_db
+from app.auth.deps import get_current_user_async, require_organizer_async, require_participant_async
+from app.schemas import (
+    ArchivedEventOut,
+    BulkRegistrationRequest,
+    EventCreate,
+    EventListItem,
+    EventOut,
+    EventSearchItem,
+    EventUpdate,
+    MyRegistrationOut,
+    MyRegistrationsOut,
+    OrganizerStatsOut,
+    ParticipantOut,
+    WaitlistPositionOut,
+)
+from app.admission import admission
+from app.services import events as service
+from app.services import search
+from app.services.idempotency import IdempotentRequest, idempotency_key, idempotent_async
+from app.services.etags import conditional_response, not_modified
+from app.services.listing import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, EventListParams, EventStatus
+from app.services.stats import DEFAULT_STATS_DAYS
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+@router.get("/list", response_model=List[EventListItem], response_model_exclude_unset=True)
+async def list_events(
+    params: EventListParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    etag, body, next_cursor = await db.run_sync(service.list_events_conditional, params, if_none_match)
+    return conditional_response(etag, body, next_cursor)
+
+@router.get("/search", response_model=List[EventSearchItem], response_model_exclude_unset=True)
+async def search_events(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    await search.prepare_async(db)
+    items, next_cursor = await db.run_sync(service.search_events, q, cursor, limit, fields)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+@router.get("/{event_id}", response_model=EventOut)
+async def get_event(event_id: int, response: Response, if_none_match: Optional[str] = Header(None), db: AsyncSession = Depends(get_async_read_db)):
+    etag, event = await db.run_sync(service.get_event_conditional, event_id, if_none_match)
+    if event is None:
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return event
+
+
+@router.post("/create", status_code=201, dependencies=[Depends(admission("manage"))])
+async def create_event(
+    payload: EventCreate,
+    idem: Optional[IdempotentRequest] = Depends(idempotency_key),
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_organizer_async),
+):
+    return await idempotent_async(idem, user, 201, lambda: db.run_sync(service.create_event, payload, user))
+
+
+@router.put("/update/{event_id}", dependencies=[Depends(admission("manage", per_event=True))])
+async def update_event(
+    event_id: int,
+    payload: EventUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_organizer_async)
+):
+    return await db.run_sync(service.update_event, event_id, payload, user)
+
+
+@router.delete("/delete/{event_id}", dependencies=[Depends(admission("manage", per_event=True))])
+async def delete_event(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_organizer_async),
+):
+    return await db.run_sync(service.delete_event, event_id, user)
+
+
+@router.get("/my/registrations", response_model=MyRegistrationsOut)
+async def get_my_registrations(
+    status_: Optional[EventStatus] = Query(None, alias="status"),
+    db: AsyncSession = Depends(get_async_read_db),
+    user = Depends(require_participant_async)
+):
+    return await db.run_sync(service.my_registrations, user, status_)
+
+@router.get("/my/history", response_model=List[MyRegistrationOut])
+async def get_my_history(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    user = Depends(require_participant_async),
+):
+    items, next_cursor = await db.run_sync(service.registration_history, user, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+
+@router.get("/my/stats", response_model=OrganizerStatsOut)
+async def get_my_stats(
+    days: int = Query(DEFAULT_STATS_DAYS, ge=1, le=366),
+    db: AsyncSession = Depends(get_async_read_db),
+    user = Depends(require_organizer_async),
+):
+    return await db.run_sync(service.organizer_stats, user, days)
+
+
+@router.get("/archive/list", response_model=List[ArchivedEventOut])
+async def list_archived_events(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    user = Depends(require_organizer_async),
+):
+    items, next_cursor = await db.run_sync(service.archived_events, user, cursor, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return items
+
+@router.get("/archive/{event_id}/registrations", response_model=List[ParticipantOut])
+async def view_archived_registrations(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    user = Depends(require_organizer_async),
+):
+    return await db.run_sync(service.archived_participants, event_id, user)
+
+
+@router.post("/register/bulk", dependencies=[Depends(admission("register_bulk"))])
+async def register_bulk(
+    payload: BulkRegistrationRequest,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(get_current_user_async)
+):
+    return await db.run_sync(service.register_bulk, payload, user)
+
+
+@router.post("/register/{event_id}", dependencies=[Depends(admission("register", per_event=True))])
+async def register_for_event(
+    event_id: int,
+    seats: int = 1,
+    idem: Optional[IdempotentRequest] = Depends(idempotency_key),
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_participant_async)
+):
+    return await idempotent_async(idem, user, 200, lambda: db.run_sync(service.register, event_id, seats, user))
+
+
+@router.get("/registrations/{event_id}", response_model=List[ParticipantOut])
+async def view_event_registrations(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_organizer_async),
+):
+    return await db.run_sync(service.event_registrations, event_id, user)
+
+
+@router.post("/{event_id}/waitlist", response_model=WaitlistPositionOut, dependencies=[Depends(admission("waitlist", per_event=True))])
+async def join_waitlist(
+    event_id: int,
+    seats: int = 1,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_participant_async)
+):
+    return await db.run_sync(service.join_waitlist, event_id, seats, user)
+
+
+@router.get("/{event_id}/waitlist/position", response_model=WaitlistPositionOut)
+async def get_waitlist_position(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_participant_async)
+):
+    return await db.run_sync(service.waitlist_position, event_id, user)
+
+
+@router.delete("/{event_id}/waitlist", dependencies=[Depends(admission("waitlist", per_event=True))])
+async def leave_waitlist(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_participant_async)
+):
+    return await db.run_sync(service.leave_waitlist, event_id, user)
+
+
+@router.delete("/cancel/{event_id}", dependencies=[Depends(admission("cancel", per_event=True))])
+async def cancel_registration(
+    event_id: int,
+    idem: Optional[IdempotentRequest] = Depends(idempotency_key),
+    db: AsyncSession = Depends(get_async_db),
+    user = Depends(require_participant_async)
+):
+    return await idempotent_async(idem, user, 200, lambda: db.run_sync(service.cancel, event_id, user))
@@ -0,0 +1,122 @@
+# app/schemas.py
+"""Request and response models shared by the event routers and the services."""
+from datetime import date, datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, EmailStr, Field
+
+
+class EventCreate(BaseModel):
+    title: str
+    description: Optional[str] = None
+    venue: str
+    speaker: str
+    event_date: datetime
+    total_seats: int
+class EventUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    venue: Optional[str] = None
+    speaker: Optional[str] = None
+    event_date: Optional[datetime] = None
+    total_seats: Optional[int] = None
+class BulkRegistrationItem(BaseModel):
+    event_id: int
+    seats: int = Field(1, ge=1)
+    # organizers booking on behalf of a participant; participants leave it empty
+    user_email: Optional[EmailStr] = None
+class BulkRegistrationRequest(BaseModel):
+    items: List[BulkRegistrationItem] = Field(..., min_length=1, max_length=500)
+    # True: any failure rolls back every item; False: book what can be booked
+    all_or_nothing: bool = True
+
+
+# -----------------------
+# RESPONSES
+# -----------------------
+# Services build these with model_construct() straight from SQL rows (the
+# values come from the database, so there is nothing to validate), and
+# FastAPI serializes them to JSON bytes in pydantic-core.
+class EventOut(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    venue: str
+    speaker: str
+    event_date: datetime
+    total_seats: int
+    seats_available: int
+    organizer_id: Optional[int] = None
+    status: str
+class EventListItem(BaseModel):
+    # every field is optional because ?fields= selects a subset;
+    # routes use response_model_exclude_unset so unselected fields are omitted
+    id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    venue: Optional[str] = None
+    speaker: Optional[str] = None
+    event_date: Optional[datetime] = None
+    total_seats: Optional[int] = None
+    seats_available: Optional[int] = None
+    organizer_id: Optional[int] = None
+    status: Optional[str] = None
+class EventSearchItem(EventListItem):
+    score: Optional[float] = None
+class MyRegistrationOut(BaseModel):
+    event_id: int
+    title: str
+    venue: str
+    date: datetime
+    speaker: str
+    seats_booked: int
+    registered_at: Optional[datetime] = None
+    status: str
+class MyRegistrationsOut(BaseModel):
+    user: str
+    registered_events: List[MyRegistrationOut]
+class ParticipantOut(BaseModel):
+    participant: str
+    email: str
+    seats_booked: int
+    registered_at: Optional[datetime] = None
+class WaitlistPositionOut(BaseModel):
+    event_id: int
+    status: str  # "waiting", or "registered" once promoted
+    position: Optional[int] = None  # 1 = next in line
+    seats: Optional[int] = None
+class EventStatsOut(BaseModel):
+    event_id: int
+    title: str
+    event_date: datetime
+    status: str
+    total_seats: int
+    seats_sold: int
+    registrations: int
+    cancellations: int
+    fill_rate: float
+class DailyStatsOut(BaseModel):
+    day: date
+    registrations: int
+    seats_booked: int
+    cancellations: int
+    seats_released: int
+class OrganizerStatsOut(BaseModel):
+    organizer_id: int
+    events: int
+    total_seats: int
+    seats_sold: int
+    registrations: int
+    fill_rate: float
+    per_event: List[EventStatsOut]
+    daily: List[DailyStatsOut]
+class ArchivedEventOut(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    venue: str
+    speaker: str
+    event_date: datetime
+    total_seats: int
+    seats_sold: int
+    archived_at: datetime
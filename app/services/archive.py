@@ -0,0 +1,265 @@
+# app/services/archive.py
+"""Moves completed events and their registrations out of the hot tables.
+
+Every ARCHIVE_INTERVAL_SECONDS the scheduler takes events that ended more
+than ARCHIVE_AFTER_DAYS ago, ARCHIVE_CHUNK_SIZE at a time, and per chunk in
+one transaction:
+
+    INSERT INTO events_archive        SELECT ... FROM events        WHERE id IN (chunk)
+    INSERT INTO registrations_archive SELECT ... FROM registrations WHERE event_id IN (chunk)
+    DELETE FROM events WHERE id IN (chunk)
+
+The delete takes registrations and waitlist entries with it through ON
+DELETE CASCADE; nothing is loaded into Python. The event's event_stats row
+stays (it has no foreign key), so the organizer dashboard keeps counting
+archived events. The chunk is
+selected with SKIP LOCKED, so several app instances can run the job.
+History stays readable through the read-only /events/archive/... and
+/events/my/history endpoints.
+
+One-off or cron runs:
+
+    python -m app.services.archive --after-days 90 --chunk-size 1000
+"""
+import argparse
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, delete, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.archive import ArchivedEvent, ArchivedRegistration
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.user import User
+from app.schemas import ArchivedEventOut, MyRegistrationOut, ParticipantOut
+from app.services import search
+from app.services.listing import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = ["id", "title", "description", "venue", "speaker", "event_date",
+                 "total_seats", "seats_available", "organizer_id"]
+REGISTRATION_COLUMNS = ["id", "user_id", "event_id", "seats_booked", "created_at", "registered_at"]
+
+
+# -----------------------
+# JOB
+# -----------------------
+def archive_chunk(db: Session, cutoff: datetime, chunk_size: int, now: datetime) -> int:
+    """Archive up to `chunk_size` events dated before `cutoff` and commit;
+    returns how many were moved (0 when nothing is left)."""
+    ids = db.execute(
+        select(Event.id)
+        .where(Event.event_date < cutoff)
+        .order_by(Event.id)
+        .limit(chunk_size)
+        .with_for_update(skip_locked=True)
+    ).scalars().all()
+    if not ids:
+        db.rollback()
+        return 0
+
+    db.execute(insert(ArchivedEvent).from_select(
+        EVENT_COLUMNS + ["archived_at"],
+        select(*(Event.__table__.c[name] for name in EVENT_COLUMNS), literal(now)).where(Event.id.in_(ids)),
+    ))
+    db.execute(insert(ArchivedRegistration).from_select(
+        REGISTRATION_COLUMNS,
+        select(*(Registration.__table__.c[name] for name in REGISTRATION_COLUMNS)).where(Registration.event_id.in_(ids)),
+    ))
+    db.execute(delete(Event).where(Event.id.in_(ids)).execution_options(synchronize_session=False))
+    db.commit()
+    return len(ids)
+
+
+def archive_completed(
+    db: Session,
+    now: Optional[datetime] = None,
+    after_days: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    max_chunks: Optional[int] = None,
+) -> int:
+    """Archive every event that ended more than `after_days` ago, one commit
+    per chunk; returns the number of events moved."""
+    now = now or datetime.utcnow()
+    after_days = settings.ARCHIVE_AFTER_DAYS if after_days is None else after_days
+    chunk_size = chunk_size or settings.ARCHIVE_CHUNK_SIZE
+    cutoff = now - timedelta(days=after_days)
+
+    moved = chunks = 0
+    while max_chunks is None or chunks < max_chunks:
+        count = archive_chunk(db, cutoff, chunk_size, now)
+        if not count:
+            break
+        moved += count
+        chunks += 1
+    if moved:
+        # Core deletes skip the ORM events that keep the search index current
+        search.search_index.invalidate()
+    return moved
+
+
+class ArchiveScheduler:
+    def __init__(self, session_factory: Callable[[], Session], interval_seconds: float):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        thread = threading.Thread(target=self._run, name="archive-scheduler", daemon=True)
+        thread.start()
+        self._thread = thread
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            return archive_completed(db)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                moved = self.run_once()
+                if moved:
+                    logger.info("archived %d events", moved)
+            except Exception:
+                logger.exception("archive run failed")
+            self._stop.wait(self.interval_seconds)
+
+
+_scheduler: Optional[ArchiveScheduler] = None
+
+
+def start_scheduler(session_factory: Callable[[], Session]) -> Optional[ArchiveScheduler]:
+    global _scheduler
+    if settings.ARCHIVE_INTERVAL_SECONDS <= 0:
+        return None
+    _scheduler = ArchiveScheduler(session_factory, settings.ARCHIVE_INTERVAL_SECONDS)
+    _scheduler.start()
+    return _scheduler
+
+
+def stop_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop()
+        _scheduler = None
+
+
+# -----------------------
+# HISTORY (read only)
+# -----------------------
+def _before_cursor(date_column, id_column, cursor: Optional[str]) -> list:
+    """Keyset condition for pages ordered by (date, id) descending."""
+    if not cursor:
+        return []
+    date, last_id = decode_cursor(cursor)
+    return [or_(date_column < date, and_(date_column == date, id_column < last_id))]
+
+
+def archived_events(db: Session, user, cursor: Optional[str], limit: int) -> Tuple[List[ArchivedEventOut], Optional[str]]:
+    """The organizer's archived events, newest first, and the next page's cursor."""
+    rows = db.query(ArchivedEvent).filter(
+        ArchivedEvent.organizer_id == user.id,
+        *_before_cursor(ArchivedEvent.event_date, ArchivedEvent.id, cursor),
+    ).order_by(ArchivedEvent.event_date.desc(), ArchivedEvent.id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].event_date, rows[-1].id)
+    items = [
+        ArchivedEventOut.model_construct(
+            id=e.id,
+            title=e.title,
+            description=e.description,
+            venue=e.venue,
+            speaker=e.speaker,
+            event_date=e.event_date,
+            total_seats=e.total_seats,
+            seats_sold=e.total_seats - e.seats_available,
+            archived_at=e.archived_at,
+        )
+        for e in rows
+    ]
+    return items, next_cursor
+
+
+def archived_participants(db: Session, event_id: int, user) -> List[ParticipantOut]:
+    owner = db.query(ArchivedEvent.organizer_id).filter(ArchivedEvent.id == event_id).scalar()
+    if owner is None or owner != user.id:
+        raise HTTPException(status_code=404, detail="Archived event not found or unauthorized")
+    rows = db.query(User.name, User.email, ArchivedRegistration.seats_booked, ArchivedRegistration.registered_at)\
+        .join(User, User.id == ArchivedRegistration.user_id)\
+        .filter(ArchivedRegistration.event_id == event_id)\
+        .order_by(ArchivedRegistration.id)\
+        .all()
+    return [
+        ParticipantOut.model_construct(
+            participant=r.name, email=r.email, seats_booked=r.seats_booked, registered_at=r.registered_at)
+        for r in rows
+    ]
+
+
+def registration_history(db: Session, user, cursor: Optional[str], limit: int) -> Tuple[List[MyRegistrationOut], Optional[str]]:
+    """The participant's registrations of archived events, newest first."""
+    rows = db.query(
+        ArchivedEvent.id, ArchivedEvent.title, ArchivedEvent.venue, ArchivedEvent.event_date, ArchivedEvent.speaker,
+        ArchivedRegistration.seats_booked, ArchivedRegistration.registered_at,
+    ).join(ArchivedEvent, ArchivedEvent.id == ArchivedRegistration.event_id).filter(
+        ArchivedRegistration.user_id == user.id,
+        *_before_cursor(ArchivedEvent.event_date, ArchivedEvent.id, cursor),
+    ).order_by(ArchivedEvent.event_date.desc(), ArchivedEvent.id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].event_date, rows[-1].id)
+    items = [
+        MyRegistrationOut.model_construct(
+            event_id=r.id,
+            title=r.title,
+            venue=r.venue,
+            date=r.event_date,
+            speaker=r.speaker,
+            seats_booked=r.seats_booked,
+            registered_at=r.registered_at,
+            status="completed",
+        )
+        for r in rows
+    ]
+    return items, next_cursor
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Archive completed events and their registrations.")
+    parser.add_argument("--after-days", type=int, default=settings.ARCHIVE_AFTER_DAYS,
+                        help="archive events that ended more than this many days ago")
+    parser.add_argument("--chunk-size", type=int, default=settings.ARCHIVE_CHUNK_SIZE,
+                        help="events moved per transaction")
+    parser.add_argument("--max-chunks", type=int, default=None, help="stop after this many chunks")
+    args = parser.parse_args(argv)
+
+    from app.db.session import SessionLocal
+
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        moved = archive_completed(db, after_days=args.after_days, chunk_size=args.chunk_size,
+                                  max_chunks=args.max_chunks)
+    logger.info("archived %d events in %.2fs", moved, time.perf_counter() - started)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+# app/services/booking.py
+"""Seat booking without a SELECT ... FOR UPDATE round trip.
+
+Seats are taken with one conditional UPDATE:
+
+    UPDATE events SET seats_available = seats_available - :n
+    WHERE id = :id AND seats_available >= :n AND event_date > :now
+
+so the event row is only locked for the rest of the (short) booking
+transaction and never read-then-written. Duplicate bookings are rejected by
+the uq_registration_user_event unique constraint (409), and ck_event_seats_nonneg
+remains as the last line of defence.
+"""
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.registration import Registration
+
+
+def take_seats(db: Session, event_id: int, seats: int, now: datetime) -> bool:
+    """Atomically decrement seats_available. False if the event is missing,
+    completed, or does not have `seats` seats left."""
+    try:
+        result = db.execute(
+            update(Event)
+            .where(Event.id == event_id, Event.seats_available >= seats, Event.event_date > now)
+            .values(seats_available=Event.seats_available - seats, version=Event.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+    except IntegrityError:
+        # ck_event_seats_nonneg fired; the WHERE clause should make this unreachable
+        raise HTTPException(status_code=400, detail="Not enough seats available")
+    return result.rowcount == 1
+
+
+def release_seats(db: Session, event_id: int, seats: int) -> None:
+    """Give seats back with an in-SQL increment (no read-modify-write race with take_seats)."""
+    db.execute(
+        update(Event)
+        .where(Event.id == event_id)
+        .values(seats_available=Event.seats_available + seats, version=Event.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def booking_failure(db: Session, event_id: int, now: datetime) -> HTTPException:
+    """Explain why take_seats() did not match a row."""
+    event_date = db.query(Event.event_date).filter(Event.id == event_id).scalar()
+    if event_date is None:
+        return HTTPException(status_code=404, detail="Event not found")
+    if now >= event_date:
+        return HTTPException(status_code=400, detail="This event is already completed. Registration is closed.")
+    return HTTPException(status_code=400, detail="Not enough seats available")
+
+
+def is_duplicate_registration(error: IntegrityError) -> bool:
+    """True if `error` is uq_registration_user_event firing. MySQL and
+    PostgreSQL name the constraint; SQLite lists its columns."""
+    message = str(error.orig)
+    return "uq_registration_user_event" in message or "registrations.user_id, registrations.event_id" in message
+
+
+def book_seats(db: Session, event_id: int, user_id: int, seats: int, now: datetime) -> Registration:
+    """Take seats and insert the registration in the caller's transaction.
+
+    Raises HTTPException on failure; the caller must roll back (or release
+    its savepoint) and is responsible for committing on success.
+    """
+    if seats < 1:
+        raise HTTPException(status_code=400, detail="seats must be at least 1")
+
+    # Seats first: taking the row lock before the insert avoids the InnoDB
+    # deadlock between the FK's shared lock and a later exclusive lock.
+    if not take_seats(db, event_id, seats, now):
+        raise booking_failure(db, event_id, now)
+
+    registration = Registration(user_id=user_id, event_id=event_id, seats_booked=seats)
+    db.add(registration)
+    try:
+        db.flush()
+    except IntegrityError as e:
+        if is_duplicate_registration(e):
+            raise HTTPException(status_code=409, detail="Already registered for this event")
+        raise  # e.g. the event or user was deleted meanwhile (foreign keys)
+    return registration
+
+
+class BookingRequest(NamedTuple):
+    index: int  # position in the client's request, used to report results
+    event_id: int
+    user_id: int
+    seats: int
+
+
+def book_many(db: Session, requests: List[BookingRequest], all_or_nothing: bool, now: datetime) -> Dict[int, Optional[str]]:
+    """Book several (event, user) pairs in the caller's transaction.
+
+    Rows are touched in (event_id, user_id) order, so concurrent bulk bookings
+    always lock event rows in the same order and cannot deadlock each other.
+    Returns {index: None on success, or the error detail}. With all_or_nothing
+    the first failure is raised and the caller must roll back; otherwise each
+    item runs in its own savepoint and failures are reported per item.
+    """
+    results: Dict[int, Optional[str]] = {}
+    for req in sorted(requests, key=lambda r: (r.event_id, r.user_id, r.index)):
+        if all_or_nothing:
+            try:
+                book_seats(db, req.event_id, req.user_id, req.seats, now)
+            except HTTPException as e:
+                raise HTTPException(
+                    status_code=e.status_code,
+                    detail={"errors": [{"index": req.index, "detail": e.detail}]},
+                )
+            results[req.index] = None
+            continue
+        try:
+            with db.begin_nested():
+                book_seats(db, req.event_id, req.user_id, req.seats, now)
+            results[req.index] = None
+        except HTTPException as e:
+            results[req.index] = e.detail
+    return results
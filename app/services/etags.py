@@ -0,0 +1,120 @@
+# app/services/etags.py
+"""Strong ETags and conditional GETs for the event endpoints.
+
+Single event: the tag is built from (id, version, status bucket), so it
+changes with every write (Event.version is bumped in SQL by updates and
+seat changes) and when the event moves from upcoming to soon to completed.
+
+Listing: one aggregate over the requested page (the same filters, cursor and
+LIMIT as the real query, but only id/version/event_date) fingerprints it.
+A matching If-None-Match is answered with 304 without fetching the page;
+otherwise the body is served from a small LRU of recently rendered pages
+keyed by that fingerprint, and only rendered on a miss.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.config import LazyInstance, settings
+from app.schemas import EventListItem
+from app.services.listing import SOON_WINDOW
+
+list_adapter = TypeAdapter(List[EventListItem])
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against `etag`."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def conditional_response(etag: str, body: Optional[bytes], next_cursor: Optional[str]) -> Response:
+    """304 when `body` is None, else the pre-rendered JSON body with its ETag."""
+    if body is None:
+        return not_modified(etag)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def event_etag(event_id: int, version: int, status: str) -> str:
+    return f'"e{event_id}-v{version}-{status}"'
+
+
+def page_fingerprint(db: Session, page_query, now: datetime) -> tuple:
+    """(count, sum(id), sum(version), sum(id * version), #completed, #soon) of the
+    page selected by `page_query` (a LIMITed select of id/version/event_date)."""
+    page = page_query.subquery()
+    return tuple(db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(page.c.id), 0),
+            func.coalesce(func.sum(page.c.version), 0),
+            func.coalesce(func.sum(page.c.id * page.c.version), 0),
+            func.coalesce(func.sum(case((page.c.event_date <= now, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((page.c.event_date <= now + SOON_WINDOW, 1), else_=0)), 0),
+        )
+    ).one())
+
+
+def list_etag(request_key: str, fingerprint: tuple) -> str:
+    digest = hashlib.sha1(f"{request_key}|{fingerprint}".encode()).hexdigest()
+    return f'"l{digest}"'
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    next_cursor: Optional[str]
+
+
+class PageCache:
+    """Thread-safe LRU of rendered listing pages, keyed by ETag."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._pages: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[CachedPage]:
+        with self._lock:
+            page = self._pages.get(etag)
+            if page is not None:
+                self._pages.move_to_end(etag)
+            return page
+
+    def put(self, etag: str, page: CachedPage) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._pages[etag] = page
+            self._pages.move_to_end(etag)
+            while len(self._pages) > self.maxsize:
+                self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+
+page_cache = LazyInstance(lambda: PageCache(settings.LIST_PAGE_CACHE_SIZE))
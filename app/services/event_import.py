@@ -0,0 +1,176 @@
+# app/services/event_import.py
+"""Bulk import of events from a CSV or NDJSON upload.
+
+The upload is read one row at a time from the spooled file, so memory does
+not grow with its size. Each row is validated against EventCreate (plus the
+column lengths and the future-date rule of create_event). Valid rows are
+inserted IMPORT_CHUNK_SIZE at a time with one executemany INSERT, which
+SQLAlchemy sends as multi-row INSERT statements, and one commit per chunk.
+A chunk the database rejects is rolled back and reported row by row; the
+others stay committed.
+
+Rows are numbered from 1, not counting the CSV header line.
+"""
+import codecs
+import csv
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.schemas import EventCreate
+from app.services import search
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_ROWS = 50000
+MAX_REPORTED_ERRORS = 1000
+FORMATS = {"csv": "csv", "ndjson": "ndjson", "jsonl": "ndjson"}
+# String column lengths, checked up front so one long title can't fail a whole chunk
+MAX_LENGTHS = {name: Event.__table__.c[name].type.length for name in ("title", "description", "venue", "speaker")}
+
+
+def detect_format(fmt: Optional[str], filename: Optional[str]) -> str:
+    """`fmt` if given, else the upload's file extension."""
+    name = fmt or (filename or "").rsplit(".", 1)[-1].lower()
+    if name not in FORMATS:
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'ndjson'")
+    return FORMATS[name]
+
+
+def _records(fileobj: BinaryIO, fmt: str) -> Iterator[Tuple[int, object]]:
+    """(row number, dict or parse error message) per data row."""
+    text = codecs.getreader("utf-8-sig")(fileobj, errors="replace")
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for number, record in enumerate(reader, start=1):
+            if None in record:
+                yield number, "too many columns"
+            else:
+                yield number, {k.strip(): (v if v != "" else None) for k, v in record.items() if k}
+        return
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, f"invalid JSON: {e}"
+            continue
+        yield number, record if isinstance(record, dict) else "each line must be a JSON object"
+
+
+def _error_text(e: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors())
+
+
+def validate(record: dict, now: datetime) -> EventCreate:
+    """The row as EventCreate, or ValueError with a readable reason."""
+    try:
+        event = EventCreate.model_validate(record)
+    except ValidationError as e:
+        raise ValueError(_error_text(e))
+    if event.event_date.tzinfo is not None:
+        event.event_date = event.event_date.astimezone(timezone.utc).replace(tzinfo=None)
+    if event.event_date <= now:
+        raise ValueError("event_date must be in the future")
+    if event.total_seats < 0:
+        raise ValueError("total_seats must not be negative")
+    for name, length in MAX_LENGTHS.items():
+        value = getattr(event, name)
+        if value is not None and len(value) > length:
+            raise ValueError(f"{name}: at most {length} characters")
+    return event
+
+
+def _insert_chunk(db: Session, rows: List[dict]) -> Optional[str]:
+    """Insert and commit one chunk; the database error message if it failed."""
+    try:
+        db.execute(insert(Event), rows)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("import chunk of %d rows rejected by the database", len(rows), exc_info=True)
+        # only DBAPIError wraps a driver exception in .orig
+        return f"database error: {type(getattr(e, 'orig', None) or e).__name__}"
+    return None
+
+
+def import_events(db: Session, fileobj: BinaryIO, fmt: str, user, now: datetime) -> dict:
+    started = time.perf_counter()
+    created = 0
+    failed = 0
+    errors: List[Dict[str, object]] = []
+
+    def report(number: int, detail: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({"row": number, "detail": detail})
+
+    chunk: List[dict] = []
+    numbers: List[int] = []
+
+    def flush() -> None:
+        nonlocal created
+        error = _insert_chunk(db, chunk)
+        if error is None:
+            created += len(chunk)
+        else:
+            for number in numbers:
+                report(number, error)
+        chunk.clear()
+        numbers.clear()
+
+    rows = 0
+    for number, record in _records(fileobj, fmt):
+        rows += 1
+        if rows > IMPORT_MAX_ROWS:
+            report(number, f"import limit of {IMPORT_MAX_ROWS} rows reached; remaining rows skipped")
+            break
+        if isinstance(record, str):
+            report(number, record)
+            continue
+        try:
+            event = validate(record, now)
+        except ValueError as e:
+            report(number, str(e))
+            continue
+        chunk.append({
+            "title": event.title,
+            "description": event.description,
+            "venue": event.venue,
+            "speaker": event.speaker,
+            "event_date": event.event_date,
+            "total_seats": event.total_seats,
+            "seats_available": event.total_seats,
+            "organizer_id": user.id,
+        })
+        numbers.append(number)
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            flush()
+    if chunk:
+        flush()
+
+    if created:
+        # Core inserts skip the ORM events that keep the search index current
+        search.search_index.invalidate()
+    seconds = time.perf_counter() - started
+    logger.info("organizer %s imported %d events, %d rows failed, in %.2fs", user.id, created, failed, seconds)
+    return {
+        "created": created,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }
@@ -0,0 +1,582 @@
+# app/services/events.py
+"""Event and registration operations shared by the sync and async routers.
+
+Every function takes a sync ``Session``. The sync routes in
+app.routers.events call them directly; the async routes in
+app.routers.events_async run them on an ``AsyncSession`` through
+``run_sync``, so the SQL is issued by the async driver without tying up a
+threadpool worker.
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.email_utils import NAME_TAG, Recipient
+from app.auth.security import normalize_email
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.user import Role, User
+from app.schemas import (
+    ArchivedEventOut,
+    BulkRegistrationRequest,
+    EventCreate,
+    EventOut,
+    EventSearchItem,
+    EventUpdate,
+    MyRegistrationOut,
+    MyRegistrationsOut,
+    OrganizerStatsOut,
+    ParticipantOut,
+    WaitlistPositionOut,
+)
+from app.services.booking import BookingRequest, book_many, book_seats, release_seats
+from app.services.listing import (
+    EVENT_FIELDS,
+    EventListParams,
+    EventStatus,
+    after_cursor,
+    encode_cursor,
+    event_filters,
+    parse_fields,
+    project_rows,
+    select_columns,
+    status_at,
+    status_filter,
+)
+from app.services import archive, etags, event_import, search, stats, waitlist
+from app.services.seat_updates import notify_seats
+from app.services.outbox import enqueue_batch, enqueue_email
+
+
+def now_utc() -> datetime:
+    return datetime.utcnow()
+
+def participant_recipients(db: Session, event_id: int) -> List[Recipient]:
+    """Name and email of everyone registered for an event, in one joined query."""
+    rows = db.query(User.email, User.name)\
+        .join(Registration, Registration.user_id == User.id)\
+        .filter(Registration.event_id == event_id)\
+        .all()
+    return [Recipient(r.email, r.name) for r in rows]
+
+def confirmation_email(event):
+    """(subject, body) sent right after a booking."""
+    subject = f"Registration confirmed: {event.title}"
+    body = f"""
+        <h3>Hello {NAME_TAG},</h3>
+        <p>You have registered for <strong>{event.title}</strong>.</p>
+        <p>Date & Time: {event.event_date}</p>
+        <p>Venue: {event.venue}</p>
+        <p>Speaker: {event.speaker}</p>
+        <p>We will remind you when it is less than 24 hours away.</p>
+        <p>By EventHub Team</p>
+    """
+    return subject, body
+
+def reminder_email(event):
+    """(subject, body) of the 24h reminder, sent by app.services.reminders."""
+    subject = f"Reminder: {event.title} is happening soon!"
+    body = f"""
+        <h3>Hello {NAME_TAG},</h3>
+        <p>We would like to remind you that the event you registered for is happening soon.</p>
+        <p>You have registered for <strong>{event.title}</strong>.</p>
+        <p>Date & Time: {event.event_date}</p>
+        <p>Venue: {event.venue}</p>
+        <p>Speaker: {event.speaker}</p>
+        <p>Don't forget it's less than 24 hours away!</p>
+        <p>By EventHub Team</p>
+    """
+    return subject, body
+
+def event_status(event: Event, now: Optional[datetime] = None) -> str:
+    """Return 'completed', 'soon' (<=24h), or 'upcoming'"""
+    return status_at(event.event_date, now or now_utc())
+
+
+# -----------------------
+# LIST / GET
+# -----------------------
+def page_query(db: Session, params: EventListParams, columns: list, now: datetime):
+    """The listing query for `params`, including the extra row that tells
+    whether a next page exists."""
+    query = db.query(*columns).filter(
+        *event_filters(params.organizer_id, params.venue, params.date_from, params.date_to, params.has_seats),
+        *status_filter(params.status, now),
+    )
+    keyset = after_cursor(params.cursor)
+    if keyset is not None:
+        query = query.filter(keyset)
+    return query.order_by(Event.event_date, Event.id).limit(params.limit + 1)
+
+def list_events(db: Session, params: EventListParams, now: Optional[datetime] = None) -> Tuple[list, Optional[str]]:
+    """One keyset page ordered by (event_date, id), plus the cursor of the next
+    page (None on the last page)."""
+    wanted = parse_fields(params.fields)
+    now = now or now_utc()
+    rows = page_query(db, params, select_columns(wanted), now).all()
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.event_date, last.id)
+
+    return project_rows(rows, wanted, now), next_cursor
+
+def list_events_conditional(db: Session, params: EventListParams, if_none_match: Optional[str]) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """(etag, JSON body or None if the client's copy is current, next cursor).
+
+    An aggregate over the page decides first; the page itself is only read
+    and rendered when neither the client nor etags.page_cache has it.
+    """
+    wanted = parse_fields(params.fields)
+    now = now_utc()
+    fingerprint = etags.page_fingerprint(db, page_query(db, params, [Event.id, Event.version, Event.event_date], now), now)
+    request_key = repr((
+        params.cursor, params.limit, params.organizer_id, params.venue, params.date_from,
+        params.date_to, params.has_seats, params.status, wanted,
+    ))
+    etag = etags.list_etag(request_key, fingerprint)
+    if etags.etag_matches(if_none_match, etag):
+        return etag, None, None
+    cached = etags.page_cache.get(etag)
+    if cached is not None:
+        return etag, cached.body, cached.next_cursor
+    items, next_cursor = list_events(db, params, now)
+    body = etags.list_adapter.dump_json(items, exclude_unset=True)
+    etags.page_cache.put(etag, etags.CachedPage(body, next_cursor))
+    return etag, body, next_cursor
+
+def search_events(db: Session, q: str, cursor: Optional[str], limit: int, fields: Optional[str]) -> Tuple[list, Optional[str]]:
+    """One page of events ranked by relevance to `q`, each with its `score`,
+    plus the cursor of the next page (None on the last page)."""
+    wanted = parse_fields(fields)
+    offset = search.decode_offset(cursor)
+    ranked, has_more = search.ranked_ids(db, q, offset, limit)
+    if not ranked:
+        return [], None
+    rows = db.query(*select_columns(wanted)).filter(Event.id.in_([event_id for event_id, _ in ranked])).all()
+    by_id = {row.id: row for row in rows}
+    ordered = [by_id[event_id] for event_id, _ in ranked if event_id in by_id]
+    items = project_rows(ordered, wanted, now_utc(), model=EventSearchItem)
+    scores = dict(ranked)
+    for item, row in zip(items, ordered):
+        item.score = round(scores[row.id], 4)
+    return items, str(offset + limit) if has_more else None
+
+def get_event(db: Session, event_id: int) -> EventOut:
+    return get_event_conditional(db, event_id, None)[1]
+
+def get_event_conditional(db: Session, event_id: int, if_none_match: Optional[str]) -> Tuple[str, Optional[EventOut]]:
+    """(etag, event), with event None when If-None-Match already has this version."""
+    row = db.query(*select_columns(list(EVENT_FIELDS)), Event.version).filter(Event.id == event_id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Event not found")
+    status = status_at(row.event_date, now_utc())
+    etag = etags.event_etag(row.id, row.version, status)
+    if etags.etag_matches(if_none_match, etag):
+        return etag, None
+    data = dict(row._mapping)
+    del data["version"]
+    return etag, EventOut.model_construct(**data, status=status)
+
+
+# -----------------------
+# CREATE (organizer)
+# -----------------------
+def create_event(db: Session, payload: EventCreate, user) -> dict:
+    # Enforce future date
+    if payload.event_date <= now_utc():
+        raise HTTPException(status_code=400, detail="event_date must be in the future")
+
+    event = Event(
+        title=payload.title,
+        description=getattr(payload, "description", None),
+        venue=payload.venue,
+        speaker=payload.speaker,
+        event_date=payload.event_date,
+        total_seats=payload.total_seats,
+        seats_available=payload.total_seats,
+        organizer_id=user.id
+    )
+    db.add(event)
+    db.commit()
+    db.refresh(event)
+    return {"msg": "Event created successfully", "event_id": event.id}
+
+
+def import_events(db: Session, fileobj, fmt: Optional[str], filename: Optional[str], user) -> dict:
+    fmt = event_import.detect_format(fmt, filename)
+    return event_import.import_events(db, fileobj, fmt, user, now_utc())
+
+
+# -----------------------
+# UPDATE (organizer) — BLOCK updates to completed events
+# -----------------------
+def update_event(db: Session, event_id: int, payload: EventUpdate, user) -> dict:
+    event = db.query(Event).filter(Event.id == event_id, Event.organizer_id == user.id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found or unauthorized")
+
+    # Block updating completed events (Option A)
+    if event.event_date <= now_utc():
+        raise HTTPException(status_code=403, detail="Cannot update an event that is already completed")
+
+    # Keep old values for email notifications
+    old_date = event.event_date
+    old_venue = event.venue
+
+    # Apply updates (only fields provided)
+    update_data = payload.dict(exclude_unset=True)
+    new_total = update_data.pop("total_seats", None)
+    for key, value in update_data.items():
+        setattr(event, key, value)
+    event.version = Event.version + 1
+
+    # Capacity change: move seats_available by the same amount, in SQL so
+    # concurrent bookings are not overwritten, and never below the seats sold
+    seats_added = 0
+    if new_total is not None and new_total != event.total_seats:
+        delta = new_total - event.total_seats
+        result = db.execute(
+            update(Event)
+            .where(Event.id == event_id, Event.seats_available + delta >= 0)
+            .values(total_seats=new_total, seats_available=Event.seats_available + delta)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise HTTPException(status_code=400, detail="total_seats cannot be lower than the seats already booked")
+        db.expire(event, ["total_seats", "seats_available"])
+        seats_added = delta
+
+    # Rescheduled: the 24h reminder has to go out again relative to the new date
+    if event.event_date != old_date:
+        db.execute(
+            update(Registration)
+            .where(Registration.event_id == event_id, Registration.reminder_sent == True)
+            .values(reminder_sent=False)
+            .execution_options(synchronize_session=False)
+        )
+
+    # Notify participants only if the event is still upcoming (should be, because we blocked completed)
+    subject = f"Event Updated: {event.title}"
+    body = f"""
+        <p>Hello {NAME_TAG},</p>
+        <p>We would like to inform you that the event you registered for has been updated.</p>
+        <p>The event <strong>{event.title}</strong> has been updated.</p>
+        <p><strong>Old Date:</strong> {old_date} | <strong>Old Speaker:</strong> {old_venue} | <strong> Old Venue:</strong> {old_venue}<br>
+        <strong>New Date:</strong> {event.event_date} | <strong>New Speaker:</strong> {event.speaker} | <strong>New Venue:</strong> {event.venue}</p>
+        <p><strong>New Venue:</strong> {event.venue}</p>
+        <p>By EventHub Team</p>
+    """
+    # Queued in the same transaction; the outbox workers send them in batches
+    enqueue_batch(db, participant_recipients(db, event_id), subject, body)
+
+    # new seats go to the waitlist first (they get the promotion email instead)
+    if seats_added > 0:
+        db.flush()
+        waitlist.promote(db, event_id, now_utc())
+
+    db.commit()
+    notify_seats(db, event_id)
+
+    return {"msg": "Event updated successfully!"}
+
+
+# -----------------------
+# DELETE (organizer)
+# -----------------------
+def delete_event(db: Session, event_id: int, user) -> dict:
+    event = db.query(Event).filter(Event.id == event_id, Event.organizer_id == user.id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found or unauthorized")
+
+    # Only send cancellation emails if the event is upcoming
+    now = now_utc()
+    should_notify = event.event_date > now
+
+    if should_notify:
+        subject = f"Event Cancelled: {event.title}"
+        body = f"""
+            <p>Hello {NAME_TAG},</p>
+            <p>We regret to inform you that the event you registered for has been cancelled.</p>
+            <p>The event <strong>{event.title}</strong> scheduled on
+            <strong>{event.event_date}</strong> has been cancelled by the organizer.</p>
+            <p>We apologize for the inconvenience </p>
+            <p>By EventHub Team</p>
+        """
+        # Queued in the same transaction as the delete
+        enqueue_batch(db, participant_recipients(db, event_id), subject, body)
+    else:
+        # Event already completed — do not notify participants
+        print("Event already completed — no cancellation emails sent.")
+
+    stats.record_event_deleted(db, event_id, event.organizer_id, should_notify, now)
+    # registrations and waitlist entries go with it (ON DELETE CASCADE)
+    db.delete(event)
+    db.commit()
+    notify_seats(db, event_id, deleted=True)
+
+    return {
+        "msg": f"Event '{event.title}' deleted",
+        "notified": should_notify
+    }
+
+
+# -----------------------
+# MY REGISTRATIONS (participant)
+# -----------------------
+def my_registrations(db: Session, user, status: Optional[EventStatus] = None) -> MyRegistrationsOut:
+    now = now_utc()
+    # one joined query instead of a lazy r.event load per registration
+    rows = db.query(
+        Event.id, Event.title, Event.venue, Event.event_date, Event.speaker,
+        Registration.seats_booked, Registration.registered_at,
+    ).join(Event, Event.id == Registration.event_id).filter(
+        Registration.user_id == user.id,
+        *status_filter(status, now),
+    ).all()
+    events = [
+        MyRegistrationOut.model_construct(
+            event_id=r.id,
+            title=r.title,
+            venue=r.venue,
+            date=r.event_date,
+            speaker=r.speaker,
+            seats_booked=r.seats_booked,
+            registered_at=r.registered_at,
+            status=status_at(r.event_date, now),
+        )
+        for r in rows
+    ]
+    return MyRegistrationsOut.model_construct(user=user.name, registered_events=events)
+
+
+def registration_history(db: Session, user, cursor: Optional[str], limit: int) -> Tuple[List[MyRegistrationOut], Optional[str]]:
+    return archive.registration_history(db, user, cursor, limit)
+
+
+# -----------------------
+# ARCHIVE (organizer, read only)
+# -----------------------
+def archived_events(db: Session, user, cursor: Optional[str], limit: int) -> Tuple[List[ArchivedEventOut], Optional[str]]:
+    return archive.archived_events(db, user, cursor, limit)
+
+def archived_participants(db: Session, event_id: int, user) -> List[ParticipantOut]:
+    return archive.archived_participants(db, event_id, user)
+
+
+# -----------------------
+# WAITLIST (participant)
+# -----------------------
+def join_waitlist(db: Session, event_id: int, seats: int, user) -> WaitlistPositionOut:
+    return waitlist.join(db, event_id, seats, user, now_utc())
+
+def waitlist_position(db: Session, event_id: int, user) -> WaitlistPositionOut:
+    return waitlist.position(db, event_id, user)
+
+def leave_waitlist(db: Session, event_id: int, user) -> dict:
+    return waitlist.leave(db, event_id, user)
+
+
+# -----------------------
+# DASHBOARD (organizer)
+# -----------------------
+def organizer_stats(db: Session, user, days: int) -> OrganizerStatsOut:
+    return stats.organizer_stats(db, user, days, now_utc())
+
+
+# -----------------------
+# BULK REGISTER (participant for self, organizer for a group)
+# -----------------------
+def register_bulk(db: Session, payload: BulkRegistrationRequest, user) -> dict:
+    """Book many events in one transaction.
+
+    Participants book for themselves (user_email empty). Organizers book
+    participants (user_email required) into their own events.
+    """
+    now = now_utc()
+    is_organizer = user.role == Role.organizer
+    items = payload.items
+    errors = {}
+
+    # resolve every referenced user and event with one query each
+    emails = {normalize_email(i.user_email) for i in items if i.user_email}
+    users = {}
+    if emails:
+        users = {
+            u.email: u for u in db.query(User.id, User.email, User.name, User.role).filter(User.email.in_(emails))
+        }
+    event_ids = {i.event_id for i in items}
+    events = {
+        e.id: e for e in db.query(Event.id, Event.organizer_id, Event.title, Event.event_date, Event.venue, Event.speaker)
+        .filter(Event.id.in_(event_ids))
+    }
+
+    requests = []
+    targets = {}
+    for index, item in enumerate(items):
+        event = events.get(item.event_id)
+        if event is None:
+            errors[index] = "Event not found"
+            continue
+        if is_organizer:
+            target = users.get(normalize_email(item.user_email)) if item.user_email else None
+            if event.organizer_id != user.id:
+                errors[index] = "Not your event"
+            elif target is None:
+                errors[index] = "user_email must be a registered participant"
+            elif Role(target.role) != Role.participant:
+                errors[index] = "Only participants can be registered"
+        else:
+            target = user
+            if item.user_email and normalize_email(item.user_email) != user.email:
+                errors[index] = "Participants can only register themselves"
+        if index not in errors:
+            targets[index] = target
+            requests.append(BookingRequest(index, item.event_id, target.id, item.seats))
+
+    if payload.all_or_nothing and errors:
+        raise HTTPException(status_code=400, detail={"errors": [{"index": i, "detail": d} for i, d in sorted(errors.items())]})
+
+    try:
+        results = book_many(db, requests, payload.all_or_nothing, now)
+    except HTTPException:
+        db.rollback()
+        raise
+    errors.update({i: d for i, d in results.items() if d is not None})
+
+    # one outbox insert and one stats upsert per event for all confirmations
+    booked_by_event = {}
+    tallies = {}
+    for index, detail in results.items():
+        if detail is None:
+            event_id = items[index].event_id
+            booked_by_event.setdefault(event_id, []).append(targets[index])
+            tally = tallies.get(event_id, stats.Tally(events[event_id].organizer_id, 0, 0))
+            tallies[event_id] = tally._replace(registrations=tally.registrations + 1, seats=tally.seats + items[index].seats)
+    stats.record_bookings(db, tallies, now)
+    for event_id, booked in booked_by_event.items():
+        subject, body = confirmation_email(events[event_id])
+        enqueue_batch(db, [Recipient(t.email, t.name) for t in booked], subject, body)
+    db.commit()
+    for event_id in booked_by_event:
+        notify_seats(db, event_id)
+
+    return {
+        "booked": sum(len(b) for b in booked_by_event.values()),
+        "failed": len(errors),
+        "results": [
+            {
+                "index": index,
+                "event_id": item.event_id,
+                "seats": item.seats,
+                "status": "failed" if index in errors else "booked",
+                "detail": errors.get(index),
+            }
+            for index, item in enumerate(items)
+        ],
+    }
+
+
+# -----------------------
+# REGISTER (participant)
+# -----------------------
+def register(db: Session, event_id: int, seats: int, user) -> dict:
+    now = now_utc()
+    # plain read (no lock) for the response and the reminder text
+    event = db.query(Event.id, Event.title, Event.event_date, Event.venue, Event.speaker, Event.organizer_id)\
+        .filter(Event.id == event_id)\
+        .first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    try:
+        # conditional seat decrement + insert; no FOR UPDATE, no duplicate pre-check
+        book_seats(db, event_id, user.id, seats, now)
+        stats.record_bookings(db, {event_id: stats.Tally(event.organizer_id, 1, seats)}, now)
+
+        # confirmation queued in the booking transaction; the 24h reminder
+        # is sent later by the reminder scheduler
+        subject, body = confirmation_email(event)
+        enqueue_email(db, user.email, subject, body, name=user.name)
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    notify_seats(db, event_id)
+
+    return {
+        "msg": f"Registered successfully for {event.title}",
+        "event_id": event.id,
+        "status": status_at(event.event_date, now)
+    }
+
+
+# -----------------------
+# VIEW REGISTRATIONS (organizer)
+# -----------------------
+def event_registrations(db: Session, event_id: int, user) -> List[ParticipantOut]:
+    event = db.query(Event.id).filter(Event.id == event_id, Event.organizer_id == user.id).first()
+    if not event:
+        raise HTTPException(status_code=403, detail="Not your event")
+
+    rows = db.query(
+        User.name, User.email, Registration.seats_booked, Registration.registered_at
+    ).join(User, User.id == Registration.user_id).filter(Registration.event_id == event_id).all()
+    return [
+        ParticipantOut.model_construct(
+            participant=r.name,
+            email=r.email,
+            seats_booked=r.seats_booked,
+            registered_at=r.registered_at,
+        )
+        for r in rows
+    ]
+
+
+# -----------------------
+# CANCEL REGISTRATION (participant)
+# -----------------------
+def cancel(db: Session, event_id: int, user) -> dict:
+    # check registration exists
+    registration = db.query(Registration).filter(
+        Registration.event_id == event_id,
+        Registration.user_id == user.id
+    ).first()
+
+    if not registration:
+        raise HTTPException(
+            status_code=404,
+            detail="You are not registered for this event"
+        )
+
+    # fetch the event
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    # Prevent cancellation for completed events
+    now = now_utc()
+    if event.event_date <= now:
+        raise HTTPException(status_code=400, detail="Cannot cancel registration for completed events")
+
+    # increase the available seats (in SQL, so concurrent bookings are not overwritten)
+    release_seats(db, event_id, registration.seats_booked)
+    stats.record_cancellations(db, {event_id: stats.Tally(event.organizer_id, 1, registration.seats_booked)}, now)
+
+    # delete the registration, then hand the freed seats to the waitlist
+    db.delete(registration)
+    db.flush()
+    waitlist.promote(db, event_id, now)
+    db.commit()
+    notify_seats(db, event_id)
+
+    # event was expired by the commit, so this reloads the current seat count
+    return {
+        "msg": f"Your registration for '{event.title}' has been cancelled",
+        "seats_available": event.seats_available
+    }
@@ -0,0 +1,78 @@
+# app/services/export.py
+"""Streaming CSV / NDJSON export of an event's registrations.
+
+Rows come from one users-joined query read through a server-side cursor
+(``stream_results`` + ``yield_per``) and are written out one partition at a
+time, so memory stays flat however large the event is. The generator opens
+its own session because it keeps running after the route has returned.
+"""
+import csv
+import io
+import json
+from typing import Callable, Iterator
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.user import User
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ("participant", "email", "seats_booked", "registered_at")
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def registrations_query(event_id: int):
+    return select(User.name, User.email, Registration.seats_booked, Registration.registered_at)\
+        .join(User, User.id == Registration.user_id)\
+        .where(Registration.event_id == event_id)\
+        .order_by(Registration.id)\
+        .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+
+
+def _csv_chunk(rows, header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(
+        (r.name, r.email, r.seats_booked, r.registered_at.isoformat() if r.registered_at else "")
+        for r in rows
+    )
+    return buffer.getvalue()
+
+
+def _ndjson_chunk(rows, header: bool) -> str:
+    return "".join(
+        json.dumps({
+            "participant": r.name,
+            "email": r.email,
+            "seats_booked": r.seats_booked,
+            "registered_at": r.registered_at.isoformat() if r.registered_at else None,
+        }) + "\n"
+        for r in rows
+    )
+
+
+def stream_registrations(session_factory: Callable[[], Session], event_id: int, fmt: str) -> Iterator[str]:
+    """Yield the export one EXPORT_BATCH_SIZE partition at a time."""
+    write = _csv_chunk if fmt == "csv" else _ndjson_chunk
+    with session_factory() as db:
+        result = db.execute(registrations_query(event_id))
+        wrote_header = False
+        for rows in result.partitions():
+            yield write(rows, header=not wrote_header)
+            wrote_header = True
+        if not wrote_header and fmt == "csv":
+            yield write([], header=True)
+
+
+def check_export(db: Session, event_id: int, fmt: str, user) -> None:
+    """Validate the request before any byte is streamed (errors can't be sent afterwards)."""
+    if fmt not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'ndjson'")
+    owner = db.query(Event.organizer_id).filter(Event.id == event_id).scalar()
+    if owner is None or owner != user.id:
+        raise HTTPException(status_code=403, detail="Not your event")
@@ -0,0 +1,282 @@
+# app/services/idempotency.py
+"""Idempotency-Key support for bookings, cancellations and event creation.
+
+A client that retries with the same ``Idempotency-Key`` gets the stored
+response of the first attempt (status and body, plus an
+``Idempotent-Replayed: true`` header) instead of running the operation
+again, so a retried booking neither takes another transaction on the event
+row nor turns into "Already registered".
+
+Keys are scoped per user and bound to a fingerprint of the request (method,
+path, query and body); reusing one for a different request is a 422. While
+the first attempt is still running, duplicates get 409 with Retry-After.
+Outcomes below 500 are stored, server errors are not, so those retries run
+again.
+
+Records live in a bounded in-process LRU (IDEMPOTENCY_CACHE_SIZE, expiring
+after IDEMPOTENCY_TTL_SECONDS). With IDEMPOTENCY_STORE=db they are also
+written to ``idempotency_keys``, which makes replays and the in-progress
+guard work across processes; the LRU still answers repeated hits locally.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from fastapi import Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.config import LazyInstance, settings
+from app.db.session import SessionLocal
+from app.models.idempotency import IdempotencyRecord
+
+RETRY_AFTER_SECONDS = 1
+# DB store: a key still marked in progress after this long belongs to a crashed worker
+IN_PROGRESS_LEASE_SECONDS = 60
+PURGE_EVERY = 1000  # DB store: delete expired rows every N new keys
+
+
+class Outcome(NamedTuple):
+    fingerprint: str
+    status_code: Optional[int]  # None while the first request is running
+    body: Optional[bytes]
+
+
+class LocalStore:
+    """Thread-safe LRU of outcomes with a TTL, keyed by (user_id, key)."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, scope: tuple) -> Optional[Outcome]:
+        with self._lock:
+            item = self._data.get(scope)
+            if item is None:
+                return None
+            outcome, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[scope]
+                return None
+            self._data.move_to_end(scope)
+            return outcome
+
+    def reserve(self, scope: tuple, fingerprint: str) -> Optional[Outcome]:
+        """Claim `scope` for a new request; returns the existing outcome instead if there is one."""
+        with self._lock:
+            item = self._data.get(scope)
+            if item is not None and item[1] >= time.monotonic():
+                return item[0]
+            self._put(scope, Outcome(fingerprint, None, None))
+            return None
+
+    def put(self, scope: tuple, outcome: Outcome) -> None:
+        with self._lock:
+            self._put(scope, outcome)
+
+    def _put(self, scope: tuple, outcome: Outcome) -> None:
+        self._data[scope] = (outcome, time.monotonic() + self.ttl_seconds)
+        self._data.move_to_end(scope)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, scope: tuple) -> None:
+        with self._lock:
+            self._data.pop(scope, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class DatabaseStore:
+    """The same operations on the idempotency_keys table, each in its own
+    short transaction (never the request's)."""
+
+    def __init__(self, session_factory, ttl_seconds: float):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self._inserted = 0
+
+    def reserve(self, scope: tuple, fingerprint: str) -> Optional[Outcome]:
+        user_id, key = scope
+        now = datetime.utcnow()
+        with self.session_factory() as db:
+            db.add(IdempotencyRecord(user_id=user_id, key=key, fingerprint=fingerprint, created_at=now))
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+            else:
+                self._inserted += 1
+                if self._inserted % PURGE_EVERY == 0:
+                    self.purge(db, now)
+                return None
+            row = db.execute(
+                select(IdempotencyRecord.fingerprint, IdempotencyRecord.status_code,
+                       IdempotencyRecord.body, IdempotencyRecord.created_at)
+                .where(IdempotencyRecord.user_id == user_id, IdempotencyRecord.key == key)
+            ).first()
+            expired = row is not None and (
+                row.created_at < now - timedelta(seconds=self.ttl_seconds)
+                or (row.status_code is None and row.created_at < now - timedelta(seconds=IN_PROGRESS_LEASE_SECONDS))
+            )
+            if row is None or expired:
+                # expired, abandoned or released meanwhile: take the key over
+                db.execute(delete(IdempotencyRecord)
+                           .where(IdempotencyRecord.user_id == user_id, IdempotencyRecord.key == key))
+                db.commit()
+                return self.reserve(scope, fingerprint)
+            body = row.body.encode() if row.body is not None else None
+            return Outcome(row.fingerprint, row.status_code, body)
+
+    def complete(self, scope: tuple, outcome: Outcome) -> None:
+        user_id, key = scope
+        with self.session_factory() as db:
+            db.execute(
+                update(IdempotencyRecord)
+                .where(IdempotencyRecord.user_id == user_id, IdempotencyRecord.key == key)
+                .values(status_code=outcome.status_code, body=outcome.body.decode())
+            )
+            db.commit()
+
+    def release(self, scope: tuple) -> None:
+        user_id, key = scope
+        with self.session_factory() as db:
+            db.execute(delete(IdempotencyRecord)
+                       .where(IdempotencyRecord.user_id == user_id, IdempotencyRecord.key == key))
+            db.commit()
+
+    def purge(self, db, now: datetime) -> None:
+        db.execute(delete(IdempotencyRecord)
+                   .where(IdempotencyRecord.created_at < now - timedelta(seconds=self.ttl_seconds)))
+        db.commit()
+
+
+local_store = LazyInstance(lambda: LocalStore(settings.IDEMPOTENCY_CACHE_SIZE, settings.IDEMPOTENCY_TTL_SECONDS))
+db_store = LazyInstance(lambda: DatabaseStore(SessionLocal, settings.IDEMPOTENCY_TTL_SECONDS))
+
+
+def _uses_db() -> bool:
+    return settings.IDEMPOTENCY_STORE == "db"
+
+
+# -----------------------
+# PER-REQUEST HANDLE
+# -----------------------
+class IdempotentRequest:
+    """The Idempotency-Key of one request plus its fingerprint. Routes wrap
+    the service call with run() (sync routes) or arun() (async routes)."""
+
+    def __init__(self, key: str, fingerprint: str):
+        self.key = key
+        self.fingerprint = fingerprint
+
+    def _begin(self, scope: tuple) -> Optional[JSONResponse]:
+        outcome = local_store.get(scope)
+        if outcome is None or outcome.status_code is None:
+            outcome = db_store.reserve(scope, self.fingerprint) if _uses_db() else None
+            if outcome is None:
+                outcome = local_store.reserve(scope, self.fingerprint)
+        return self._replay(outcome) if outcome is not None else None
+
+    def _replay(self, outcome: Outcome) -> JSONResponse:
+        if outcome.fingerprint != self.fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+        if outcome.status_code is None:
+            raise HTTPException(
+                status_code=409,
+                detail="A request with this Idempotency-Key is still being processed",
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+        return JSONResponse(
+            content=json.loads(outcome.body),
+            status_code=outcome.status_code,
+            headers={"Idempotent-Replayed": "true"},
+        )
+
+    def _finish(self, scope: tuple, status_code: int, content) -> None:
+        if status_code >= 500:
+            self._abort(scope)
+            return
+        outcome = Outcome(self.fingerprint, status_code, json.dumps(jsonable_encoder(content)).encode())
+        local_store.put(scope, outcome)
+        if _uses_db():
+            db_store.complete(scope, outcome)
+
+    def _abort(self, scope: tuple) -> None:
+        local_store.discard(scope)
+        if _uses_db():
+            db_store.release(scope)
+
+    def run(self, user, status_code: int, call: Callable[[], object]):
+        scope = (user.id, self.key)
+        replay = self._begin(scope)
+        if replay is not None:
+            return replay
+        try:
+            result = call()
+        except HTTPException as e:
+            self._finish(scope, e.status_code, {"detail": e.detail})
+            raise
+        except BaseException:
+            self._abort(scope)
+            raise
+        self._finish(scope, status_code, result)
+        return result
+
+    async def arun(self, user, status_code: int, call: Callable[[], Awaitable[object]]):
+        scope = (user.id, self.key)
+        blocking = run_in_threadpool if _uses_db() else _inline
+        replay = await blocking(self._begin, scope)
+        if replay is not None:
+            return replay
+        try:
+            result = await call()
+        except HTTPException as e:
+            await blocking(self._finish, scope, e.status_code, {"detail": e.detail})
+            raise
+        except BaseException:
+            await blocking(self._abort, scope)
+            raise
+        await blocking(self._finish, scope, status_code, result)
+        return result
+
+
+async def _inline(fn, *args):
+    return fn(*args)
+
+
+async def idempotency_key(
+    request: Request,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+) -> Optional[IdempotentRequest]:
+    """Dependency: None without the header, else the request's IdempotentRequest."""
+    if not idempotency_key:
+        return None
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.url.path}?{sorted(request.query_params.multi_items())}\n".encode())
+    digest.update(await request.body())
+    return IdempotentRequest(idempotency_key, digest.hexdigest())
+
+
+def idempotent(idem: Optional[IdempotentRequest], user, status_code: int, call: Callable[[], object]):
+    """Run `call` once per Idempotency-Key (or plainly when there is none)."""
+    if idem is None:
+        return call()
+    return idem.run(user, status_code, call)
+
+
+async def idempotent_async(idem: Optional[IdempotentRequest], user, status_code: int, call: Callable[[], Awaitable[object]]):
+    if idem is None:
+        return await call()
+    return await idem.arun(user, status_code, call)
@@ -0,0 +1,168 @@
+# app/services/listing.py
+import base64
+import enum
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, Query
+from sqlalchemy import and_, or_
+
+from app.models.event import Event
+from app.schemas import EventListItem
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+SOON_WINDOW = timedelta(hours=24)
+
+
+class EventStatus(str, enum.Enum):
+    completed = "completed"
+    soon = "soon"
+    upcoming = "upcoming"
+
+
+def status_at(event_date: datetime, now: datetime) -> str:
+    """Return 'completed', 'soon' (<=24h), or 'upcoming' relative to `now`."""
+    if event_date <= now:
+        return EventStatus.completed.value
+    if event_date <= now + SOON_WINDOW:
+        return EventStatus.soon.value
+    return EventStatus.upcoming.value
+
+
+def status_filter(status: Optional[EventStatus], now: datetime) -> list:
+    """Translate a status bucket into an event_date range so it can use the
+    event_date indexes instead of being evaluated per row in Python."""
+    if status is None:
+        return []
+    if status == EventStatus.completed:
+        return [Event.event_date <= now]
+    if status == EventStatus.soon:
+        return [Event.event_date > now, Event.event_date <= now + SOON_WINDOW]
+    return [Event.event_date > now + SOON_WINDOW]
+
+
+class EventListParams:
+    """Query parameters of the event listing, shared by the sync and async routes."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        organizer_id: Optional[int] = None,
+        venue: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        has_seats: Optional[bool] = None,
+        status: Optional[EventStatus] = None,
+        fields: Optional[str] = None,
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.organizer_id = organizer_id
+        self.venue = venue
+        self.date_from = date_from
+        self.date_to = date_to
+        self.has_seats = has_seats
+        self.status = status
+        self.fields = fields
+
+
+# Columns a client may ask for through ?fields=
+EVENT_FIELDS = {
+    "id": Event.id,
+    "title": Event.title,
+    "description": Event.description,
+    "venue": Event.venue,
+    "speaker": Event.speaker,
+    "event_date": Event.event_date,
+    "total_seats": Event.total_seats,
+    "seats_available": Event.seats_available,
+    "organizer_id": Event.organizer_id,
+}
+COMPUTED_FIELDS = {"status"}
+ALL_FIELDS = list(EVENT_FIELDS) + sorted(COMPUTED_FIELDS)
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """Turn '?fields=id,title' into a list of known field names (all fields if empty)."""
+    if not fields:
+        return list(ALL_FIELDS)
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in EVENT_FIELDS and f not in COMPUTED_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def encode_cursor(event_date: datetime, event_id: int) -> str:
+    raw = f"{event_date.isoformat()}|{event_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date_part, id_part = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+        return datetime.fromisoformat(date_part), int(id_part)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def event_filters(
+    organizer_id: Optional[int] = None,
+    venue: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    has_seats: Optional[bool] = None,
+) -> list:
+    """SQL predicates for the listing filters. Equality filters go first so the
+    composite (organizer_id|venue, event_date, id) indexes can be used."""
+    filters = []
+    if organizer_id is not None:
+        filters.append(Event.organizer_id == organizer_id)
+    if venue:
+        filters.append(Event.venue == venue)
+    if date_from is not None:
+        filters.append(Event.event_date >= date_from)
+    if date_to is not None:
+        filters.append(Event.event_date <= date_to)
+    if has_seats is True:
+        filters.append(Event.seats_available > 0)
+    elif has_seats is False:
+        filters.append(Event.seats_available <= 0)
+    return filters
+
+
+def after_cursor(cursor: Optional[str]):
+    """Keyset predicate: rows strictly after (event_date, id) of the cursor."""
+    if not cursor:
+        return None
+    cursor_date, cursor_id = decode_cursor(cursor)
+    return or_(
+        Event.event_date > cursor_date,
+        and_(Event.event_date == cursor_date, Event.id > cursor_id),
+    )
+
+
+def project_rows(rows, wanted: List[str], now: datetime, model=EventListItem) -> list:
+    """Rows from select_columns() as `model` instances with only the requested
+    fields set (serialize with exclude_unset)."""
+    result = []
+    for row in rows:
+        data = row._mapping
+        item = {}
+        for name in wanted:
+            if name == "status":
+                item["status"] = status_at(row.event_date, now)
+            else:
+                item[name] = data[name]
+        result.append(model.model_construct(**item))
+    return result
+
+
+def select_columns(fields: List[str]) -> list:
+    """Columns to SELECT for the requested fields. id and event_date are always
+    loaded because the cursor (and status) are built from them."""
+    names = ["id", "event_date"] + [f for f in fields if f in EVENT_FIELDS and f not in ("id", "event_date")]
+    return [EVENT_FIELDS[name].label(name) for name in names]
@@ -0,0 +1,249 @@
+# app/services/outbox.py
+"""Durable email outbox.
+
+Request handlers only insert rows into ``email_outbox`` as part of their own
+transaction. A small pool of worker threads claims pending rows, groups them
+into batches that share subject/body/send_at, and hands each batch to the
+configured transport in a single call. Failed batches are retried with
+exponential backoff until OUTBOX_MAX_ATTEMPTS is reached; when a transport
+reports a partial delivery, only the recipients it did not reach are retried.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional, Union
+
+from sqlalchemy import and_, event, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.email_utils import EmailTransport, PartialDeliveryError, Recipient, get_transport
+from app.metrics import record_email_batch
+from app.models.outbox import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+# seconds after which a batch stuck in 'sending' (crashed worker) is claimed again
+CLAIM_LEASE_SECONDS = 300
+MAX_BACKOFF_SECONDS = 3600
+
+
+def enqueue_batch(
+    db: Session,
+    recipients: Iterable[Union[Recipient, tuple]],
+    subject: str,
+    body: str,
+    send_at: Optional[int] = None,
+) -> int:
+    """Add one outbox row per recipient to the current transaction.
+
+    `body` and `subject` may contain app.email_utils.NAME_TAG, which is replaced
+    by each recipient's name at send time. Nothing is sent until the caller commits.
+    """
+    now = datetime.utcnow()
+    rows = []
+    for r in recipients:
+        if not isinstance(r, Recipient):
+            r = Recipient(*r)
+        rows.append({
+            "to_email": r.email,
+            "to_name": r.name,
+            "subject": subject,
+            "body": body,
+            "send_at": send_at,
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": now,
+            "created_at": now,
+        })
+    if rows:
+        db.execute(insert(EmailOutbox), rows)
+        db.info["outbox_pending"] = True
+    return len(rows)
+
+
+def enqueue_email(db: Session, email: str, subject: str, body: str, name: Optional[str] = None, send_at: Optional[int] = None) -> int:
+    return enqueue_batch(db, [Recipient(email, name)], subject, body, send_at)
+
+
+class OutboxWorkerPool:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        transport_factory: Callable[[], EmailTransport] = get_transport,
+        workers: int = 2,
+        batch_size: int = 500,
+        poll_seconds: float = 5.0,
+        max_attempts: int = 5,
+        backoff_seconds: float = 10.0,
+    ):
+        self.session_factory = session_factory
+        self.transport_factory = transport_factory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    # -----------------------
+    # lifecycle
+    # -----------------------
+    def start(self) -> None:
+        self._stop.clear()
+        for i in range(self.workers):
+            t = threading.Thread(target=self._run, name=f"outbox-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                sent = self.drain_once()
+            except Exception:
+                logger.exception("outbox worker failed")
+                sent = 0
+            if sent == 0:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+    # -----------------------
+    # draining
+    # -----------------------
+    def drain_once(self) -> int:
+        """Claim up to batch_size due rows and send them. Returns the number of rows processed."""
+        with self.session_factory() as db:
+            rows = self._claim(db)
+            if not rows:
+                return 0
+            groups = defaultdict(list)
+            for row in rows:
+                groups[(row.subject, row.body, row.send_at)].append(row)
+            transport = self.transport_factory()
+            for (subject, body, send_at), group in groups.items():
+                recipients = [Recipient(r.to_email, r.to_name) for r in group]
+                start = time.perf_counter()
+                error = None
+                delivered = len(group)
+                try:
+                    transport.send_batch(recipients, subject, body, send_at)
+                except PartialDeliveryError as e:
+                    error, delivered = e.error, e.delivered
+                except Exception as e:
+                    error, delivered = e, 0
+                record_email_batch(transport, delivered, len(group) - delivered, time.perf_counter() - start)
+                if delivered:
+                    self._mark_sent(db, group[:delivered])
+                if error is not None:
+                    logger.warning("send failed for %d of %d recipients: %s", len(group) - delivered, len(group), error)
+                    self._mark_failed(db, group[delivered:], str(error))
+                db.commit()
+            return len(rows)
+
+    def drain(self) -> int:
+        """Send everything that is currently due (used by tests and benchmarks)."""
+        total = 0
+        while True:
+            n = self.drain_once()
+            if n == 0:
+                return total
+            total += n
+
+    def _claim(self, db: Session) -> list:
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=CLAIM_LEASE_SECONDS)
+        claimable = or_(
+            and_(EmailOutbox.status == "pending", EmailOutbox.next_attempt_at <= now),
+            and_(EmailOutbox.status == "sending", EmailOutbox.claimed_at < stale),
+        )
+        ids = db.scalars(
+            select(EmailOutbox.id).where(claimable).order_by(EmailOutbox.id).limit(self.batch_size)
+        ).all()
+        if not ids:
+            return []
+        # the status condition is re-checked so concurrent workers never claim the same row
+        token = uuid.uuid4().hex
+        db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(ids), claimable)
+            .values(status="sending", claim_token=token, claimed_at=now)
+        )
+        db.commit()
+        return db.execute(
+            select(
+                EmailOutbox.id, EmailOutbox.to_email, EmailOutbox.to_name, EmailOutbox.subject,
+                EmailOutbox.body, EmailOutbox.send_at, EmailOutbox.attempts,
+            ).where(EmailOutbox.claim_token == token)
+        ).all()
+
+    def _mark_sent(self, db: Session, group: list) -> None:
+        db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_([r.id for r in group]))
+            .values(status="sent", sent_at=datetime.utcnow(), claim_token=None)
+        )
+
+    def _mark_failed(self, db: Session, group: list, error: str) -> None:
+        now = datetime.utcnow()
+        by_attempts = defaultdict(list)
+        for r in group:
+            by_attempts[r.attempts + 1].append(r.id)
+        for attempts, ids in by_attempts.items():
+            if attempts >= self.max_attempts:
+                values = {"status": "failed"}
+            else:
+                delay = min(self.backoff_seconds * (2 ** (attempts - 1)), MAX_BACKOFF_SECONDS)
+                values = {"status": "pending", "next_attempt_at": now + timedelta(seconds=delay)}
+            db.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_(ids))
+                .values(attempts=attempts, last_error=error[:500], claim_token=None, **values)
+            )
+
+
+_pool: Optional[OutboxWorkerPool] = None
+
+
+def start_workers(session_factory: Callable[[], Session]) -> Optional[OutboxWorkerPool]:
+    global _pool
+    if settings.OUTBOX_WORKERS <= 0:
+        return None
+    _pool = OutboxWorkerPool(
+        session_factory,
+        workers=settings.OUTBOX_WORKERS,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_seconds=settings.OUTBOX_POLL_SECONDS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+        backoff_seconds=settings.OUTBOX_BACKOFF_SECONDS,
+    )
+    _pool.start()
+    return _pool
+
+
+def stop_workers() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.stop()
+        _pool = None
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_workers(session: Session) -> None:
+    # new outbox rows are visible now; don't wait for the next poll
+    if session.info.pop("outbox_pending", False) and _pool is not None:
+        _pool.wake()
@@ -0,0 +1,114 @@
+# app/services/reminders.py
+"""Periodic 24h reminder job.
+
+Every REMINDER_INTERVAL_SECONDS the scheduler picks the events starting in
+the next 24 hours, takes their registrations with reminder_sent = false
+(ix_registrations_event_reminder), queues one outbox batch per event and
+flips reminder_sent for those rows in a single UPDATE. Because the date is
+read when the reminder is due, rescheduled events are reminded at the right
+time; update_event resets reminder_sent when the date moves.
+"""
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.email_utils import Recipient
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.user import User
+from app.services.events import reminder_email
+from app.services.outbox import enqueue_batch
+
+logger = logging.getLogger(__name__)
+
+REMINDER_WINDOW = timedelta(hours=24)
+
+
+def send_due_reminders(db: Session, now: Optional[datetime] = None) -> int:
+    """Queue reminders for every registration now due. Commits once per event;
+    returns the number of reminders queued."""
+    now = now or datetime.utcnow()
+    events = db.query(Event.id, Event.title, Event.event_date, Event.venue, Event.speaker)\
+        .filter(Event.event_date > now, Event.event_date <= now + REMINDER_WINDOW)\
+        .order_by(Event.event_date, Event.id)\
+        .all()
+
+    queued = 0
+    for event in events:
+        # SKIP LOCKED lets several app instances run the job without double-sending
+        rows = db.query(Registration.id, User.email, User.name)\
+            .join(User, User.id == Registration.user_id)\
+            .filter(Registration.event_id == event.id, Registration.reminder_sent == False)\
+            .with_for_update(skip_locked=True, of=Registration)\
+            .all()
+        if not rows:
+            db.rollback()
+            continue
+        subject, body = reminder_email(event)
+        enqueue_batch(db, [Recipient(r.email, r.name) for r in rows], subject, body)
+        db.execute(
+            update(Registration)
+            .where(Registration.id.in_([r.id for r in rows]))
+            .values(reminder_sent=True)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        queued += len(rows)
+    return queued
+
+
+class ReminderScheduler:
+    def __init__(self, session_factory: Callable[[], Session], interval_seconds: float):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="reminder-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            return send_due_reminders(db)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                queued = self.run_once()
+                if queued:
+                    logger.info("queued %d reminders", queued)
+            except Exception:
+                logger.exception("reminder run failed")
+            self._stop.wait(self.interval_seconds)
+
+
+_scheduler: Optional[ReminderScheduler] = None
+
+
+def start_scheduler(session_factory: Callable[[], Session]) -> Optional[ReminderScheduler]:
+    global _scheduler
+    if settings.REMINDER_INTERVAL_SECONDS <= 0:
+        return None
+    _scheduler = ReminderScheduler(session_factory, settings.REMINDER_INTERVAL_SECONDS)
+    _scheduler.start()
+    return _scheduler
+
+
+def stop_scheduler() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop()
+        _scheduler = None
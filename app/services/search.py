@@ -0,0 +1,327 @@
+# app/services/search.py
+"""Ranked full-text search over event title, description, speaker and venue.
+
+On MySQL the ``ft_events_search`` FULLTEXT index is queried with
+MATCH ... AGAINST. Everywhere else (SQLite in development and benchmarks,
+or MySQL with SEARCH_BACKEND=index) an in-process inverted index with BM25
+ranking is used. It is built on the first search, kept current from ORM
+inserts/updates/deletes of Event once they commit, and rebuilt every
+SEARCH_INDEX_REFRESH_SECONDS to pick up writes made by other processes.
+Those rebuilds run on a background thread while searches keep using the
+current index; changes committed during a rebuild are replayed onto the
+new index before it is swapped in.
+"""
+import asyncio
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.config import LazyInstance, settings
+from app.db.session import SessionLocal
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# a word in the title counts three times as much as one in the description
+FIELD_WEIGHTS = {"title": 3.0, "speaker": 2.0, "venue": 2.0, "description": 1.0}
+MAX_RESULTS = 1000  # deepest offset we rank for
+BM25_K1 = 1.2
+BM25_B = 0.75
+COMMON_TERM_RATIO = 0.2
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset("a an and are as at be by for from in is it of on or the to with".split())
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def document_terms(fields: Dict[str, Optional[str]]) -> Dict[str, float]:
+    """term -> field-weighted term frequency for one event."""
+    terms: Dict[str, float] = {}
+    for name, weight in FIELD_WEIGHTS.items():
+        for token, n in Counter(tokenize(fields.get(name))).items():
+            terms[token] = terms.get(token, 0.0) + n * weight
+    return terms
+
+
+class InvertedIndex:
+    """term -> {event_id: weighted tf}, with BM25 scoring. Thread-safe."""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._docs: Dict[int, Dict[str, float]] = {}
+        self._lengths: Dict[int, float] = {}
+        self._total_length = 0.0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, event_id: int, fields: Dict[str, Optional[str]]) -> None:
+        terms = document_terms(fields)
+        with self._lock:
+            self._remove(event_id)
+            self._docs[event_id] = terms
+            length = sum(terms.values())
+            self._lengths[event_id] = length
+            self._total_length += length
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[event_id] = tf
+
+    def remove(self, event_id: int) -> None:
+        with self._lock:
+            self._remove(event_id)
+
+    def _remove(self, event_id: int) -> None:
+        terms = self._docs.pop(event_id, None)
+        if terms is None:
+            return
+        self._total_length -= self._lengths.pop(event_id)
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(event_id, None)
+                if not postings:
+                    del self._postings[term]
+
+    def search(self, query: str, limit: int) -> Tuple[List[Tuple[int, float]], int]:
+        """Top `limit` (event_id, score) pairs, best first, and the number of matches."""
+        terms = set(tokenize(query))
+        with self._lock:
+            n_docs = len(self._docs)
+            if not terms or not n_docs:
+                return [], 0
+            avg_length = self._total_length / n_docs or 1.0
+            scores: Dict[int, float] = {}
+            # rarest terms first; a term in most documents ("hall") then only
+            # re-scores the candidates found so far instead of every event
+            for postings in sorted(filter(None, map(self._postings.get, terms)), key=len):
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                if scores and len(postings) > n_docs * COMMON_TERM_RATIO:
+                    candidates = [(e, postings[e]) for e in scores if e in postings]
+                else:
+                    candidates = postings.items()
+                for event_id, tf in candidates:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[event_id] / avg_length)
+                    scores[event_id] = scores.get(event_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        # ties broken by id so pages are stable
+        top = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return top, len(scores)
+
+
+class SearchIndex:
+    """The process-wide InvertedIndex plus its (re)builds.
+
+    The first build runs in the caller, which has nothing to search yet.
+    Periodic refreshes run on a background thread with a session of their
+    own. While a build runs, apply() records the changes it is given, and the
+    build replays them onto the new index before swapping it in, so nothing
+    committed meanwhile is lost.
+    """
+
+    def __init__(self, refresh_seconds: float, session_factory: Optional[Callable[[], Session]] = None):
+        self.refresh_seconds = refresh_seconds
+        self.session_factory = session_factory
+        self._index: Optional[InvertedIndex] = None
+        self._built_at = 0.0
+        self._build_lock = threading.Lock()  # one build at a time
+        self._changes_lock = threading.Lock()
+        self._pending: Optional[Dict[int, Optional[dict]]] = None  # changes seen by a running build
+        self._generation = 0  # bumped by invalidate(); a build started before it is discarded
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next search (e.g. after bulk Core inserts)."""
+        with self._changes_lock:
+            self._generation += 1
+            self._index = None
+
+    def ready(self, db: Session) -> InvertedIndex:
+        index = self._index
+        if index is None:
+            with self._build_lock:
+                if self._index is None:
+                    self._rebuild(db)
+                index = self._index
+            return index if index is not None else InvertedIndex()
+        if self.refresh_seconds > 0 and time.monotonic() - self._built_at > self.refresh_seconds:
+            self.refresh_in_background()
+        return index
+
+    def build_if_missing(self) -> None:
+        """Build the first index with a session of its own (async routes call
+        this in a worker thread, so the build stays off the event loop)."""
+        if self._index is None and self.session_factory is not None:
+            with self._build_lock:
+                if self._index is None:
+                    with self.session_factory() as db:
+                        self._rebuild(db)
+
+    def refresh_in_background(self) -> None:
+        """Start a rebuild on a thread unless one is running; searches keep the current index."""
+        if self.session_factory is None or not self._build_lock.acquire(blocking=False):
+            return
+        self._built_at = time.monotonic()  # a failed refresh is retried after the next interval
+
+        def run() -> None:
+            try:
+                with self.session_factory() as db:
+                    self._rebuild(db)
+            except Exception:
+                logger.exception("search index refresh failed")
+            finally:
+                self._build_lock.release()
+
+        threading.Thread(target=run, name="search-index-refresh", daemon=True).start()
+
+    def _rebuild(self, db: Session) -> None:
+        """Build from `db`, replay the changes applied meanwhile and swap the
+        result in. The caller holds _build_lock."""
+        with self._changes_lock:
+            self._pending = {}
+            generation = self._generation
+        try:
+            index = self._build(db)
+        except BaseException:
+            with self._changes_lock:
+                self._pending = None
+            raise
+        with self._changes_lock:
+            pending, self._pending = self._pending, None
+            if generation != self._generation:
+                return  # invalidated while building; the next search builds again
+            for event_id, fields in pending.items():
+                _apply_one(index, event_id, fields)
+            self._index = index
+            self._built_at = time.monotonic()
+
+    def _build(self, db: Session) -> InvertedIndex:
+        index = InvertedIndex()
+        rows = db.execute(
+            select(Event.id, Event.title, Event.description, Event.speaker, Event.venue)
+            .execution_options(yield_per=2000)
+        )
+        for row in rows:
+            index.add(row.id, row._mapping)
+        return index
+
+    def apply(self, changes: Dict[int, Optional[dict]]) -> None:
+        with self._changes_lock:
+            if self._pending is not None:
+                # a running build may have read these rows before the commit
+                self._pending.update(changes)
+            index = self._index
+        if index is None:
+            return  # the next build reads the committed rows anyway
+        for event_id, fields in changes.items():
+            _apply_one(index, event_id, fields)
+
+
+def _apply_one(index: InvertedIndex, event_id: int, fields: Optional[dict]) -> None:
+    if fields is None:
+        index.remove(event_id)
+    else:
+        index.add(event_id, fields)
+
+
+search_index = LazyInstance(lambda: SearchIndex(settings.SEARCH_INDEX_REFRESH_SECONDS, SessionLocal))
+
+
+def use_fulltext(db: Session) -> bool:
+    backend = settings.SEARCH_BACKEND
+    if backend == "auto":
+        return db.get_bind().dialect.name == "mysql"
+    return backend == "fulltext"
+
+
+async def prepare_async(db) -> None:
+    """Async routes: build a missing in-process index in a worker thread
+    before the search itself runs on the event loop through run_sync."""
+    if not use_fulltext(db.sync_session):
+        await asyncio.to_thread(search_index.build_if_missing)
+
+
+def decode_offset(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        offset = int(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not 0 <= offset < MAX_RESULTS:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return offset
+
+
+def ranked_ids(db: Session, q: str, offset: int, limit: int) -> Tuple[List[Tuple[int, float]], bool]:
+    """(event_id, score) for one page, best first, and whether another page exists."""
+    if use_fulltext(db):
+        from sqlalchemy.dialects.mysql import match  # only needed on MySQL
+
+        score = match(Event.title, Event.description, Event.speaker, Event.venue, against=q)\
+            .in_natural_language_mode()
+        rows = db.execute(
+            select(Event.id, score.label("score"))
+            .where(score > 0)
+            .order_by(score.desc(), Event.id)
+            .offset(offset)
+            .limit(limit + 1)
+        ).all()
+        return [(r.id, float(r.score)) for r in rows[:limit]], len(rows) > limit
+    top, total = search_index.ready(db).search(q, min(offset + limit, MAX_RESULTS))
+    return top[offset:offset + limit], total > offset + limit and offset + limit < MAX_RESULTS
+
+
+# -----------------------
+# KEEP THE INDEX CURRENT
+# -----------------------
+def _searchable(target: Event) -> dict:
+    return {name: getattr(target, name) for name in FIELD_WEIGHTS}
+
+
+def _stage(target: Event, fields: Optional[dict]) -> None:
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault("search_changes", {})[target.id] = fields
+
+
+@event.listens_for(Event, "after_insert")
+def _event_inserted(mapper, connection, target: Event) -> None:
+    _stage(target, _searchable(target))
+
+
+@event.listens_for(Event, "after_update")
+def _event_updated(mapper, connection, target: Event) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in FIELD_WEIGHTS):
+        _stage(target, _searchable(target))
+
+
+@event.listens_for(Event, "after_delete")
+def _event_deleted(mapper, connection, target: Event) -> None:
+    _stage(target, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_after_commit(session: Session) -> None:
+    changes = session.info.pop("search_changes", None)
+    if changes:
+        search_index.apply(changes)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_on_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:  # outermost transaction only
+        session.info.pop("search_changes", None)
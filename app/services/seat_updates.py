@@ -0,0 +1,180 @@
+# app/services/seat_updates.py
+"""In-process fan-out of seats_available changes to SSE subscribers.
+
+Each event with at least one subscriber has a channel. Handlers call
+``notify_seats(db, event_id)`` after committing; it reads the seat count
+only when somebody is listening and hands it to the event loop. A channel
+sends at most SEAT_UPDATES_MAX_PER_SECOND messages, always carrying the
+latest value, so a burst of bookings costs a bounded number of messages and
+no extra reads per client. Slow clients only ever see the newest count.
+
+Channels also re-read the count every SEAT_UPDATES_RESYNC_SECONDS (one query
+per event, not per client) to pick up changes committed by other processes.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import AsyncIterator, Callable, Dict, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.config import LazyInstance, settings
+from app.db.session import SessionLocal
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_SECONDS = 15.0
+
+
+def read_seats(db: Session, event_id: int) -> Optional[int]:
+    return db.query(Event.seats_available).filter(Event.id == event_id).scalar()
+
+
+class Channel:
+    def __init__(self, event_id: int):
+        self.event_id = event_id
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.latest: Optional[int] = None
+        self.sent: Optional[int] = None
+        self.last_sent_at = 0.0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.resync_task: Optional[asyncio.Task] = None
+
+
+class SeatBroadcaster:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_per_second: float = 2.0,
+        resync_seconds: float = 5.0,
+    ):
+        self.session_factory = session_factory
+        self.min_interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self.resync_seconds = resync_seconds
+        self._channels: Dict[int, Channel] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def has_subscribers(self, event_id: int) -> bool:
+        return event_id in self._channels
+
+    # -----------------------
+    # subscribers (event loop)
+    # -----------------------
+    def subscribe(self, event_id: int, initial: int) -> asyncio.Queue:
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        with self._lock:
+            channel = self._channels.get(event_id)
+            if channel is None:
+                channel = self._channels[event_id] = Channel(event_id)
+                channel.latest = channel.sent = initial
+                if self.resync_seconds > 0:
+                    channel.resync_task = self._loop.create_task(self._resync(channel))
+            channel.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, event_id: int, queue: asyncio.Queue) -> None:
+        with self._lock:
+            channel = self._channels.get(event_id)
+            if channel is None:
+                return
+            channel.subscribers.discard(queue)
+            if channel.subscribers:
+                return
+            del self._channels[event_id]
+        if channel.flush_handle is not None:
+            channel.flush_handle.cancel()
+        if channel.resync_task is not None:
+            channel.resync_task.cancel()
+
+    async def _resync(self, channel: Channel) -> None:
+        # runs until unsubscribe() cancels it; a failed read must not end it,
+        # or the channel's subscribers would stop hearing about other processes
+        while True:
+            await asyncio.sleep(self.resync_seconds)
+            try:
+                seats = await asyncio.to_thread(self.read, channel.event_id)
+            except Exception:
+                logger.exception("seat resync of event %s failed", channel.event_id)
+                continue
+            self._update(channel.event_id, seats)
+
+    def read(self, event_id: int) -> Optional[int]:
+        with self.session_factory() as db:
+            return read_seats(db, event_id)
+
+    # -----------------------
+    # publishers (any thread)
+    # -----------------------
+    def publish(self, event_id: int, seats: Optional[int]) -> None:
+        """Record a new count (None: event deleted). Safe to call from worker threads."""
+        loop = self._loop
+        if loop is None or event_id not in self._channels or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._update, event_id, seats)
+
+    def _update(self, event_id: int, seats: Optional[int]) -> None:
+        channel = self._channels.get(event_id)
+        if channel is None:
+            return
+        channel.latest = seats
+        if channel.flush_handle is not None:
+            return  # a flush is already scheduled and will carry this value
+        wait = channel.last_sent_at + self.min_interval - time.monotonic()
+        if wait > 0:
+            channel.flush_handle = self._loop.call_later(wait, self._flush, channel)
+        else:
+            self._flush(channel)
+
+    def _flush(self, channel: Channel) -> None:
+        channel.flush_handle = None
+        if channel.latest == channel.sent:
+            return
+        channel.sent = channel.latest
+        channel.last_sent_at = time.monotonic()
+        for queue in list(channel.subscribers):
+            if queue.full():
+                queue.get_nowait()  # drop the stale value; only the latest matters
+            queue.put_nowait(channel.latest)
+
+
+broadcaster = LazyInstance(lambda: SeatBroadcaster(
+    SessionLocal,
+    max_per_second=settings.SEAT_UPDATES_MAX_PER_SECOND,
+    resync_seconds=settings.SEAT_UPDATES_RESYNC_SECONDS,
+))
+
+
+def notify_seats(db: Session, event_id: int, deleted: bool = False) -> None:
+    """Publish the committed seat count of `event_id` if anyone is subscribed."""
+    if not broadcaster.has_subscribers(event_id):
+        return
+    broadcaster.publish(event_id, None if deleted else read_seats(db, event_id))
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def sse_stream(event_id: int, initial: int) -> AsyncIterator[str]:
+    """text/event-stream body: the current count, then one `seats` message per
+    (coalesced) change, and `deleted` if the event goes away."""
+    queue = broadcaster.subscribe(event_id, initial)
+    try:
+        yield _sse("seats", {"event_id": event_id, "seats_available": initial})
+        while True:
+            try:
+                seats = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"  # keeps proxies from closing an idle stream
+                continue
+            if seats is None:
+                yield _sse("deleted", {"event_id": event_id})
+                return
+            yield _sse("seats", {"event_id": event_id, "seats_available": seats})
+    finally:
+        broadcaster.unsubscribe(event_id, queue)
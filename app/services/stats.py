@@ -0,0 +1,203 @@
+# app/services/stats.py
+"""Organizer dashboard counters, maintained incrementally.
+
+Bookings, cancellations and event deletions add their deltas to
+``event_stats`` (one row per event) and ``organizer_daily_stats`` (one row
+per organizer per day) with one upsert per row, in the caller's
+transaction, so the counters commit or roll back with the change itself.
+The dashboard then reads one row per event and one per day instead of
+aggregating registrations. Organizer totals are summed from the event rows
+rather than kept in a per-organizer row, which every booking for any of
+that organizer's events would otherwise have to lock.
+
+An event's ``event_stats`` row survives its move to ``events_archive`` (the
+archive keeps the id), so archived events stay on the dashboard; deleting
+an event removes its row here.
+
+Within a transaction rows are touched events -> event_stats (by event_id)
+-> organizer_daily_stats (by organizer_id), the same order as the booking
+path, so concurrent bulk bookings cannot deadlock on them.
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import delete, func, insert, select, union_all, update
+from sqlalchemy.orm import Session
+
+from app.models.archive import ArchivedEvent, ArchivedRegistration
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.stats import EventStats, OrganizerDailyStats
+from app.schemas import DailyStatsOut, EventStatsOut, OrganizerStatsOut
+from app.services.listing import status_at
+
+DEFAULT_STATS_DAYS = 30
+
+
+class Tally(NamedTuple):
+    organizer_id: int
+    registrations: int
+    seats: int
+
+
+def increment(db: Session, model, keys: dict, deltas: dict, on_insert: Optional[dict] = None) -> None:
+    """Add `deltas` to the row identified by `keys`, creating it (with
+    `deltas` plus `on_insert` as its values) if it does not exist yet:
+    ON DUPLICATE KEY UPDATE on MySQL, ON CONFLICT DO UPDATE on SQLite."""
+    table = model.__table__
+    values = {**keys, **(on_insert or {}), **deltas}
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table).values(values)
+        db.execute(stmt.on_duplicate_key_update({c: table.c[c] + stmt.inserted[c] for c in deltas}))
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        stmt = sqlite_insert(table).values(values)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=list(keys), set_={c: table.c[c] + stmt.excluded[c] for c in deltas},
+        ))
+    else:
+        where = [table.c[k] == v for k, v in keys.items()]
+        result = db.execute(update(table).where(*where).values({c: table.c[c] + v for c, v in deltas.items()}))
+        if result.rowcount == 0:
+            db.execute(insert(table).values(values))
+
+
+def _record(db: Session, tallies: Dict[int, Tally], now: datetime, event_deltas, daily_columns) -> None:
+    per_organizer: Dict[int, list] = {}
+    for event_id in sorted(tallies):
+        tally = tallies[event_id]
+        if tally.organizer_id is None:
+            continue
+        increment(db, EventStats, {"event_id": event_id}, event_deltas(tally),
+                  on_insert={"organizer_id": tally.organizer_id})
+        totals = per_organizer.setdefault(tally.organizer_id, [0, 0])
+        totals[0] += tally.registrations
+        totals[1] += tally.seats
+    registrations, seats = daily_columns
+    for organizer_id in sorted(per_organizer):
+        increment(db, OrganizerDailyStats, {"organizer_id": organizer_id, "day": now.date()},
+                  {registrations: per_organizer[organizer_id][0], seats: per_organizer[organizer_id][1]})
+
+
+def record_bookings(db: Session, tallies: Dict[int, Tally], now: datetime) -> None:
+    """Count new registrations; `tallies` is {event_id: Tally}."""
+    _record(db, tallies, now,
+            lambda t: {"registrations": t.registrations, "seats_sold": t.seats},
+            ("registrations", "seats_booked"))
+
+
+def record_cancellations(db: Session, tallies: Dict[int, Tally], now: datetime) -> None:
+    """Count cancelled registrations; `tallies` is {event_id: Tally}."""
+    _record(db, tallies, now,
+            lambda t: {"registrations": -t.registrations, "seats_sold": -t.seats, "cancellations": t.registrations},
+            ("cancellations", "seats_released"))
+
+
+def record_event_deleted(db: Session, event_id: int, organizer_id: int, cancelled: bool, now: datetime) -> None:
+    """Call when deleting the event: drops its row. If it had not happened
+    yet, its remaining registrations count as cancellations of the day."""
+    row = db.execute(
+        select(EventStats.registrations, EventStats.seats_sold).where(EventStats.event_id == event_id)
+    ).first()
+    if cancelled and row is not None and row.registrations:
+        increment(db, OrganizerDailyStats, {"organizer_id": organizer_id, "day": now.date()},
+                  {"cancellations": row.registrations, "seats_released": row.seats_sold})
+    db.execute(delete(EventStats).where(EventStats.event_id == event_id))
+
+
+def rebuild(db: Session) -> None:
+    """Recompute every counter from the live and archived events and
+    registrations (after bulk Core inserts, or to repair drift).
+    Cancellation history cannot be recovered and restarts at zero."""
+    registrations = union_all(
+        select(Event.id.label("event_id"), Event.organizer_id, Registration.id.label("registration_id"),
+               Registration.seats_booked, Registration.registered_at)
+        .join(Registration, Registration.event_id == Event.id),
+        select(ArchivedEvent.id, ArchivedEvent.organizer_id, ArchivedRegistration.id,
+               ArchivedRegistration.seats_booked, ArchivedRegistration.registered_at)
+        .join(ArchivedRegistration, ArchivedRegistration.event_id == ArchivedEvent.id),
+    ).subquery()
+    r = registrations.c
+
+    db.execute(delete(EventStats))
+    db.execute(insert(EventStats).from_select(
+        ["event_id", "organizer_id", "registrations", "seats_sold", "cancellations"],
+        select(r.event_id, r.organizer_id, func.count(r.registration_id), func.coalesce(func.sum(r.seats_booked), 0), 0)
+        .where(r.organizer_id.is_not(None))
+        .group_by(r.event_id, r.organizer_id),
+    ))
+    db.execute(delete(OrganizerDailyStats))
+    day = func.date(r.registered_at)
+    db.execute(insert(OrganizerDailyStats).from_select(
+        ["organizer_id", "day", "registrations", "seats_booked", "cancellations", "seats_released"],
+        select(r.organizer_id, day, func.count(r.registration_id), func.sum(r.seats_booked), 0, 0)
+        .where(r.organizer_id.is_not(None), r.registered_at.is_not(None))
+        .group_by(r.organizer_id, day),
+    ))
+
+
+# -----------------------
+# DASHBOARD
+# -----------------------
+def _fill_rate(seats_sold: int, total_seats: int) -> float:
+    return round(seats_sold / total_seats, 4) if total_seats else 0.0
+
+
+def organizer_stats(db: Session, user, days: int = DEFAULT_STATS_DAYS, now: Optional[datetime] = None) -> OrganizerStatsOut:
+    """Per-event counters of every event of `user`, archived ones included,
+    plus the last `days` days."""
+    now = now or datetime.utcnow()
+    rows = []
+    for model in (ArchivedEvent, Event):
+        rows += db.query(
+            model.id, model.title, model.event_date, model.total_seats,
+            EventStats.registrations, EventStats.seats_sold, EventStats.cancellations,
+        ).outerjoin(EventStats, EventStats.event_id == model.id)\
+            .filter(model.organizer_id == user.id)\
+            .all()
+    rows.sort(key=lambda r: (r.event_date, r.id))
+    events = [
+        EventStatsOut.model_construct(
+            event_id=r.id,
+            title=r.title,
+            event_date=r.event_date,
+            status=status_at(r.event_date, now),
+            total_seats=r.total_seats,
+            seats_sold=r.seats_sold or 0,
+            registrations=r.registrations or 0,
+            cancellations=r.cancellations or 0,
+            fill_rate=_fill_rate(r.seats_sold or 0, r.total_seats),
+        )
+        for r in rows
+    ]
+
+    first_day: date = now.date() - timedelta(days=days - 1)
+    daily = [
+        DailyStatsOut.model_construct(
+            day=d.day,
+            registrations=d.registrations,
+            seats_booked=d.seats_booked,
+            cancellations=d.cancellations,
+            seats_released=d.seats_released,
+        )
+        for d in db.query(OrganizerDailyStats)
+        .filter(OrganizerDailyStats.organizer_id == user.id, OrganizerDailyStats.day >= first_day)
+        .order_by(OrganizerDailyStats.day)
+    ]
+
+    total_seats = sum(e.total_seats for e in events)
+    seats_sold = sum(e.seats_sold for e in events)
+    return OrganizerStatsOut.model_construct(
+        organizer_id=user.id,
+        events=len(events),
+        total_seats=total_seats,
+        seats_sold=seats_sold,
+        registrations=sum(e.registrations for e in events),
+        fill_rate=_fill_rate(seats_sold, total_seats),
+        per_event=events,
+        daily=daily,
+    )
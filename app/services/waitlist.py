@@ -0,0 +1,173 @@
+# app/services/waitlist.py
+"""Per-event FIFO waitlist for sold-out events.
+
+Instead of retrying POST /events/register until a seat frees up, a
+participant joins the waitlist once and polls their position (a cheap
+indexed count that never touches the events row). Seats that come back
+through a cancellation, or through the organizer raising total_seats, are
+handed to the head of the queue by ``promote()`` inside that same
+transaction: the event row is already locked by the seat release, so nobody
+can take the freed seats in between. Promoted participants are registered
+and emailed like any other booking.
+
+The queue is strictly FIFO: if the head wants more seats than are free, the
+people behind it wait too.
+"""
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.email_utils import NAME_TAG, Recipient
+from app.models.event import Event
+from app.models.registration import Registration
+from app.models.user import User
+from app.models.waitlist import WaitlistEntry
+from app.schemas import WaitlistPositionOut
+from app.services import stats
+from app.services.booking import release_seats, take_seats
+from app.services.outbox import enqueue_batch
+from app.services.seat_updates import notify_seats
+
+logger = logging.getLogger(__name__)
+
+PROMOTE_BATCH_SIZE = 50
+
+
+def promotion_email(event):
+    """(subject, body) sent when a waitlisted participant gets their seats."""
+    subject = f"You're in: {event.title}"
+    body = f"""
+        <h3>Hello {NAME_TAG},</h3>
+        <p>Seats opened up and you have been moved from the waitlist to the
+        participant list of <strong>{event.title}</strong>.</p>
+        <p>Date & Time: {event.event_date}</p>
+        <p>Venue: {event.venue}</p>
+        <p>Speaker: {event.speaker}</p>
+        <p>If you can no longer attend, please cancel so the next person can go.</p>
+        <p>By EventHub Team</p>
+    """
+    return subject, body
+
+
+def promote(db: Session, event_id: int, now: datetime) -> int:
+    """Register waitlisted participants, oldest first, while their seats fit.
+
+    Runs in the caller's transaction, after the caller has released or
+    added seats; the caller commits. Returns the number promoted.
+    """
+    promoted: List[Recipient] = []
+    seats_promoted = 0
+    done: List[int] = []
+    blocked = False
+    last_id = 0
+    while not blocked:
+        batch = db.execute(
+            select(WaitlistEntry.id, WaitlistEntry.user_id, WaitlistEntry.seats, User.email, User.name)
+            .join(User, User.id == WaitlistEntry.user_id)
+            .where(WaitlistEntry.event_id == event_id, WaitlistEntry.id > last_id)
+            .order_by(WaitlistEntry.id)
+            .limit(PROMOTE_BATCH_SIZE)
+        ).all()
+        if not batch:
+            break
+        for entry in batch:
+            last_id = entry.id
+            if not take_seats(db, event_id, entry.seats, now):
+                blocked = True
+                break
+            try:
+                with db.begin_nested():
+                    db.add(Registration(user_id=entry.user_id, event_id=event_id, seats_booked=entry.seats))
+                    db.flush()
+            except IntegrityError:
+                # registered directly in the meantime; just leave the queue
+                release_seats(db, event_id, entry.seats)
+            else:
+                promoted.append(Recipient(entry.email, entry.name))
+                seats_promoted += entry.seats
+            done.append(entry.id)
+    if done:
+        db.execute(delete(WaitlistEntry).where(WaitlistEntry.id.in_(done)))
+    if promoted:
+        event = db.query(Event.title, Event.event_date, Event.venue, Event.speaker, Event.organizer_id)\
+            .filter(Event.id == event_id).one()
+        subject, body = promotion_email(event)
+        enqueue_batch(db, promoted, subject, body)
+        stats.record_bookings(db, {event_id: stats.Tally(event.organizer_id, len(promoted), seats_promoted)}, now)
+        logger.info("event %s: promoted %d participant(s) from the waitlist", event_id, len(promoted))
+    return len(promoted)
+
+
+def _position(db: Session, event_id: int, entry_id: int) -> int:
+    return db.query(func.count(WaitlistEntry.id))\
+        .filter(WaitlistEntry.event_id == event_id, WaitlistEntry.id <= entry_id)\
+        .scalar()
+
+
+def _entry(db: Session, event_id: int, user_id: int) -> Optional[WaitlistEntry]:
+    return db.query(WaitlistEntry.id, WaitlistEntry.seats)\
+        .filter(WaitlistEntry.event_id == event_id, WaitlistEntry.user_id == user_id)\
+        .first()
+
+
+def _is_registered(db: Session, event_id: int, user_id: int) -> bool:
+    return db.query(Registration.id)\
+        .filter(Registration.event_id == event_id, Registration.user_id == user_id)\
+        .first() is not None
+
+
+def position(db: Session, event_id: int, user) -> WaitlistPositionOut:
+    entry = _entry(db, event_id, user.id)
+    if entry is not None:
+        return WaitlistPositionOut.model_construct(
+            event_id=event_id, status="waiting", position=_position(db, event_id, entry.id), seats=entry.seats,
+        )
+    if _is_registered(db, event_id, user.id):
+        return WaitlistPositionOut.model_construct(event_id=event_id, status="registered")
+    raise HTTPException(status_code=404, detail="You are not on the waitlist for this event")
+
+
+def join(db: Session, event_id: int, seats: int, user, now: datetime) -> WaitlistPositionOut:
+    """Queue `user` for `seats` seats. Joining again just reports the position.
+    If seats are free and nobody is ahead, the participant is registered at once."""
+    if seats < 1:
+        raise HTTPException(status_code=400, detail="seats must be at least 1")
+    event = db.query(Event.event_date, Event.total_seats).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    if event.event_date <= now:
+        raise HTTPException(status_code=400, detail="This event is already completed. Registration is closed.")
+    if seats > event.total_seats:
+        raise HTTPException(status_code=400, detail="More seats requested than the event has")
+    if _is_registered(db, event_id, user.id):
+        raise HTTPException(status_code=409, detail="Already registered for this event")
+    if _entry(db, event_id, user.id) is None:
+        db.add(WaitlistEntry(event_id=event_id, user_id=user.id, seats=seats))
+        try:
+            db.flush()
+            promoted = promote(db, event_id, now)
+            db.commit()
+        except IntegrityError:
+            db.rollback()  # joined concurrently from another request
+        except Exception:
+            db.rollback()
+            raise
+        else:
+            if promoted:
+                notify_seats(db, event_id)
+    return position(db, event_id, user)
+
+
+def leave(db: Session, event_id: int, user) -> dict:
+    result = db.execute(
+        delete(WaitlistEntry).where(WaitlistEntry.event_id == event_id, WaitlistEntry.user_id == user.id)
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="You are not on the waitlist for this event")
+    db.commit()
+    return {"msg": "You have left the waitlist", "event_id": event_id}
@@ -0,0 +1,180 @@
+"""Shared pieces of the benchmark suite: environment, seeding, load driver and stats."""
+import os
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+BENCH_ENV = {
+    "SECRET_KEY": "bench-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "600",
+    "SENDGRID_API_KEY": "unused",
+    "FROM_EMAIL": "bench@example.com",
+    "EMAIL_TRANSPORT": "memory",
+    "OUTBOX_WORKERS": "0",
+    "REMINDER_INTERVAL_SECONDS": "0",
+    "ARCHIVE_INTERVAL_SECONDS": "0",
+    "LOG_LEVEL": "WARNING",  # the lifespan runs; keep per-request httpx logging out of the output
+    # scenarios measure the handlers, not load shedding; the `admission` scenario turns it on
+    "ADMISSION_ENABLED": "false",
+    # a huge threshold turns on the X-Query-Count header without the warnings
+    "QUERY_COUNT_WARN_THRESHOLD": str(10 ** 9),
+}
+PASSWORD = "bench-password"
+
+
+def configure(database_url: str, overrides: Optional[Dict[str, str]] = None) -> None:
+    """Must run before anything from `app` is imported."""
+    os.environ["DATABASE_URL"] = database_url
+    for key, value in {**BENCH_ENV, **(overrides or {})}.items():
+        os.environ.setdefault(key, value)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+def reset_database() -> None:
+    from app.db.session import Base, engine
+    import app.main  # noqa: F401  (registers every model on Base)
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def seed(users: int, organizers: int, events: int, registrations_per_event: int, seats_per_event: int) -> Dict[str, list]:
+    """Bulk-insert the dataset with Core inserts; returns the generated ids/emails."""
+    from sqlalchemy import insert
+
+    from app.auth.security import hash_password
+    from app.db.session import SessionLocal
+    from app.models.event import Event
+    from app.models.registration import Registration
+    from app.models.user import Role, User
+    from app.services import stats
+
+    password_hash = hash_password(PASSWORD)  # one hash shared by every seeded user
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        db.execute(insert(User), [
+            {"id": i + 1, "name": f"organizer{i}", "email": f"organizer{i}@bench.local",
+             "password_hash": password_hash, "role": Role.organizer}
+            for i in range(organizers)
+        ])
+        db.execute(insert(User), [
+            {"id": organizers + i + 1, "name": f"user{i}", "email": f"user{i}@bench.local",
+             "password_hash": password_hash, "role": Role.participant}
+            for i in range(users)
+        ])
+        participant_ids = [organizers + i + 1 for i in range(users)]
+        db.execute(insert(Event), [
+            {"id": i + 1, "title": f"Event {i}", "description": "x" * 500, "venue": f"Hall {i % 20}",
+             "speaker": f"Speaker {i % 50}", "event_date": now + timedelta(hours=2 + i),
+             "total_seats": seats_per_event,
+             "seats_available": seats_per_event - min(registrations_per_event, seats_per_event),
+             "organizer_id": (i % organizers) + 1}
+            for i in range(events)
+        ])
+        rows = []
+        for event_id in range(1, events + 1):
+            for k in range(min(registrations_per_event, seats_per_event, users)):
+                rows.append({"user_id": participant_ids[(event_id + k) % users], "event_id": event_id, "seats_booked": 1})
+        for start in range(0, len(rows), 5000):
+            db.execute(insert(Registration), rows[start:start + 5000])
+        stats.rebuild(db)  # Core inserts bypass the dashboard counters
+        db.commit()
+    return {
+        "organizer_emails": [f"organizer{i}@bench.local" for i in range(organizers)],
+        "participant_emails": [f"user{i}@bench.local" for i in range(users)],
+        "event_ids": list(range(1, events + 1)),
+    }
+
+
+def auth_header(email: str) -> Dict[str, str]:
+    from app.auth.security import create_access_token
+
+    return {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.queries: List[int] = []
+        self.statuses: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float, status: int, queries: Optional[int]) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            if queries is not None:
+                self.queries.append(queries)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def drive(app, jobs: List[Callable], concurrency: int) -> dict:
+    """Run each job(client) -> response on `concurrency` threads, one TestClient per thread."""
+    from fastapi.testclient import TestClient
+
+    local = threading.local()
+    clients = []
+    recorder = Recorder()
+
+    def client():
+        if not hasattr(local, "client"):
+            local.client = TestClient(app)
+            clients.append(local.client)
+        return local.client
+
+    def run(job):
+        c = client()
+        start = time.perf_counter()
+        response = job(c)
+        elapsed = time.perf_counter() - start
+        count = response.headers.get("x-query-count")
+        recorder.add(elapsed, response.status_code, int(count) if count else None)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(run, jobs))
+    duration = time.perf_counter() - started
+    for c in clients:
+        c.close()
+    return summarize(recorder, duration)
+
+
+def summarize(recorder: Recorder, duration: float) -> dict:
+    latencies = sorted(recorder.latencies)
+    ms = lambda v: round(v * 1000, 3)
+    return {
+        "requests": len(latencies),
+        "statuses": {str(k): v for k, v in sorted(recorder.statuses.items())},
+        # shed by admission control (rate limited / busy); nonzero means the latencies are not comparable
+        "rejected": {"429": recorder.statuses.get(429, 0), "503": recorder.statuses.get(503, 0)},
+        "duration_s": round(duration, 4),
+        "throughput_rps": round(len(latencies) / duration, 2) if duration else None,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "mean": ms(statistics.fmean(latencies)) if latencies else 0.0,
+        },
+        "queries": {
+            "total": sum(recorder.queries),
+            "per_request_mean": round(statistics.fmean(recorder.queries), 2) if recorder.queries else None,
+            "per_request_max": max(recorder.queries) if recorder.queries else None,
+        },
+    }
@@ -0,0 +1,64 @@
+"""Microbenchmark: password verifications (logins) per second per core.
+
+    python -m bench.password_hashing --logins 200 --workers 1 2 4
+
+Prints one JSON object: inline single-thread throughput, and throughput
+through app.auth.hashing_pool.PasswordHasherPool for each worker count.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.auth.security import hash_password, verify_and_update
+
+
+def inline(n: int, stored: str) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        verify_and_update("correct horse", stored)
+    return n / (time.perf_counter() - start)
+
+
+def pooled(n: int, stored: str, workers: int) -> float:
+    from app.auth.hashing_pool import PasswordHasherPool
+
+    pool = PasswordHasherPool(workers, queue_limit=n)
+    try:
+        pool.run(verify_and_update, "correct horse", stored)  # warm up the worker processes
+        start = time.perf_counter()
+        # many request threads submitting at once, like a login storm
+        with ThreadPoolExecutor(max_workers=min(n, 64)) as clients:
+            list(clients.map(lambda _: pool.run(verify_and_update, "correct horse", stored), range(n)))
+        return n / (time.perf_counter() - start)
+    finally:
+        pool.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    stored = hash_password("correct horse")
+    report = {
+        "benchmark": "password_hashing",
+        "cpu_count": os.cpu_count(),
+        "logins": args.logins,
+        "inline_logins_per_sec": round(inline(args.logins, stored), 1),
+        "pool": [],
+    }
+    for workers in args.workers:
+        rate = pooled(args.logins, stored, workers)
+        report["pool"].append({
+            "workers": workers,
+            "logins_per_sec": round(rate, 1),
+            "logins_per_sec_per_core": round(rate / min(workers, os.cpu_count() or 1), 1),
+        })
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
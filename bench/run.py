@@ -0,0 +1,190 @@
+"""Load-test / benchmark suite for the booking, listing and auth hot paths.
+
+    python -m bench.run --scenarios ticket_drop browse login_storm mass_cancellation \
+        --database-url sqlite:///bench.db --output bench_output.json
+
+Seeds a fresh database (drops and recreates every table, so point it at a
+scratch SQLite file or a throwaway local MySQL container), then drives
+each scenario through the full ASGI stack with concurrent clients. The
+result is one JSON document with p50/p95/p99 latency, throughput, status
+counts and SQL statements per request for every scenario, tagged with the
+git revision so runs can be diffed across commits.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+from bench import harness
+
+SCENARIOS = ("ticket_drop", "browse", "login_storm", "mass_cancellation", "admission")
+
+
+def ticket_drop(app, data, args, title: str = "Hot drop") -> dict:
+    """Every participant tries to book the same freshly created hot event."""
+    from datetime import datetime, timedelta
+
+    from app.db.session import SessionLocal
+    from app.models.event import Event
+
+    with SessionLocal() as db:
+        hot = Event(title=title, venue="Arena", speaker="Headliner",
+                    event_date=datetime.utcnow() + timedelta(days=30),
+                    total_seats=args.hot_seats, seats_available=args.hot_seats, organizer_id=1)
+        db.add(hot)
+        db.commit()
+        hot_id = hot.id
+    buyers = data["participant_emails"][:args.buyers]
+    headers = [harness.auth_header(email) for email in buyers]
+    jobs = [lambda c, h=h: c.post(f"/events/register/{hot_id}", headers=h) for h in headers]
+    result = harness.drive(app, jobs, args.concurrency)
+    with SessionLocal() as db:
+        result["seats_left"] = db.query(Event.seats_available).filter(Event.id == hot_id).scalar()
+    result["hot_seats"] = args.hot_seats
+    return result
+
+
+def browse(app, data, args) -> dict:
+    """Mixed read traffic: listing pages with filters, single events, my registrations."""
+    rng = random.Random(args.seed)
+    participants = [harness.auth_header(e) for e in data["participant_emails"][:200]]
+    event_ids = data["event_ids"]
+    jobs = []
+    for _ in range(args.requests):
+        roll = rng.random()
+        if roll < 0.4:
+            params = rng.choice(["", "&status=upcoming", "&has_seats=true", "&venue=Hall%203",
+                                 "&fields=id,title,event_date,seats_available"])
+            jobs.append(lambda c, p=params: c.get(f"/events/list?limit=50{p}"))
+        elif roll < 0.8:
+            event_id = rng.choice(event_ids)
+            jobs.append(lambda c, e=event_id: c.get(f"/events/{e}"))
+        else:
+            h = rng.choice(participants)
+            jobs.append(lambda c, h=h: c.get("/events/my/registrations", headers=h))
+    return harness.drive(app, jobs, args.concurrency)
+
+
+def login_storm(app, data, args) -> dict:
+    emails = data["participant_emails"][:args.logins]
+    jobs = [
+        lambda c, e=e: c.post("/auth/token", data={"username": e, "password": harness.PASSWORD})
+        for e in emails
+    ]
+    return harness.drive(app, jobs, args.concurrency)
+
+
+def mass_cancellation(app, data, args) -> dict:
+    """Organizer deletes one event with many registrants; then the outbox is drained."""
+    from sqlalchemy import func
+
+    from app.db.session import SessionLocal
+    from app.email_utils import InMemoryTransport
+    from app.models.event import Event
+    from app.models.registration import Registration
+    from app.services.outbox import OutboxWorkerPool
+
+    with SessionLocal() as db:
+        event_id, registrants = db.query(Registration.event_id, func.count())\
+            .group_by(Registration.event_id)\
+            .order_by(func.count().desc())\
+            .first()
+        organizer_id = db.query(Event.organizer_id).filter(Event.id == event_id).scalar()
+    organizer = harness.auth_header(f"organizer{organizer_id - 1}@bench.local")
+
+    # Earlier scenarios leave emails in the outbox (e.g. ticket_drop confirmations);
+    # send those first so only the cancellation emails are counted below.
+    backlog = InMemoryTransport()
+    OutboxWorkerPool(SessionLocal, lambda: backlog, workers=0, batch_size=1000).drain()
+
+    result = harness.drive(app, [lambda c: c.delete(f"/events/delete/{event_id}", headers=organizer)], 1)
+
+    transport = InMemoryTransport()
+    pool = OutboxWorkerPool(SessionLocal, lambda: transport, workers=0, batch_size=1000)
+    start = time.perf_counter()
+    pool.drain()
+    result["registrants"] = registrants
+    result["outbox_backlog_before"] = backlog.sent_count
+    result["outbox_drain_s"] = round(time.perf_counter() - start, 4)
+    result["emails_sent"] = transport.sent_count
+    result["transport_calls"] = len(transport.batches)
+    return result
+
+
+def admission(app, data, args) -> dict:
+    """ticket_drop on a second hot event with admission control on at its
+    configured limits: how much of the burst is shed (429/503) and how fast."""
+    from app import admission as admission_control
+    from app.config import settings
+
+    previous = os.environ.get("ADMISSION_ENABLED")
+    os.environ["ADMISSION_ENABLED"] = "true"
+    settings.reload()
+    admission_control.buckets.reload()  # fresh token buckets, no tokens spent by earlier scenarios
+    try:
+        result = ticket_drop(app, data, args, title="Hot drop (admission)")
+    finally:
+        os.environ["ADMISSION_ENABLED"] = previous or "false"
+        settings.reload()
+    result["limits"] = {
+        "route_concurrency": settings.ADMISSION_ROUTE_CONCURRENCY.get("register"),
+        "event_concurrency": settings.ADMISSION_EVENT_CONCURRENCY,
+        "rate_limit_per_second": settings.RATE_LIMIT_PER_SECOND,
+        "rate_limit_burst": settings.RATE_LIMIT_BURST,
+    }
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EventHub benchmark suite")
+    parser.add_argument("--database-url", default="sqlite:///bench.db")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--organizers", type=int, default=20)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--registrations-per-event", type=int, default=50)
+    parser.add_argument("--seats-per-event", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=2000, help="browse requests")
+    parser.add_argument("--buyers", type=int, default=1000, help="ticket_drop participants")
+    parser.add_argument("--hot-seats", type=int, default=200, help="ticket_drop capacity")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--db-mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    harness.configure(args.database_url, {"DB_MODE": args.db_mode})
+    harness.reset_database()
+    started = time.perf_counter()
+    data = harness.seed(args.users, args.organizers, args.events, args.registrations_per_event, args.seats_per_event)
+    seed_seconds = time.perf_counter() - started
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    report = {
+        "revision": harness.git_revision(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "scenarios")},
+        "seed_s": round(seed_seconds, 3),
+        "scenarios": {},
+    }
+    # the lifespan includes the routers for DB_MODE; the per-thread clients in harness.drive skip it
+    with TestClient(app):
+        for name in args.scenarios:
+            report["scenarios"][name] = globals()[name](app, data, args)
+            print(f"[bench] {name} done", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Microbenchmark: cost of turning 10k event rows into a JSON response body.
+
+    python -m bench.serialization --events 10000 --repeat 5
+
+Rows are real SQLAlchemy Row tuples from an in-memory SQLite table. Each
+strategy is timed from rows to response bytes (best of --repeat):
+
+- dicts_jsonable_json:     hand-built dicts -> jsonable_encoder -> json.dumps (before)
+- dicts_jsonable_orjson:   hand-built dicts -> jsonable_encoder -> orjson
+- models_dump_json:        model_construct -> pydantic-core dump_json (response_model, default class)
+- models_dump_python_orjson: model_construct -> dump_python(mode="json") -> orjson
+  (what a response_model route costs once an ORJSONResponse default class is set)
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bench import harness
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    harness.configure("sqlite://")
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    from pydantic import TypeAdapter
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from app.models import event, registration, user  # noqa: F401  (configure the mappers)
+    from app.models.event import Event
+    from app.schemas import EventListItem
+    from app.services.listing import ALL_FIELDS, project_rows, select_columns, status_at
+
+    engine = create_engine("sqlite://")
+    Event.__table__.create(engine)
+    now = datetime.utcnow()
+    with Session(engine) as db:
+        db.execute(insert(Event), [
+            {"title": f"Event {i}", "description": "x" * 200, "venue": f"Hall {i % 20}", "speaker": f"Speaker {i}",
+             "event_date": now + timedelta(hours=i), "total_seats": 100, "seats_available": 50, "organizer_id": 1}
+            for i in range(args.events)
+        ])
+        rows = db.query(*select_columns(ALL_FIELDS)).all()
+
+    adapter = TypeAdapter(List[EventListItem])
+
+    def dicts():
+        out = []
+        for r in rows:
+            item = dict(r._mapping)
+            item["status"] = status_at(r.event_date, now)
+            out.append(item)
+        return out
+
+    def models():
+        # what FastAPI does for a response_model: validate (instances pass through) then serialize
+        return adapter.validate_python(project_rows(rows, ALL_FIELDS, now))
+
+    strategies = {
+        "dicts_jsonable_json": lambda: JSONResponse(jsonable_encoder(dicts())).body,
+        "models_dump_json": lambda: adapter.dump_json(models(), exclude_unset=True),
+    }
+    if orjson is not None:
+        strategies["dicts_jsonable_orjson"] = lambda: orjson.dumps(jsonable_encoder(dicts()))
+        strategies["models_dump_python_orjson"] = lambda: orjson.dumps(
+            adapter.dump_python(models(), mode="json", exclude_unset=True))
+
+    # every strategy must produce the same document
+    reference = json.loads(strategies["dicts_jsonable_json"]())
+    for name, fn in strategies.items():
+        assert json.loads(fn()) == reference, name
+
+    per_10k = 10000 / args.events
+    results = {name: round(best_of(args.repeat, fn) * 1000 * per_10k, 2) for name, fn in strategies.items()}
+    baseline = results["dicts_jsonable_json"]
+    print(json.dumps({
+        "benchmark": "serialization",
+        "events": args.events,
+        "orjson": orjson is not None,
+        "ms_per_10k_events": results,
+        "speedup_vs_baseline": {name: round(baseline / ms, 2) for name, ms in results.items()},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
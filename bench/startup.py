@@ -0,0 +1,102 @@
+"""Cold-start benchmark: how long `import app.main` and the lifespan hook take.
+
+    python -m bench.startup --runs 5 --database-url sqlite:///bench.db \
+        --max-import-ms 1500 --output startup.json
+
+Each run is a fresh interpreter, so nothing is cached in-process. Reports
+min/median/max per phase and the heaviest modules from `-X importtime`;
+with --max-import-ms / --max-lifespan-ms it exits non-zero when the median
+goes over budget, which is what CI should run to catch regressions.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from bench import harness
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter() - started
+
+async def lifespan():
+    started = time.perf_counter()
+    async with app.main.app.router.lifespan_context(app.main.app):
+        return time.perf_counter() - started
+
+print(json.dumps({"import": imported, "lifespan": asyncio.run(lifespan())}))
+"""
+
+
+def _env(database_url: str) -> dict:
+    env = {**os.environ, **harness.BENCH_ENV, "DATABASE_URL": database_url, "DB_AUTO_CREATE": "true"}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def run_once(database_url: str) -> dict:
+    out = subprocess.run([sys.executable, "-c", PROBE], env=_env(database_url),
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def heaviest_imports(database_url: str, top: int) -> list:
+    """Top-level packages by the import time spent in their own modules."""
+    err = subprocess.run([sys.executable, "-X", "importtime", "-c", "import app.main"],
+                         env=_env(database_url), capture_output=True, text=True, check=True).stderr
+    totals = {}
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if self_us.isdigit():
+            package = name.split(".")[0]
+            totals[package] = totals.get(package, 0) + int(self_us)
+    return sorted(({"module": m, "ms": round(us / 1000, 1)} for m, us in totals.items()),
+                  key=lambda item: -item["ms"])[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite:///bench_startup.db")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="heaviest imports to list")
+    parser.add_argument("--max-import-ms", type=float, default=0, help="fail if the median import is slower")
+    parser.add_argument("--max-lifespan-ms", type=float, default=0, help="fail if the median lifespan is slower")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    runs = [run_once(args.database_url) for _ in range(args.runs)]
+    report = {"revision": harness.git_revision(), "runs": args.runs, "phases": {}}
+    for phase in ("import", "lifespan"):
+        ms = [r[phase] * 1000 for r in runs]
+        report["phases"][phase] = {
+            "min_ms": round(min(ms), 1),
+            "median_ms": round(statistics.median(ms), 1),
+            "max_ms": round(max(ms), 1),
+        }
+    report["heaviest_imports"] = heaviest_imports(args.database_url, args.top)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+
+    over = [
+        f"{phase} median {report['phases'][phase]['median_ms']} ms > {budget} ms"
+        for phase, budget in (("import", args.max_import_ms), ("lifespan", args.max_lifespan_ms))
+        if budget and report["phases"][phase]["median_ms"] > budget
+    ]
+    if over:
+        print("[bench] startup over budget: " + "; ".join(over), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
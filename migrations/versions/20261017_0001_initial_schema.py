@@ -0,0 +1,75 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 06:15:23.382246
+
+The tables exactly as Base.metadata.create_all made them at import time in
+the first release (users, events, registrations). Every later schema change
+is its own revision, written to skip what a newer create_all already made,
+so any database created at import time is adopted with `alembic stamp 0001`
+followed by `alembic upgrade head`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=120), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.Enum('organizer', 'participant', name='role'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+
+    op.create_table('events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.String(length=2000), nullable=True),
+    sa.Column('venue', sa.String(length=200), nullable=False),
+    sa.Column('speaker', sa.String(length=120), nullable=False),
+    sa.Column('event_date', sa.DateTime(), nullable=False),
+    sa.Column('total_seats', sa.Integer(), nullable=False),
+    sa.Column('seats_available', sa.Integer(), nullable=False),
+    sa.Column('organizer_id', sa.Integer(), nullable=True),
+    sa.CheckConstraint('seats_available >= 0', name='ck_event_seats_nonneg'),
+    sa.ForeignKeyConstraint(['organizer_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_events_id', 'events', ['id'])
+
+    op.create_table('registrations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('event_id', sa.Integer(), nullable=True),
+    sa.Column('seats_booked', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('registered_at', sa.DateTime(), nullable=True),
+    sa.Column('reminder_sent', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_registrations_id', 'registrations', ['id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('registrations')
+    op.drop_table('events')
+    op.drop_table('users')
@@ -0,0 +1,40 @@
+"""listing indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 07:02:00.000000
+
+Keyset pagination indexes of /events/list. Indexes that create_all already
+made on a newer database are left alone.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_events_date_id', ['event_date', 'id']),
+    ('ix_events_organizer_date_id', ['organizer_id', 'event_date', 'id']),
+    ('ix_events_venue_date_id', ['venue', 'event_date', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {i['name'] for i in sa.inspect(op.get_bind()).get_indexes('events')}
+    for name, columns in INDEXES:
+        if name not in existing:
+            op.create_index(name, 'events', columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='events')
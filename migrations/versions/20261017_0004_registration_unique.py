@@ -0,0 +1,54 @@
+"""one registration per user per event
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 07:04:00.000000
+
+Adds uq_registration_user_event, which book_seats relies on instead of a
+pre-check query. Databases from before it can hold several rows for the same
+(user_id, event_id). Those are merged into the earliest row first, with
+their seats added up, so the seats taken from events.seats_available stay
+accounted for.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing = {c['name'] for c in inspector.get_unique_constraints('registrations')}
+    existing |= {i['name'] for i in inspector.get_indexes('registrations')}
+    if 'uq_registration_user_event' in existing:
+        return
+
+    duplicates = conn.execute(sa.text(
+        "SELECT user_id, event_id, MIN(id) AS keep_id, SUM(seats_booked) AS seats FROM registrations "
+        "WHERE user_id IS NOT NULL AND event_id IS NOT NULL "
+        "GROUP BY user_id, event_id HAVING COUNT(*) > 1"
+    )).all()
+    for d in duplicates:
+        conn.execute(sa.text("UPDATE registrations SET seats_booked = :seats WHERE id = :keep_id"),
+                     {"seats": d.seats, "keep_id": d.keep_id})
+        conn.execute(sa.text("DELETE FROM registrations WHERE user_id = :user_id AND event_id = :event_id AND id <> :keep_id"),
+                     {"user_id": d.user_id, "event_id": d.event_id, "keep_id": d.keep_id})
+    if duplicates:
+        print(f"[Migration 0004] merged duplicate registrations of {len(duplicates)} (user, event) pairs")
+
+    with op.batch_alter_table('registrations') as batch_op:
+        batch_op.create_unique_constraint('uq_registration_user_event', ['user_id', 'event_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('registrations') as batch_op:
+        batch_op.drop_constraint('uq_registration_user_event', type_='unique')
@@ -0,0 +1,41 @@
+"""reminder_sent not null, reminder index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 07:05:00.000000
+
+The reminder scheduler filters on reminder_sent = false, which never matches
+NULL. Rows written before the column had a default are set to false before
+it becomes NOT NULL with a server default. Adds
+ix_registrations_event_reminder unless create_all already made it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+registrations = sa.table('registrations', sa.column('reminder_sent', sa.Boolean()))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(registrations.update().where(registrations.c.reminder_sent.is_(None)).values(reminder_sent=False))
+    with op.batch_alter_table('registrations') as batch_op:
+        batch_op.alter_column('reminder_sent', existing_type=sa.Boolean(), nullable=False, server_default=sa.false())
+    existing = {i['name'] for i in sa.inspect(op.get_bind()).get_indexes('registrations')}
+    if 'ix_registrations_event_reminder' not in existing:
+        op.create_index('ix_registrations_event_reminder', 'registrations', ['event_id', 'reminder_sent'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_registrations_event_reminder', table_name='registrations')
+    with op.batch_alter_table('registrations') as batch_op:
+        batch_op.alter_column('reminder_sent', existing_type=sa.Boolean(), nullable=True, server_default=None)
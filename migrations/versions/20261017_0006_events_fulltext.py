@@ -0,0 +1,35 @@
+"""events FULLTEXT index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 07:06:00.000000
+
+ft_events_search behind /events/search on MySQL. Other databases use the
+in-process index in app.services.search and get nothing here.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql':
+        return
+    if 'ft_events_search' not in {i['name'] for i in sa.inspect(bind).get_indexes('events')}:
+        op.create_index('ft_events_search', 'events', ['title', 'description', 'speaker', 'venue'],
+                        mysql_prefix='FULLTEXT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'mysql':
+        op.drop_index('ft_events_search', table_name='events')
@@ -0,0 +1,32 @@
+"""events.version
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 07:07:00.000000
+
+Row version bumped in SQL by every write to an event; feeds the ETags and
+is incremented by every seat UPDATE. Existing rows start at 1.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if 'version' in {c['name'] for c in sa.inspect(op.get_bind()).get_columns('events')}:
+        return
+    op.add_column('events', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('events') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,66 @@
+"""organizer stats
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 06:19:53.469074
+
+Summary tables behind GET /events/my/stats, backfilled from the existing
+registrations (cancellations before this revision are not known and start
+at zero).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('event_stats',
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('organizer_id', sa.Integer(), nullable=False),
+    sa.Column('registrations', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('seats_sold', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('cancellations', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index('ix_event_stats_organizer', 'event_stats', ['organizer_id'])
+
+    op.create_table('organizer_daily_stats',
+    sa.Column('organizer_id', sa.Integer(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('registrations', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('seats_booked', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('cancellations', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('seats_released', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('organizer_id', 'day')
+    )
+
+    op.execute(
+        "INSERT INTO event_stats (event_id, organizer_id, registrations, seats_sold, cancellations) "
+        "SELECT e.id, e.organizer_id, COUNT(r.id), COALESCE(SUM(r.seats_booked), 0), 0 "
+        "FROM events e JOIN registrations r ON r.event_id = e.id "
+        "WHERE e.organizer_id IS NOT NULL "
+        "GROUP BY e.id, e.organizer_id"
+    )
+    op.execute(
+        "INSERT INTO organizer_daily_stats (organizer_id, day, registrations, seats_booked, cancellations, seats_released) "
+        "SELECT e.organizer_id, DATE(r.registered_at), COUNT(r.id), SUM(r.seats_booked), 0, 0 "
+        "FROM registrations r JOIN events e ON e.id = r.event_id "
+        "WHERE e.organizer_id IS NOT NULL AND r.registered_at IS NOT NULL "
+        "GROUP BY e.organizer_id, DATE(r.registered_at)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('organizer_daily_stats')
+    op.drop_table('event_stats')
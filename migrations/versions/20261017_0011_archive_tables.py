@@ -0,0 +1,56 @@
+"""archive tables
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 06:32:00.688165
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, Sequence[str], None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('events_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.String(length=2000), nullable=True),
+    sa.Column('venue', sa.String(length=200), nullable=False),
+    sa.Column('speaker', sa.String(length=120), nullable=False),
+    sa.Column('event_date', sa.DateTime(), nullable=False),
+    sa.Column('total_seats', sa.Integer(), nullable=False),
+    sa.Column('seats_available', sa.Integer(), nullable=False),
+    sa.Column('organizer_id', sa.Integer(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['organizer_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_events_archive_organizer_date_id', 'events_archive', ['organizer_id', 'event_date', 'id'])
+    op.create_table('registrations_archive',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('seats_booked', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('registered_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events_archive.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_registrations_archive_event', 'registrations_archive', ['event_id'])
+    op.create_index('ix_registrations_archive_user_event', 'registrations_archive', ['user_id', 'event_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('registrations_archive')
+    op.drop_table('events_archive')
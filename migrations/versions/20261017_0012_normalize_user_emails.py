@@ -0,0 +1,51 @@
+"""normalize users.email
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 07:12:00.000000
+
+Logins and token lookups compare users.email with the normalized address
+(stripped, lower case), so rows stored in their original case are rewritten.
+Two accounts whose addresses differ only in case (or surrounding spaces)
+cannot be merged automatically; the upgrade stops and lists them instead.
+Afterwards a unique index on lower(email) keeps case variants out.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, Sequence[str], None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MAX_LISTED = 20
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    collisions = conn.execute(sa.text(
+        "SELECT LOWER(TRIM(email)) AS normalized, COUNT(*) AS accounts FROM users "
+        "GROUP BY LOWER(TRIM(email)) HAVING COUNT(*) > 1 ORDER BY normalized"
+    )).all()
+    if collisions:
+        listed = ", ".join(f"{c.normalized} ({c.accounts} accounts)" for c in collisions[:MAX_LISTED])
+        more = f" and {len(collisions) - MAX_LISTED} more" if len(collisions) > MAX_LISTED else ""
+        raise RuntimeError(
+            f"users.email has {len(collisions)} addresses that differ only in case or spaces: {listed}{more}. "
+            "Merge or rename those accounts, then run the upgrade again."
+        )
+
+    conn.execute(sa.text("UPDATE users SET email = LOWER(TRIM(email))"))
+    if 'uq_users_email_lower' not in {i['name'] for i in sa.inspect(conn).get_indexes('users')}:
+        op.create_index('uq_users_email_lower', 'users', [sa.func.lower(sa.column('email'))], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # the original case of the addresses is not restored
+    op.drop_index('uq_users_email_lower', table_name='users')
@@ -0,0 +1,54 @@
+"""keep event_stats of archived events
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 07:40:00.000000
+
+The archive job deletes events from `events`, and the ON DELETE CASCADE on
+event_stats.event_id dropped their dashboard counters with them. The
+foreign key goes, so the row stays with the event's id in events_archive;
+deleting an event removes its row explicitly. Events archived before this
+revision get their row back from registrations_archive (cancellations are
+not known and start at zero).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, Sequence[str], None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_NAME = 'fk_event_stats_event_id_events'
+# names the unnamed SQLite constraint so batch mode can drop it
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    names = [fk['name'] or FK_NAME for fk in sa.inspect(conn).get_foreign_keys('event_stats')
+             if fk['referred_table'] == 'events']
+    with op.batch_alter_table('event_stats', naming_convention=NAMING_CONVENTION) as batch_op:
+        for name in names:
+            batch_op.drop_constraint(name, type_='foreignkey')
+
+    op.execute(
+        "INSERT INTO event_stats (event_id, organizer_id, registrations, seats_sold, cancellations) "
+        "SELECT e.id, e.organizer_id, COUNT(r.id), COALESCE(SUM(r.seats_booked), 0), 0 "
+        "FROM events_archive e JOIN registrations_archive r ON r.event_id = e.id "
+        "WHERE e.organizer_id IS NOT NULL "
+        "AND NOT EXISTS (SELECT 1 FROM event_stats s WHERE s.event_id = e.id) "
+        "GROUP BY e.id, e.organizer_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM event_stats WHERE event_id NOT IN (SELECT id FROM events)")
+    with op.batch_alter_table('event_stats') as batch_op:
+        batch_op.create_foreign_key(FK_NAME, 'events', ['event_id'], ['id'], ondelete='CASCADE')
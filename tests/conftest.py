@@ -0,0 +1,72 @@
+# tests/conftest.py
+"""App under TestClient against a throwaway SQLite database.
+
+Settings are read on first use, so the environment is set here before
+anything touches them. Background workers and schedulers stay off and
+passwords are hashed inline, so every statement a test counts comes from
+the request itself.
+"""
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+_db_dir = tempfile.mkdtemp(prefix="eventhub-tests-")
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_db_dir, 'test.db')}",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "SENDGRID_API_KEY": "unused",
+    "FROM_EMAIL": "noreply@example.com",
+    "DB_AUTO_CREATE": "true",
+    "EMAIL_TRANSPORT": "memory",
+    "OUTBOX_WORKERS": "0",
+    "REMINDER_INTERVAL_SECONDS": "0",
+    "ARCHIVE_INTERVAL_SECONDS": "0",
+    "PASSWORD_HASH_WORKERS": "0",
+    "ADMISSION_ENABLED": "false",
+})
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def signup(client):
+    """signup(role) -> Authorization headers of a new user with that role."""
+    def _signup(role: str = "participant") -> dict:
+        email = f"{role}-{uuid.uuid4().hex[:12]}@example.com"
+        r = client.post("/auth/signup", json={"name": email.split("@")[0], "email": email, "password": "secret1", "role": role})
+        assert r.status_code == 201, r.text
+        r = client.post("/auth/token", data={"username": email, "password": "secret1"})
+        assert r.status_code == 200, r.text
+        return {"Authorization": "Bearer " + r.json()["access_token"]}
+    return _signup
+
+
+@pytest.fixture
+def create_event(client):
+    """create_event(organizer_headers, seats=50, days=7, **fields) -> event id."""
+    def _create(headers: dict, seats: int = 50, days: int = 7, **fields) -> int:
+        r = client.post("/events/create", headers=headers, json={
+            "title": f"Event {uuid.uuid4().hex[:8]}",
+            "description": "d",
+            "venue": "Hall",
+            "speaker": "Speaker",
+            "event_date": (datetime.utcnow() + timedelta(days=days)).isoformat(),
+            "total_seats": seats,
+            **fields,
+        })
+        assert r.status_code == 201, r.text
+        return r.json()["event_id"]
+    return _create
@@ -0,0 +1,78 @@
+# tests/test_admission.py
+"""Admission control: 429 past the per-user token bucket, 503 past the route
+or per-event concurrency limit, and slots freed when requests finish."""
+import pytest
+
+from app import admission
+from app.config import settings
+
+
+@pytest.fixture
+def admission_on(monkeypatch):
+    """admission_on(rate=0, burst=10, routes=None, per_event=0) turns admission
+    control on with those limits for the test (rate 0 = no token bucket)."""
+    def _on(rate: float = 0, burst: int = 10, routes: dict = None, per_event: int = 0) -> None:
+        loaded = settings._load()
+        monkeypatch.setattr(loaded, "ADMISSION_ENABLED", True)
+        monkeypatch.setattr(loaded, "ADMISSION_ROUTE_CONCURRENCY", routes or {})
+        monkeypatch.setattr(loaded, "ADMISSION_EVENT_CONCURRENCY", per_event)
+        monkeypatch.setattr(admission, "buckets", admission.TokenBuckets(rate, burst))
+    return _on
+
+
+@pytest.fixture
+def occupy():
+    """occupy(key, limit) takes a limiter slot as a request still running
+    would; returns the function that gives it back."""
+    held = []
+
+    def _occupy(key: tuple, limit: int):
+        assert admission.limiter.try_acquire(key, limit)
+        held.append(key)
+
+        def finish() -> None:
+            held.remove(key)
+            admission.limiter.release(key)
+        return finish
+    yield _occupy
+    for key in held:
+        admission.limiter.release(key)
+
+
+def test_rate_limit_is_per_user(client, signup, admission_on):
+    participant, other = signup(), signup()
+    admission_on(rate=0.5, burst=2)
+    url = f"/events/register/{10 ** 9}"
+
+    assert [client.post(url, headers=participant).status_code for _ in range(2)] == [404, 404]
+    r = client.post(url, headers=participant)
+    assert (r.status_code, r.headers["Retry-After"]) == (429, "2")
+    assert client.post(url, headers=other).status_code == 404
+
+
+def test_route_concurrency_limit_sheds_with_503(client, signup, create_event, admission_on, occupy):
+    event_id = create_event(signup("organizer"))
+    participant = signup()
+    admission_on(routes={"register": 1})
+    finish = occupy(("route", "register"), 1)
+
+    r = client.post(f"/events/register/{event_id}", headers=participant)
+    assert (r.status_code, r.json()["detail"], r.headers["Retry-After"]) == (503, "Server is busy, please retry", "1")
+    assert client.get(f"/events/{event_id}").status_code == 200  # browsing is not limited
+
+    finish()
+    assert client.post(f"/events/register/{event_id}", headers=participant).status_code == 200
+    assert admission.limiter.in_flight(("route", "register")) == 0
+
+
+def test_event_concurrency_limit_only_holds_back_that_event(client, signup, create_event, admission_on, occupy):
+    organizer = signup("organizer")
+    hot, quiet = create_event(organizer), create_event(organizer)
+    participant = signup()
+    admission_on(per_event=1)
+    occupy(("event", str(hot)), 1)
+
+    r = client.post(f"/events/register/{hot}", headers=participant)
+    assert (r.status_code, r.json()["detail"]) == (503, "This event is in high demand, please retry")
+    assert client.post(f"/events/register/{quiet}", headers=participant).status_code == 200
+    assert admission.limiter.in_flight(("event", str(quiet))) == 0
@@ -0,0 +1,50 @@
+# tests/test_archive.py
+"""The archive job moves a completed event and its registrations; history
+and the organizer dashboard still show it."""
+from datetime import datetime, timedelta
+
+from app.db.session import SessionLocal
+from app.services.archive import archive_completed
+
+
+def stats_of(client, organizer: dict, event_id: int) -> dict:
+    r = client.get("/events/my/stats", headers=organizer)
+    assert r.status_code == 200, r.text
+    return next(e for e in r.json()["per_event"] if e["event_id"] == event_id)
+
+
+def test_archived_event_moves_to_history_and_keeps_its_stats(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer, seats=10, days=1)
+    stays = create_event(organizer, seats=10, days=30)
+    participant, leaver = signup(), signup()
+    assert client.post(f"/events/register/{event_id}", headers=participant, params={"seats": 2}).status_code == 200
+    assert client.post(f"/events/register/{event_id}", headers=leaver).status_code == 200
+    assert client.delete(f"/events/cancel/{event_id}", headers=leaver).status_code == 200
+    before = stats_of(client, organizer, event_id)
+    assert (before["seats_sold"], before["registrations"], before["cancellations"]) == (2, 1, 1)
+
+    with SessionLocal() as db:
+        assert archive_completed(db, now=datetime.utcnow() + timedelta(days=1, hours=1), after_days=0) >= 1
+
+    assert client.get(f"/events/{event_id}").status_code == 404
+    assert client.get(f"/events/{stays}").status_code == 200
+    history = client.get("/events/my/history", headers=participant).json()
+    assert [(h["event_id"], h["seats_booked"], h["status"]) for h in history] == [(event_id, 2, "completed")]
+    archived = client.get("/events/archive/list", headers=organizer).json()
+    assert [(e["id"], e["seats_sold"]) for e in archived] == [(event_id, 2)]
+
+    after = stats_of(client, organizer, event_id)
+    assert after == before
+    assert client.get("/events/my/stats", headers=organizer).json()["events"] == 2
+
+
+def test_deleting_an_event_drops_its_stats(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer)
+    assert client.post(f"/events/register/{event_id}", headers=signup()).status_code == 200
+    assert client.delete(f"/events/delete/{event_id}", headers=organizer).status_code == 200
+
+    r = client.get("/events/my/stats", headers=organizer)
+    assert r.json()["per_event"] == []
+    assert r.json()["daily"][-1]["cancellations"] == 1
@@ -0,0 +1,15 @@
+# tests/test_auth.py
+"""Emails are stored normalized, so any spelling of the address logs in."""
+import uuid
+
+
+def test_login_ignores_the_case_of_the_email(client):
+    local = f"Dana.{uuid.uuid4().hex[:8]}"
+    r = client.post("/auth/signup", json={"name": "Dana", "email": f"{local}@Example.COM", "password": "secret1", "role": "participant"})
+    assert r.status_code == 201, r.text
+
+    r = client.post("/auth/token", data={"username": f" {local.upper()}@example.com ", "password": "secret1"})
+    assert r.status_code == 200, r.text
+
+    r = client.post("/auth/signup", json={"name": "Dana", "email": f"{local.lower()}@example.com", "password": "secret1", "role": "participant"})
+    assert r.status_code == 400
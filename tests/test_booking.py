@@ -0,0 +1,49 @@
+# tests/test_booking.py
+"""The conditional seat UPDATE never oversells, and the unique constraint
+turns a second booking of the same event into a 409."""
+from concurrent.futures import ThreadPoolExecutor
+
+SEATS = 3
+BUYERS = 8
+
+
+def seats_available(client, event_id: int) -> int:
+    r = client.get(f"/events/{event_id}")
+    assert r.status_code == 200, r.text
+    return r.json()["seats_available"]
+
+
+def test_concurrent_buyers_never_oversell(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer, seats=SEATS)
+    buyers = [signup() for _ in range(BUYERS)]
+
+    with ThreadPoolExecutor(BUYERS) as pool:
+        responses = list(pool.map(lambda headers: client.post(f"/events/register/{event_id}", headers=headers), buyers))
+
+    codes = sorted(r.status_code for r in responses)
+    assert codes == [200] * SEATS + [400] * (BUYERS - SEATS), [r.text for r in responses]
+    assert {r.json()["detail"] for r in responses if r.status_code == 400} == {"Not enough seats available"}
+    assert seats_available(client, event_id) == 0
+    r = client.get(f"/events/registrations/{event_id}", headers=organizer)
+    assert len(r.json()) == SEATS
+
+
+def test_a_booking_larger_than_the_remaining_seats_takes_none(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer, seats=SEATS)
+    r = client.post(f"/events/register/{event_id}", headers=signup(), params={"seats": SEATS + 1})
+    assert r.status_code == 400
+    assert seats_available(client, event_id) == SEATS
+
+
+def test_booking_the_same_event_twice_is_a_conflict(client, signup, create_event):
+    event_id = create_event(signup("organizer"), seats=SEATS)
+    participant = signup()
+    assert client.post(f"/events/register/{event_id}", headers=participant).status_code == 200
+
+    r = client.post(f"/events/register/{event_id}", headers=participant)
+    assert r.status_code == 409
+    assert r.json()["detail"] == "Already registered for this event"
+    # the seat taken by the failed attempt was rolled back with it
+    assert seats_available(client, event_id) == SEATS - 1
@@ -0,0 +1,73 @@
+# tests/test_bulk_registration.py
+"""POST /events/register/bulk: all_or_nothing rolls every item back on the
+first failure; otherwise each item runs in its own savepoint."""
+import uuid
+
+
+def bulk(client, headers: dict, items: list, all_or_nothing: bool):
+    return client.post("/events/register/bulk", headers=headers,
+                       json={"items": items, "all_or_nothing": all_or_nothing})
+
+
+def seats_available(client, event_id: int) -> int:
+    return client.get(f"/events/{event_id}").json()["seats_available"]
+
+
+def test_all_or_nothing_books_nothing_when_one_item_fails(client, signup, create_event):
+    organizer = signup("organizer")
+    roomy, full = create_event(organizer, seats=10), create_event(organizer, seats=1)
+    participant = signup()
+
+    r = bulk(client, participant, [{"event_id": roomy, "seats": 2}, {"event_id": full, "seats": 2}], True)
+    assert r.status_code == 400
+    assert r.json()["detail"] == {"errors": [{"index": 1, "detail": "Not enough seats available"}]}
+    assert (seats_available(client, roomy), seats_available(client, full)) == (10, 1)
+    assert client.get("/events/my/registrations", headers=participant).json()["registered_events"] == []
+
+
+def test_all_or_nothing_rejects_unknown_events_before_booking(client, signup, create_event):
+    event_id = create_event(signup("organizer"), seats=10)
+    r = bulk(client, signup(), [{"event_id": event_id}, {"event_id": 10 ** 9}], True)
+    assert r.status_code == 400
+    assert r.json()["detail"] == {"errors": [{"index": 1, "detail": "Event not found"}]}
+    assert seats_available(client, event_id) == 10
+
+
+def test_per_item_mode_keeps_the_items_that_succeed(client, signup, create_event):
+    organizer = signup("organizer")
+    roomy, full, booked = create_event(organizer, seats=10), create_event(organizer, seats=1), create_event(organizer)
+    participant = signup()
+    assert client.post(f"/events/register/{booked}", headers=participant).status_code == 200
+
+    r = bulk(client, participant, [{"event_id": roomy, "seats": 2}, {"event_id": full, "seats": 2},
+                                   {"event_id": booked}], False)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["booked"], body["failed"]) == (1, 2)
+    assert [(i["status"], i["detail"]) for i in body["results"]] == [
+        ("booked", None),
+        ("failed", "Not enough seats available"),
+        ("failed", "Already registered for this event"),
+    ]
+    assert (seats_available(client, roomy), seats_available(client, full)) == (8, 1)
+    registered = client.get("/events/my/registrations", headers=participant).json()["registered_events"]
+    assert {e["event_id"] for e in registered} == {roomy, booked}
+
+
+def test_organizers_book_participants_into_their_own_events_only(client, signup, create_event):
+    organizer, other = signup("organizer"), signup("organizer")
+    own, foreign = create_event(organizer), create_event(other)
+    email = f"group-{uuid.uuid4().hex[:12]}@example.com"
+    r = client.post("/auth/signup", json={"name": "Group", "email": email, "password": "secret1", "role": "participant"})
+    assert r.status_code == 201, r.text
+
+    r = bulk(client, organizer, [{"event_id": own, "user_email": email},
+                                 {"event_id": foreign, "user_email": email},
+                                 {"event_id": own, "user_email": "nobody@example.com"}], False)
+    assert r.status_code == 200, r.text
+    assert [(i["status"], i["detail"]) for i in r.json()["results"]] == [
+        ("booked", None),
+        ("failed", "Not your event"),
+        ("failed", "user_email must be a registered participant"),
+    ]
+    assert seats_available(client, own) == 49
@@ -0,0 +1,51 @@
+# tests/test_etags.py
+"""Conditional GETs: a matching If-None-Match is a 304, and any write to
+the event (an update or a booking) changes the tag."""
+import uuid
+
+
+def test_event_etag_revalidates_until_the_event_changes(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer)
+
+    r = client.get(f"/events/{event_id}")
+    assert r.status_code == 200
+    etag = r.headers["ETag"]
+    r = client.get(f"/events/{event_id}", headers={"If-None-Match": etag})
+    assert (r.status_code, r.content, r.headers["ETag"]) == (304, b"", etag)
+    assert client.get(f"/events/{event_id}", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+
+    assert client.put(f"/events/update/{event_id}", headers=organizer, json={"venue": "Annex"}).status_code == 200
+    r = client.get(f"/events/{event_id}", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["venue"] == "Annex"
+    updated = r.headers["ETag"]
+    assert updated != etag
+
+    assert client.post(f"/events/register/{event_id}", headers=signup()).status_code == 200
+    r = client.get(f"/events/{event_id}", headers={"If-None-Match": updated})
+    assert r.status_code == 200
+    assert r.headers["ETag"] != updated
+
+
+def test_listing_etag_follows_the_page(client, signup, create_event):
+    organizer = signup("organizer")
+    venue = f"Hall {uuid.uuid4().hex[:8]}"
+    event_id = create_event(organizer, venue=venue)
+    params = {"venue": venue}
+
+    r = client.get("/events/list", params=params)
+    assert [e["id"] for e in r.json()] == [event_id]
+    etag = r.headers["ETag"]
+    assert client.get("/events/list", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    assert client.put(f"/events/update/{event_id}", headers=organizer, json={"title": "Renamed"}).status_code == 200
+    r = client.get("/events/list", params=params, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()[0]["title"] == "Renamed"
+    assert r.headers["ETag"] != etag
+
+    second = create_event(organizer, venue=venue, days=8)
+    r = client.get("/events/list", params=params, headers={"If-None-Match": r.headers["ETag"]})
+    assert r.status_code == 200
+    assert [e["id"] for e in r.json()] == [event_id, second]
@@ -0,0 +1,79 @@
+# tests/test_event_import.py
+"""POST /events/import: valid rows are created, the others are reported by
+row number, and a chunk the database rejects is reported without aborting
+the import."""
+import json
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import InvalidRequestError
+
+from app.db.session import SessionLocal
+from app.services.event_import import _insert_chunk
+
+FUTURE = (datetime.utcnow() + timedelta(days=30)).isoformat()
+PAST = (datetime.utcnow() - timedelta(days=1)).isoformat()
+
+
+def upload(client, headers: dict, filename: str, content: str, **params):
+    r = client.post("/events/import", headers=headers, params=params,
+                    files={"file": (filename, content.encode(), "application/octet-stream")})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_csv_rows_are_validated_one_by_one(client, signup):
+    organizer = signup("organizer")
+    venue = f"Hall {uuid.uuid4().hex[:8]}"
+    content = "\n".join([
+        "title,description,venue,speaker,event_date,total_seats",
+        f"Kept,d,{venue},S,{FUTURE},10",
+        f"Past,d,{venue},S,{PAST},10",
+        f"No seats,d,{venue},S,{FUTURE},",
+        f"{'x' * 201},d,{venue},S,{FUTURE},10",
+        f"Too many,d,{venue},S,{FUTURE},10,extra",
+        f"Also kept,,{venue},S,{FUTURE},5",
+    ])
+
+    result = upload(client, organizer, "events.csv", content)
+    assert (result["created"], result["failed"], result["errors_truncated"]) == (2, 4, False)
+    assert [e["row"] for e in result["errors"]] == [2, 3, 4, 5]
+    details = [e["detail"] for e in result["errors"]]
+    assert details[0] == "event_date must be in the future"
+    assert details[1].startswith("total_seats:")
+    assert details[2] == "title: at most 200 characters"
+    assert details[3] == "too many columns"
+
+    listed = client.get("/events/list", params={"venue": venue}).json()
+    assert sorted(e["title"] for e in listed) == ["Also kept", "Kept"]
+
+
+def test_ndjson_reports_lines_that_are_not_objects(client, signup):
+    event = {"title": "Line", "venue": "Hall", "speaker": "S", "event_date": FUTURE, "total_seats": 3}
+    content = "\n".join([json.dumps(event), "{not json", "", "[1, 2]", json.dumps({**event, "total_seats": -1})])
+
+    result = upload(client, signup("organizer"), "upload.txt", content, format="ndjson")
+    assert result["created"] == 1
+    assert [(e["row"], e["detail"].split(":")[0]) for e in result["errors"]] == [
+        (2, "invalid JSON"), (3, "each line must be a JSON object"), (4, "total_seats must not be negative"),
+    ]
+
+
+def test_unknown_format_is_rejected(client, signup):
+    r = client.post("/events/import", headers=signup("organizer"),
+                    files={"file": ("events.xlsx", b"", "application/octet-stream")})
+    assert r.status_code == 400
+
+
+def test_a_rejected_chunk_is_reported_not_raised(client):
+    row = {"title": "T", "description": None, "venue": "V", "speaker": "S", "event_date": datetime.utcnow(),
+           "total_seats": 1, "seats_available": 1, "organizer_id": 10 ** 9}
+    with SessionLocal() as db:
+        assert _insert_chunk(db, [row]) == "database error: IntegrityError"  # unknown organizer
+
+        def execute(*args, **kwargs):
+            raise InvalidRequestError("session is closed")
+
+        # errors raised by SQLAlchemy itself carry no driver exception
+        db.execute = execute
+        assert _insert_chunk(db, [row]) == "database error: InvalidRequestError"
@@ -0,0 +1,102 @@
+# tests/test_idempotency.py
+"""Idempotency-Key: retries replay the first response, a reused key with a
+different request is a 422, and a duplicate of a running request is a 409."""
+import threading
+import uuid
+
+import pytest
+
+from app.config import settings
+from app.db.session import SessionLocal
+from app.services import events as service
+from app.services.idempotency import DatabaseStore, Outcome
+
+
+def key() -> dict:
+    return {"Idempotency-Key": uuid.uuid4().hex}
+
+
+def seats_available(client, event_id: int) -> int:
+    return client.get(f"/events/{event_id}").json()["seats_available"]
+
+
+def test_a_retried_booking_is_replayed_not_rebooked(client, signup, create_event):
+    event_id = create_event(signup("organizer"), seats=5)
+    headers = {**signup(), **key()}
+
+    first = client.post(f"/events/register/{event_id}", headers=headers, params={"seats": 2})
+    assert first.status_code == 200, first.text
+    assert "Idempotent-Replayed" not in first.headers
+    retry = client.post(f"/events/register/{event_id}", headers=headers, params={"seats": 2})
+    assert (retry.status_code, retry.json(), retry.headers["Idempotent-Replayed"]) == (200, first.json(), "true")
+    assert seats_available(client, event_id) == 3
+
+    # a new key is a new request: the duplicate booking is refused
+    r = client.post(f"/events/register/{event_id}", headers={**headers, **key()}, params={"seats": 2})
+    assert r.status_code == 409
+
+
+def test_client_errors_are_replayed_too(client, signup, create_event):
+    event_id = create_event(signup("organizer"), seats=1)
+    headers = {**signup(), **key()}
+    assert client.post(f"/events/register/{event_id}", headers=headers, params={"seats": 2}).status_code == 400
+    r = client.post(f"/events/register/{event_id}", headers=headers, params={"seats": 2})
+    assert (r.status_code, r.headers["Idempotent-Replayed"]) == (400, "true")
+
+
+def test_reusing_a_key_for_a_different_request_is_rejected(client, signup):
+    headers = {**signup("organizer"), **key()}
+    payload = {"title": "Launch", "description": "d", "venue": "Hall", "speaker": "S",
+               "event_date": "2099-01-01T10:00:00", "total_seats": 10}
+    first = client.post("/events/create", headers=headers, json=payload)
+    assert first.status_code == 201, first.text
+    assert client.post("/events/create", headers=headers, json=payload).json() == first.json()
+
+    r = client.post("/events/create", headers=headers, json={**payload, "total_seats": 20})
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Idempotency-Key was already used for a different request"
+
+
+@pytest.mark.skipif(settings.DB_MODE == "async",
+                    reason="the async route books on the event loop, which a held booking would block")
+def test_a_duplicate_of_a_running_request_gets_409(client, signup, create_event, monkeypatch):
+    event_id = create_event(signup("organizer"), seats=5)
+    headers = {**signup(), **key()}
+    started, release = threading.Event(), threading.Event()
+    register = service.register
+
+    def slow_register(*args):
+        started.set()
+        assert release.wait(5)
+        return register(*args)
+
+    monkeypatch.setattr(service, "register", slow_register)
+    responses = []
+    first = threading.Thread(target=lambda: responses.append(
+        client.post(f"/events/register/{event_id}", headers=headers)))
+    first.start()
+    try:
+        assert started.wait(5)
+        r = client.post(f"/events/register/{event_id}", headers=headers)
+        assert r.status_code == 409
+        assert r.headers["Retry-After"] == "1"
+    finally:
+        release.set()
+        first.join(5)
+
+    assert responses[0].status_code == 200, responses[0].text
+    assert client.post(f"/events/register/{event_id}", headers=headers).headers["Idempotent-Replayed"] == "true"
+    assert seats_available(client, event_id) == 4
+
+
+def test_database_store_shares_keys_between_processes(client):
+    scope = (10 ** 9, uuid.uuid4().hex)
+    first, second = DatabaseStore(SessionLocal, 60), DatabaseStore(SessionLocal, 60)
+
+    assert first.reserve(scope, "fp") is None
+    assert second.reserve(scope, "fp") == Outcome("fp", None, None)  # in progress elsewhere
+    first.complete(scope, Outcome("fp", 200, b'{"ok": true}'))
+    assert second.reserve(scope, "fp") == Outcome("fp", 200, b'{"ok": true}')
+    first.release(scope)
+    assert second.reserve(scope, "other") is None
+    second.release(scope)
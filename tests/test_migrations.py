@@ -0,0 +1,52 @@
+# tests/test_migrations.py
+"""Data migrations, run with the alembic CLI against a scratch SQLite file."""
+import os
+import sqlite3
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def alembic(db_path: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}"}
+    return subprocess.run([sys.executable, "-m", "alembic", *args], cwd=ROOT, env=env, capture_output=True, text=True)
+
+
+def add_users(db_path: str, *emails: str) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("INSERT INTO users (name, email, password_hash, role) VALUES ('n', ?, 'h', 'participant')",
+                         [(email,) for email in emails])
+
+
+def emails(db_path: str) -> list:
+    with sqlite3.connect(db_path) as conn:
+        return [row[0] for row in conn.execute("SELECT email FROM users ORDER BY id")]
+
+
+def test_0012_lowercases_emails_and_indexes_them(tmp_path):
+    db = str(tmp_path / "m.db")
+    assert alembic(db, "upgrade", "0011").returncode == 0
+    add_users(db, "Alice@Example.COM", " bob@example.com ")
+
+    result = alembic(db, "upgrade", "head")
+    assert result.returncode == 0, result.stderr
+    assert emails(db) == ["alice@example.com", "bob@example.com"]
+    with sqlite3.connect(db) as conn:
+        try:
+            conn.execute("INSERT INTO users (name, email, password_hash, role) VALUES ('n', 'ALICE@example.com', 'h', 'participant')")
+        except sqlite3.IntegrityError as e:
+            assert "uq_users_email_lower" in str(e)
+        else:
+            raise AssertionError("case variant accepted")
+
+
+def test_0012_stops_on_case_only_duplicates(tmp_path):
+    db = str(tmp_path / "m.db")
+    assert alembic(db, "upgrade", "0011").returncode == 0
+    add_users(db, "carol@example.com", "Carol@Example.com")
+
+    result = alembic(db, "upgrade", "head")
+    assert result.returncode != 0
+    assert "carol@example.com (2 accounts)" in result.stderr
+    assert emails(db) == ["carol@example.com", "Carol@Example.com"]  # nothing rewritten
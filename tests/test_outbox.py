@@ -0,0 +1,118 @@
+# tests/test_outbox.py
+"""Outbox retries: backoff per attempt, giving up after max_attempts, and
+resending only the recipients a partial delivery did not reach."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import delete, select, update
+
+from app.db.session import SessionLocal
+from app.email_utils import EmailTransport, InMemoryTransport, PartialDeliveryError
+from app.models.outbox import EmailOutbox
+from app.services.outbox import OutboxWorkerPool, enqueue_batch
+
+BACKOFF = 10.0
+
+
+class FlakyTransport(EmailTransport):
+    """Delivers the first `deliver` recipients of every batch, then fails."""
+
+    def __init__(self, deliver: int = 0):
+        self.deliver = deliver
+        self.delivered = []
+
+    def send_batch(self, recipients, subject, body, send_at=None):
+        self.delivered.extend(r.email for r in recipients[:self.deliver])
+        if self.deliver < len(recipients):
+            error = RuntimeError("provider unavailable")
+            if self.deliver:
+                raise PartialDeliveryError(self.deliver, error)
+            raise error
+
+
+@pytest.fixture
+def enqueue(client):
+    """enqueue(n) -> the n recipient addresses, queued as one batch on an empty outbox."""
+    with SessionLocal() as db:
+        db.execute(delete(EmailOutbox))
+        db.commit()
+
+    def _enqueue(n: int) -> list:
+        emails = [f"r{i}@example.com" for i in range(n)]
+        with SessionLocal() as db:
+            enqueue_batch(db, [(email, f"R{i}") for i, email in enumerate(emails)], "Hello", "Hi -name-")
+            db.commit()
+        return emails
+    return _enqueue
+
+
+def rows() -> dict:
+    with SessionLocal() as db:
+        return {r.to_email: r for r in db.scalars(select(EmailOutbox))}
+
+
+def make_due() -> None:
+    with SessionLocal() as db:
+        db.execute(update(EmailOutbox).values(next_attempt_at=datetime.utcnow() - timedelta(seconds=1)))
+        db.commit()
+
+
+def pool(transport, max_attempts: int = 5) -> OutboxWorkerPool:
+    return OutboxWorkerPool(SessionLocal, lambda: transport, max_attempts=max_attempts, backoff_seconds=BACKOFF)
+
+
+def test_partial_delivery_retries_only_the_rest(enqueue):
+    emails = enqueue(5)
+    assert pool(FlakyTransport(deliver=2)).drain_once() == 5
+
+    state = rows()
+    assert [state[e].status for e in emails] == ["sent", "sent", "pending", "pending", "pending"]
+    assert all(state[e].attempts == 1 for e in emails[2:])
+
+    # not due yet: the backoff holds the rest back
+    retry = InMemoryTransport()
+    assert pool(retry).drain_once() == 0
+
+    make_due()
+    assert pool(retry).drain() == 3
+    assert [r.email for r in retry.batches[0]["recipients"]] == emails[2:]
+    assert {r.status for r in rows().values()} == {"sent"}
+
+
+def test_backoff_doubles_until_max_attempts(enqueue):
+    [email] = enqueue(1)
+    failing = pool(FlakyTransport(), max_attempts=3)
+
+    for attempt, delay in ((1, BACKOFF), (2, 2 * BACKOFF)):
+        before = datetime.utcnow()
+        assert failing.drain_once() == 1
+        row = rows()[email]
+        assert (row.status, row.attempts) == ("pending", attempt)
+        assert before + timedelta(seconds=delay) <= row.next_attempt_at <= datetime.utcnow() + timedelta(seconds=delay)
+        assert row.last_error == "provider unavailable"
+        make_due()
+
+    assert failing.drain_once() == 1
+    assert (rows()[email].status, rows()[email].attempts) == ("failed", 3)
+    make_due()
+    assert failing.drain_once() == 0
+
+
+def test_sendgrid_reports_the_chunks_it_delivered():
+    from app.email_utils import Recipient, SendGridTransport
+
+    class Client:
+        def __init__(self):
+            self.calls = 0
+
+        def send(self, message):
+            self.calls += 1
+            return type("Response", (), {"status_code": 202 if self.calls == 1 else 503})()
+
+    transport = SendGridTransport("key", "noreply@example.com")
+    transport.MAX_PERSONALIZATIONS = 2
+    transport._client = Client()
+    with pytest.raises(PartialDeliveryError) as info:
+        transport.send_batch([Recipient(f"r{i}@example.com") for i in range(5)], "Hello", "Hi")
+    assert info.value.delivered == 2
+    assert transport._client.calls == 2
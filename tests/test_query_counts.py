@@ -0,0 +1,60 @@
+# tests/test_query_counts.py
+"""Query budgets of the endpoints that used to lazy-load per row (N+1).
+
+Each event has several registrations; the budgets must not depend on how
+many. Authentication is served from the principal cache once the user has
+made a request, so the counts are those of the handlers themselves.
+"""
+import pytest
+
+from app.db.query_counter import assert_max_queries
+
+PARTICIPANTS = 5
+
+
+@pytest.fixture
+def seeded(client, signup, create_event):
+    """An organizer with two events, each booked by PARTICIPANTS participants."""
+    organizer = signup("organizer")
+    events = [create_event(organizer), create_event(organizer)]
+    participants = [signup() for _ in range(PARTICIPANTS)]
+    for headers in participants:
+        for event_id in events:
+            r = client.post(f"/events/register/{event_id}", headers=headers)
+            assert r.status_code == 200, r.text
+    return organizer, events, participants
+
+
+def test_my_registrations(client, seeded):
+    _, events, participants = seeded
+    with assert_max_queries(1):
+        r = client.get("/events/my/registrations", headers=participants[0])
+    assert r.status_code == 200
+    assert {e["event_id"] for e in r.json()["registered_events"]} == set(events)
+
+
+def test_view_event_registrations(client, seeded):
+    organizer, events, _ = seeded
+    with assert_max_queries(2):
+        r = client.get(f"/events/registrations/{events[0]}", headers=organizer)
+    assert r.status_code == 200
+    assert len(r.json()) == PARTICIPANTS
+
+
+def test_update_event(client, seeded):
+    organizer, events, _ = seeded
+    with assert_max_queries(6):
+        r = client.put(f"/events/update/{events[0]}", headers=organizer, json={"title": "Renamed", "total_seats": 60})
+    assert r.status_code == 200, r.text
+
+
+def test_delete_event(client, seeded):
+    organizer, events, participants = seeded
+    # registrations go with the event (ON DELETE CASCADE), they are never loaded;
+    # its event_stats row has no foreign key and is deleted on its own
+    with assert_max_queries(7) as counter:
+        r = client.delete(f"/events/delete/{events[1]}", headers=organizer)
+    assert r.status_code == 200, r.text
+    assert not [s for s in counter.statements if s.lstrip().upper().startswith("DELETE FROM REGISTRATIONS")]
+    r = client.get("/events/my/registrations", headers=participants[0])
+    assert [e["event_id"] for e in r.json()["registered_events"]] == [events[0]]
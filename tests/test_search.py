@@ -0,0 +1,101 @@
+# tests/test_search.py
+"""Ranking of /events/search and the in-process index following writes,
+including writes committed while a refresh is rebuilding it."""
+import contextlib
+import threading
+import uuid
+
+from app.services.search import InvertedIndex, SearchIndex
+
+
+def word() -> str:
+    return "w" + uuid.uuid4().hex[:10]
+
+
+def search(client, q: str) -> list:
+    r = client.get("/events/search", params={"q": q})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_title_matches_rank_above_description_matches(client, signup, create_event):
+    organizer = signup("organizer")
+    term = word()
+    in_description = create_event(organizer, description=f"an evening about {term}")
+    in_title = create_event(organizer, title=f"{term} summit")
+
+    results = search(client, term)
+    assert [e["id"] for e in results] == [in_title, in_description]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_index_follows_insert_update_and_delete(client, signup, create_event):
+    organizer = signup("organizer")
+    old, new = word(), word()
+    event_id = create_event(organizer, title=f"{old} night")
+    assert [e["id"] for e in search(client, old)] == [event_id]
+
+    r = client.put(f"/events/update/{event_id}", headers=organizer, json={"title": f"{new} night"})
+    assert r.status_code == 200, r.text
+    assert search(client, old) == []
+    assert [e["id"] for e in search(client, new)] == [event_id]
+
+    r = client.delete(f"/events/delete/{event_id}", headers=organizer)
+    assert r.status_code == 200, r.text
+    assert search(client, new) == []
+
+
+class BlockingIndex(SearchIndex):
+    """Builds {1: "old one", 2: "doomed"} once `release` is set."""
+
+    def __init__(self):
+        super().__init__(refresh_seconds=0, session_factory=contextlib.nullcontext)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def _build(self, db):
+        self.started.set()
+        assert self.release.wait(5)
+        index = InvertedIndex()
+        index.add(1, {"title": "old one"})
+        index.add(2, {"title": "doomed"})
+        return index
+
+    def wait_for_build(self):
+        with self._build_lock:
+            pass
+
+
+def ids(index: InvertedIndex, q: str) -> list:
+    return [event_id for event_id, _ in index.search(q, 10)[0]]
+
+
+def test_changes_during_a_refresh_are_replayed_onto_the_new_index():
+    search_index = BlockingIndex()
+    current = search_index._index = InvertedIndex()
+    search_index.refresh_in_background()
+    assert search_index.started.wait(5)
+
+    search_index.apply({1: {"title": "renamed"}, 2: None, 3: {"title": "fresh"}})
+    assert ids(current, "fresh") == [3]  # searches during the build see the change too
+    search_index.release.set()
+    search_index.wait_for_build()
+
+    rebuilt = search_index._index
+    assert rebuilt is not current
+    assert ids(rebuilt, "renamed") == [1]
+    assert ids(rebuilt, "old") == []
+    assert ids(rebuilt, "doomed") == []
+    assert ids(rebuilt, "fresh") == [3]
+
+
+def test_a_refresh_started_before_invalidate_is_discarded():
+    search_index = BlockingIndex()
+    search_index._index = InvertedIndex()
+    search_index.refresh_in_background()
+    assert search_index.started.wait(5)
+
+    search_index.invalidate()
+    search_index.release.set()
+    search_index.wait_for_build()
+    assert search_index._index is None
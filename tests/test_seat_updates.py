@@ -0,0 +1,27 @@
+# tests/test_seat_updates.py
+"""The per-channel resync keeps running when a read fails."""
+import asyncio
+
+from app.services.seat_updates import SeatBroadcaster
+
+
+def test_resync_survives_a_failed_read():
+    reads = []
+
+    class Broadcaster(SeatBroadcaster):
+        def read(self, event_id):
+            reads.append(event_id)
+            if len(reads) == 1:
+                raise RuntimeError("database unavailable")
+            return 7
+
+    async def scenario():
+        broadcaster = Broadcaster(session_factory=None, max_per_second=0, resync_seconds=0.01)
+        queue = broadcaster.subscribe(1, initial=10)
+        try:
+            return await asyncio.wait_for(queue.get(), 2)
+        finally:
+            broadcaster.unsubscribe(1, queue)
+
+    assert asyncio.run(scenario()) == 7
+    assert len(reads) >= 2
@@ -0,0 +1,33 @@
+# tests/test_startup.py
+"""Importing the app reads no settings; the lifespan includes the routes once."""
+import os
+import subprocess
+import sys
+
+from app.main import app, include_routers
+
+PROBE = """
+import app.main
+from app.admission import buckets
+from app.auth.hashing_pool import password_pool
+from app.config import settings
+from app.services.search import search_index
+assert settings._settings is None, "settings read at import"
+assert not any(s.loaded() for s in (buckets, password_pool, search_index)), "singleton built at import"
+assert not getattr(app.main.app.state, "routers_included", False), "routes chosen at import"
+"""
+
+
+def test_import_has_no_side_effects():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {"PATH": os.environ.get("PATH", ""), "PYTHONPATH": root}
+    result = subprocess.run([sys.executable, "-c", PROBE], cwd=root, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_lifespan_includes_routes_once(client):
+    routes = list(app.routes)
+    include_routers(app)
+    assert app.routes == routes
+    assert client.get("/events/list").status_code == 200
+    assert "/events/list" in client.get("/openapi.json").json()["paths"]
@@ -0,0 +1,40 @@
+# tests/test_stats.py
+"""Dashboard counters after bookings, cancellations and an event deletion."""
+
+
+def dashboard(client, organizer: dict) -> dict:
+    r = client.get("/events/my/stats", headers=organizer)
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_counters_follow_bookings_cancellations_and_deletes(client, signup, create_event):
+    organizer = signup("organizer")
+    kept, deleted = create_event(organizer, seats=10), create_event(organizer, seats=10, days=8)
+    first, second, third = signup(), signup(), signup()
+    assert client.post(f"/events/register/{kept}", headers=first, params={"seats": 3}).status_code == 200
+    assert client.post(f"/events/register/{kept}", headers=second).status_code == 200
+    assert client.post(f"/events/register/{deleted}", headers=third, params={"seats": 2}).status_code == 200
+    assert client.delete(f"/events/cancel/{kept}", headers=second).status_code == 200
+
+    stats = dashboard(client, organizer)
+    per_event = {e["event_id"]: e for e in stats["per_event"]}
+    assert {k: per_event[kept][k] for k in ("seats_sold", "registrations", "cancellations", "fill_rate")} == {
+        "seats_sold": 3, "registrations": 1, "cancellations": 1, "fill_rate": 0.3,
+    }
+    assert (stats["events"], stats["total_seats"], stats["seats_sold"], stats["registrations"]) == (2, 20, 5, 2)
+    [today] = stats["daily"]
+    assert {k: today[k] for k in ("registrations", "seats_booked", "cancellations", "seats_released")} == {
+        "registrations": 3, "seats_booked": 6, "cancellations": 1, "seats_released": 1,
+    }
+
+    # an upcoming event's remaining registrations count as cancellations of the day
+    assert client.delete(f"/events/delete/{deleted}", headers=organizer).status_code == 200
+    stats = dashboard(client, organizer)
+    assert [e["event_id"] for e in stats["per_event"]] == [kept]
+    assert (stats["events"], stats["seats_sold"]) == (1, 3)
+    assert (stats["daily"][0]["cancellations"], stats["daily"][0]["seats_released"]) == (2, 3)
+
+
+def test_participants_have_no_dashboard(client, signup):
+    assert client.get("/events/my/stats", headers=signup()).status_code == 403
@@ -0,0 +1,64 @@
+# tests/test_waitlist.py
+"""Seats freed by a cancellation or added by the organizer go to the
+waitlist strictly in arrival order."""
+
+
+def join(client, event_id: int, headers: dict, seats: int = 1) -> dict:
+    r = client.post(f"/events/{event_id}/waitlist", headers=headers, params={"seats": seats})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def state(client, event_id: int, headers: dict) -> tuple:
+    body = client.get(f"/events/{event_id}/waitlist/position", headers=headers).json()
+    return body["status"], body.get("position")
+
+
+def test_fifo_promotion_on_cancel_and_capacity_increase(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer, seats=2)
+    holder, first, second, third = signup(), signup(), signup(), signup()
+    assert client.post(f"/events/register/{event_id}", headers=holder, params={"seats": 2}).status_code == 200
+
+    assert join(client, event_id, first)["position"] == 1
+    assert join(client, event_id, second, seats=2)["position"] == 2
+    assert join(client, event_id, third)["position"] == 3
+    assert join(client, event_id, third)["position"] == 3  # joining again only reports the position
+
+    # two seats come back: the first in line gets one, the second wants two
+    # and waits, and so does everyone behind them
+    assert client.delete(f"/events/cancel/{event_id}", headers=holder).status_code == 200
+    assert state(client, event_id, first) == ("registered", None)
+    assert state(client, event_id, second) == ("waiting", 1)
+    assert state(client, event_id, third) == ("waiting", 2)
+    assert client.get(f"/events/{event_id}").json()["seats_available"] == 1
+
+    r = client.put(f"/events/update/{event_id}", headers=organizer, json={"total_seats": 4})
+    assert r.status_code == 200, r.text
+    assert state(client, event_id, second) == ("registered", None)
+    assert state(client, event_id, third) == ("registered", None)
+    assert client.get(f"/events/{event_id}").json()["seats_available"] == 0
+    participants = client.get(f"/events/registrations/{event_id}", headers=organizer).json()
+    assert sorted(p["seats_booked"] for p in participants) == [1, 1, 2]
+
+
+def test_joining_with_free_seats_books_at_once(client, signup, create_event):
+    event_id = create_event(signup("organizer"), seats=2)
+    participant = signup()
+    assert join(client, event_id, participant)["status"] == "registered"
+
+    r = client.post(f"/events/{event_id}/waitlist", headers=participant)
+    assert r.status_code == 409
+
+
+def test_leaving_the_waitlist(client, signup, create_event):
+    organizer = signup("organizer")
+    event_id = create_event(organizer, seats=1)
+    assert client.post(f"/events/register/{event_id}", headers=signup()).status_code == 200
+    leaving, staying = signup(), signup()
+    join(client, event_id, leaving)
+    join(client, event_id, staying)
+
+    assert client.delete(f"/events/{event_id}/waitlist", headers=leaving).status_code == 200
+    assert state(client, event_id, staying) == ("waiting", 1)
+    assert client.delete(f"/events/{event_id}/waitlist", headers=leaving).status_code == 404